@@ -0,0 +1,162 @@
+"""
+Content-Hash OCR Result Cache
+
+Stores Tesseract output on disk keyed by a hash of the rendered page image
+together with the DPI, language and Tesseract configuration. Re-running a
+batch, or OCRing a page that appears unchanged in several statements (such
+as a terms and conditions page), returns the stored text instead of running
+Tesseract again. The cache is bounded in size; least recently used entries
+are evicted first.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+# Default cache location, shared by all runs of the extractor
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdf_expense_extractor', 'ocr')
+
+# Default size bound of the cache directory
+DEFAULT_MAX_CACHE_MB = 256
+
+# Bump when the cached text format changes so old entries are ignored
+CACHE_VERSION = 1
+
+
+class OCRCache:
+    """
+    Disk cache of OCR text keyed by page image content.
+    
+    Entries are plain text files written atomically, so several OCR worker
+    processes can share one cache directory. A hit refreshes the entry's
+    modification time, which evict() uses as its recency order.
+    """
+    
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_mb: float = DEFAULT_MAX_CACHE_MB):
+        """
+        Initialize the OCR cache.
+        
+        Args:
+            cache_dir (str): Directory holding cached OCR text
+            max_mb (float): Size bound of the cache directory in megabytes
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(image, dpi: int, lang: str, config: str = '') -> str:
+        """
+        Build the cache key of a rendered page.
+        
+        Args:
+            image: PIL image of the rendered page
+            dpi (int): Resolution the page was rendered at
+            lang (str): Tesseract language
+            config (str): Extra Tesseract options
+        
+        Returns:
+            str: Hex digest identifying the page content and OCR settings
+        """
+        digest = hashlib.sha256()
+        digest.update(f"v{CACHE_VERSION}|{dpi}|{lang}|{config}|{image.mode}|{image.size}|".encode('utf-8'))
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        """Get the file holding an entry, sharded by the first two hex digits."""
+        return self.cache_dir / key[:2] / f"{key}.txt"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached OCR text.
+        
+        Args:
+            key (str): Cache key from make_key()
+        
+        Returns:
+            Optional[str]: Cached text, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding='utf-8')
+        except OSError:
+            self.misses += 1
+            return None
+        
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        
+        self.hits += 1
+        return text
+    
+    def put(self, key: str, text: str) -> None:
+        """
+        Store OCR text.
+        
+        Args:
+            key (str): Cache key from make_key()
+            text (str): OCR text of the page
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            # A full or read-only cache location should never break OCR
+            pass
+    
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits its size bound.
+        
+        Returns:
+            int: Number of entries removed
+        """
+        entries = []
+        total_bytes = 0
+        
+        for path in self.cache_dir.glob('*/*.txt'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_bytes += stat.st_size
+        
+        if total_bytes <= self.max_bytes:
+            return 0
+        
+        removed = 0
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_bytes -= size
+            removed += 1
+            if total_bytes <= self.max_bytes:
+                break
+        
+        return removed
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        for path in self.cache_dir.glob('*/*.txt'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,256 @@
+"""
+Parallel, Streaming OCR Pipeline
+
+Renders PDF pages a small chunk at a time and OCRs them in a pool of
+Tesseract worker processes. Each worker renders its own chunk with
+pdf2image's first_page/last_page, so page images never cross process
+boundaries and at most a bounded number of chunks are in memory at once.
+Page text is yielded in page order as soon as it is available. With an
+OCRCache, pages whose rendered image was OCR'd before skip Tesseract.
+"""
+
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from pdf2image import convert_from_path, pdfinfo_from_path
+import pytesseract
+
+from ocr_cache import OCRCache
+
+
+# Pages rendered and OCR'd per worker task
+DEFAULT_CHUNK_SIZE = 2
+
+# Rendering resolution; pdf2image's default of 200 DPI suits Tesseract
+DEFAULT_DPI = 200
+
+# Chunks queued per worker beyond the one it is processing
+QUEUE_DEPTH_PER_WORKER = 1
+
+# OCR cache of the current process, set by _init_worker
+_worker_cache: Optional[OCRCache] = None
+
+
+def _init_worker(tesseract_cmd: Optional[str], cache: Optional[OCRCache] = None) -> None:
+    """
+    Configure Tesseract and the OCR cache in a freshly started worker process.
+
+    Args:
+        tesseract_cmd (Optional[str]): Path to the Tesseract executable
+        cache (Optional[OCRCache]): OCR cache shared through its directory
+    """
+    global _worker_cache
+
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    _worker_cache = cache
+
+
+def _ocr_chunk(pdf_path: str, first_page: int, last_page: int, dpi: int,
+               poppler_path: Optional[str], lang: str, config: str = '') -> List[Tuple[int, str, bool]]:
+    """
+    Render a range of pages and OCR each of them.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        first_page (int): First page to render (1-based)
+        last_page (int): Last page to render (inclusive)
+        dpi (int): Rendering resolution
+        poppler_path (Optional[str]): Directory of the Poppler utilities
+        lang (str): Tesseract language
+        config (str): Extra Tesseract options
+
+    Returns:
+        List[Tuple[int, str, bool]]: (page number, text, served from cache)
+            for each page of the range
+    """
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=first_page,
+                               last_page=last_page, poppler_path=poppler_path)
+
+    results = []
+    for offset, image in enumerate(images):
+        key = text = None
+        if _worker_cache is not None:
+            key = _worker_cache.make_key(image, dpi, lang, config)
+            text = _worker_cache.get(key)
+
+        cached = text is not None
+        if not cached:
+            text = pytesseract.image_to_string(image, lang=lang, config=config)
+            if key is not None:
+                _worker_cache.put(key, text)
+
+        results.append((first_page + offset, text, cached))
+        image.close()
+
+    return results
+
+
+def _missing_pages(first_page: int, last_page: int,
+                   results: List[Tuple[int, str, bool]]) -> List[int]:
+    """
+    Find the pages of a chunk that Poppler did not render, warning about them.
+
+    pdfinfo can report more pages than Poppler manages to render, for
+    example for a damaged PDF. The missing pages are skipped rather than
+    silently ending the document at the first gap.
+
+    Args:
+        first_page (int): First page of the chunk
+        last_page (int): Last page of the chunk
+        results (List[Tuple[int, str, bool]]): Pages returned by _ocr_chunk
+
+    Returns:
+        List[int]: Page numbers of the chunk without OCR text
+    """
+    returned = {page_num for page_num, _, _ in results}
+    missing = [page_num for page_num in range(first_page, last_page + 1) if page_num not in returned]
+    if missing:
+        warnings.warn(f"Poppler rendered {len(returned)} of pages {first_page}-{last_page}; "
+                      f"skipping page(s) {', '.join(map(str, missing))}", RuntimeWarning)
+    return missing
+
+
+class OCRPipeline:
+    """
+    OCRs a PDF with a process pool while keeping memory bounded.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 dpi: int = DEFAULT_DPI, poppler_path: Optional[str] = None,
+                 tesseract_cmd: Optional[str] = None, lang: str = 'eng', config: str = '',
+                 cache: Optional[OCRCache] = None):
+        """
+        Initialize the OCR pipeline.
+        
+        Args:
+            max_workers (Optional[int]): Tesseract worker processes, defaults to the CPU count
+            chunk_size (int): Pages rendered per worker task
+            dpi (int): Rendering resolution
+            poppler_path (Optional[str]): Directory of the Poppler utilities
+            tesseract_cmd (Optional[str]): Path to the Tesseract executable
+            lang (str): Tesseract language
+            config (str): Extra Tesseract options, such as '--psm 6'
+            cache (Optional[OCRCache]): OCR result cache, or None to always run Tesseract
+        """
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.dpi = dpi
+        self.poppler_path = poppler_path
+        self.tesseract_cmd = tesseract_cmd
+        self.lang = lang
+        self.config = config
+        self.cache = cache
+        self.cached_pages = 0
+    
+    def get_page_count(self, pdf_path: str) -> int:
+        """
+        Get the number of pages without rendering any of them.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+        
+        Returns:
+            int: Number of pages
+        """
+        info = pdfinfo_from_path(pdf_path, poppler_path=self.poppler_path)
+        return int(info["Pages"])
+    
+    def iter_page_texts(self, pdf_path: str,
+                        progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        OCR a PDF and yield page text in page order.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            progress (Optional[Callable[[int, int], None]]): Called with
+                (page number, page count) as each page is yielded
+        
+        Yields:
+            Tuple[int, str]: (page number, OCR text)
+        """
+        self.cached_pages = 0
+        page_count = self.get_page_count(pdf_path)
+        chunks = [(first, min(first + self.chunk_size - 1, page_count))
+                  for first in range(1, page_count + 1, self.chunk_size)]
+        
+        if self.max_workers == 1 or len(chunks) == 1:
+            _init_worker(self.tesseract_cmd, self.cache)
+            for first, last in chunks:
+                results = _ocr_chunk(pdf_path, first, last, self.dpi, self.poppler_path,
+                                     self.lang, self.config)
+                _missing_pages(first, last, results)
+                for page_num, text, cached in results:
+                    self.cached_pages += cached
+                    if progress:
+                        progress(page_num, page_count)
+                    yield page_num, text
+            self._evict_cache()
+            return
+        
+        workers = min(self.max_workers, len(chunks))
+        max_in_flight = workers * (1 + QUEUE_DEPTH_PER_WORKER)
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.tesseract_cmd, self.cache)) as executor:
+            pending = {}
+            finished: Dict[int, Optional[str]] = {}
+            next_chunk = 0
+            next_page = 1
+            
+            try:
+                while next_page <= page_count:
+                    # Keep the pool busy without queueing the whole document
+                    while next_chunk < len(chunks) and len(pending) < max_in_flight:
+                        first, last = chunks[next_chunk]
+                        future = executor.submit(_ocr_chunk, pdf_path, first, last, self.dpi,
+                                                 self.poppler_path, self.lang, self.config)
+                        pending[future] = (first, last)
+                        next_chunk += 1
+                    
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        first, last = pending.pop(future)
+                        results = future.result()
+                        for page_num, text, cached in results:
+                            finished[page_num] = text
+                            self.cached_pages += cached
+                        # Missing pages are released as gaps so later pages still come through
+                        for page_num in _missing_pages(first, last, results):
+                            finished[page_num] = None
+                    
+                    # Release every page that is now contiguous with what was yielded
+                    while next_page in finished:
+                        text = finished.pop(next_page)
+                        if text is not None:
+                            if progress:
+                                progress(next_page, page_count)
+                            yield next_page, text
+                        next_page += 1
+            finally:
+                for future in pending:
+                    future.cancel()
+        
+        self._evict_cache()
+    
+    def _evict_cache(self) -> None:
+        """Trim the OCR cache to its size bound once a document is done."""
+        if self.cache is not None:
+            self.cache.evict()
+    
+    def extract_text(self, pdf_path: str,
+                     progress: Optional[Callable[[int, int], None]] = None) -> str:
+        """
+        OCR a PDF into a single string, one page after another.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            progress (Optional[Callable[[int, int], None]]): Called with
+                (page number, page count) as each page completes
+        
+        Returns:
+            str: Extracted text from all pages
+        """
+        return "".join(text + "\n" for _, text in self.iter_page_texts(pdf_path, progress))
@@ -25,7 +25,6 @@ PDF_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'Test PDFs',
 # =============================================================================
 
 try:
-    from pdf2image import convert_from_path
     import pytesseract
     from tabulate import tabulate
     
@@ -34,6 +33,8 @@ try:
     import os
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
     from dependency_config import TESSERACT_CMD, POPPLER_PATH
+    from ocr_pipeline import OCRPipeline
+    from ocr_cache import OCRCache, DEFAULT_CACHE_DIR, DEFAULT_MAX_CACHE_MB
     
     # Configure Tesseract path
     pytesseract.pytesseract.tesseract_cmd = TESSERACT_CMD
@@ -51,19 +52,39 @@ class ExpenseExtractor:
     Main class for extracting expense data from PDF credit card statements.
     """
     
-    def __init__(self):
-        """Initialize the expense extractor."""
+    def __init__(self, ocr_workers: Optional[int] = None, ocr_chunk_size: int = 2,
+                 ocr_cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 ocr_cache_max_mb: float = DEFAULT_MAX_CACHE_MB):
+        """
+        Initialize the expense extractor.
+        
+        Args:
+            ocr_workers (Optional[int]): Tesseract worker processes, defaults to the CPU count
+            ocr_chunk_size (int): Pages rendered per OCR task
+            ocr_cache_dir (Optional[str]): Directory of the OCR result cache, or None to disable it
+            ocr_cache_max_mb (float): Size bound of the OCR result cache in megabytes
+        """
         self.expenses = []
+        self.ocr_pipeline = OCRPipeline(
+            max_workers=ocr_workers,
+            chunk_size=ocr_chunk_size,
+            poppler_path=POPPLER_PATH,
+            tesseract_cmd=TESSERACT_CMD,
+            cache=OCRCache(ocr_cache_dir, ocr_cache_max_mb) if ocr_cache_dir else None
+        )
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
-        Convert PDF to images and extract text using OCR.
+        Render PDF pages in small chunks and extract text using parallel OCR.
+        
+        Pages are rendered inside the OCR worker processes, so only the
+        chunks currently being processed are held in memory.
         
         Args:
             pdf_path (str): Path to the PDF file
             
         Returns:
-            str: Extracted text from all pages
+            str: Extracted text from all pages, in page order
             
         Raises:
             FileNotFoundError: If PDF file doesn't exist
@@ -73,18 +94,15 @@ class ExpenseExtractor:
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
         try:
-            print(f"Converting PDF to images: {pdf_path}")
-            # Convert PDF pages to images using configured Poppler path
-            images = convert_from_path(pdf_path, poppler_path=POPPLER_PATH)
+            print(f"Running OCR on {pdf_path} with up to {self.ocr_pipeline.max_workers} worker(s)...")
+            
+            def report(page_num: int, page_count: int) -> None:
+                print(f"  Processed page {page_num}/{page_count}")
             
-            extracted_text = ""
-            print(f"Processing {len(images)} page(s) with OCR...")
+            extracted_text = self.ocr_pipeline.extract_text(pdf_path, progress=report)
             
-            # Extract text from each page using OCR
-            for i, image in enumerate(images, 1):
-                print(f"  Processing page {i}/{len(images)}")
-                page_text = pytesseract.image_to_string(image, lang='eng')
-                extracted_text += page_text + "\n"
+            if self.ocr_pipeline.cached_pages:
+                print(f"  {self.ocr_pipeline.cached_pages} page(s) served from the OCR cache")
             
             return extracted_text
             
@@ -56,6 +56,10 @@ class BatchPDFTester:
         self.test_results = {}
         self.start_time = datetime.now()
         
+        # Rollups maintained incrementally as results are recorded
+        self.card_type_rollup = {}
+        self.month_rollup = {}
+        
         # Define expected PDF files to test
         self.target_files = [
             "MC - FEB-2025.pdf",
@@ -205,13 +209,59 @@ class BatchPDFTester:
             
             if file_path.exists():
                 result = self.test_single_pdf(file_path)
-                self.test_results[file_name] = result
+                self.record_result(file_name, result)
             else:
                 print(f"\n⏭️  Skipping missing file: {file_name}")
         
         # Generate comprehensive report
         self.generate_test_report()
     
+    def record_result(self, file_name: str, result: Dict) -> None:
+        """
+        Record a test result and update the card type / month rollups.
+        
+        Re-recording a file (e.g. a re-processed statement) applies only the
+        old/new delta, so the analysis reports never rescan all results.
+        
+        Args:
+            file_name (str): Name of the tested PDF file
+            result (Dict): Test result for the file
+        """
+        previous = self.test_results.get(file_name)
+        if previous is not None:
+            self._apply_to_rollups(previous, -1)
+        
+        self.test_results[file_name] = result
+        self._apply_to_rollups(result, 1)
+    
+    def _apply_to_rollups(self, result: Dict, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) a result's contribution to the rollups.
+        
+        Args:
+            result (Dict): Test result for a file
+            sign (int): 1 to add the contribution, -1 to remove it
+        """
+        for rollup, key in ((self.card_type_rollup, result["card_type"]),
+                            (self.month_rollup, result["month"])):
+            entry = rollup.setdefault(key, {
+                "files": 0,
+                "successful": 0,
+                "total_expenses": 0,
+                "successful_expenses": 0,
+                "total_processing_time": 0.0
+            })
+            
+            entry["files"] += sign
+            entry["total_expenses"] += sign * result["expenses_found"]
+            entry["total_processing_time"] += sign * result["processing_time_seconds"]
+            if result["success"]:
+                entry["successful"] += sign
+                entry["successful_expenses"] += sign * result["expenses_found"]
+            
+            if entry["files"] == 0:
+                del rollup[key]
+    
     def generate_test_report(self) -> None:
         """
         Generate a comprehensive test report with analysis and comparisons.
@@ -270,38 +320,39 @@ class BatchPDFTester:
         print(f"\n🏦 ANALYSIS BY CARD TYPE")
         print("-" * 80)
         
-        mc_results = {k: v for k, v in self.test_results.items() if v["card_type"] == "MC"}
-        vs_results = {k: v for k, v in self.test_results.items() if v["card_type"] == "VS"}
+        empty = {"files": 0, "successful": 0, "total_expenses": 0, "total_processing_time": 0.0}
+        mc_results = self.card_type_rollup.get("MC", empty)
+        vs_results = self.card_type_rollup.get("VS", empty)
         
         # MC Analysis
-        mc_successful = sum(1 for r in mc_results.values() if r["success"])
-        mc_total_expenses = sum(r["expenses_found"] for r in mc_results.values())
-        mc_avg_processing_time = (sum(r["processing_time_seconds"] for r in mc_results.values()) / 
-                                 len(mc_results)) if mc_results else 0
+        mc_successful = mc_results["successful"]
+        mc_total_expenses = mc_results["total_expenses"]
+        mc_avg_processing_time = (mc_results["total_processing_time"] / 
+                                 mc_results["files"]) if mc_results["files"] else 0
         
         print(f"💳 MC (MasterCard) Results:")
-        print(f"   Files tested: {len(mc_results)}")
-        print(f"   Successful: {mc_successful}/{len(mc_results)}")
+        print(f"   Files tested: {mc_results['files']}")
+        print(f"   Successful: {mc_successful}/{mc_results['files']}")
         print(f"   Total expenses extracted: {mc_total_expenses}")
         print(f"   Average processing time: {mc_avg_processing_time:.2f}s")
         
         # VS Analysis
-        vs_successful = sum(1 for r in vs_results.values() if r["success"])
-        vs_total_expenses = sum(r["expenses_found"] for r in vs_results.values())
-        vs_avg_processing_time = (sum(r["processing_time_seconds"] for r in vs_results.values()) / 
-                                 len(vs_results)) if vs_results else 0
+        vs_successful = vs_results["successful"]
+        vs_total_expenses = vs_results["total_expenses"]
+        vs_avg_processing_time = (vs_results["total_processing_time"] / 
+                                 vs_results["files"]) if vs_results["files"] else 0
         
         print(f"\n💳 VS (Visa) Results:")
-        print(f"   Files tested: {len(vs_results)}")
-        print(f"   Successful: {vs_successful}/{len(vs_results)}")
+        print(f"   Files tested: {vs_results['files']}")
+        print(f"   Successful: {vs_successful}/{vs_results['files']}")
         print(f"   Total expenses extracted: {vs_total_expenses}")
         print(f"   Average processing time: {vs_avg_processing_time:.2f}s")
         
         # Comparison
         print(f"\n📊 CARD TYPE COMPARISON:")
-        if mc_results and vs_results:
-            mc_success_rate = (mc_successful / len(mc_results)) * 100
-            vs_success_rate = (vs_successful / len(vs_results)) * 100
+        if mc_results["files"] and vs_results["files"]:
+            mc_success_rate = (mc_successful / mc_results["files"]) * 100
+            vs_success_rate = (vs_successful / vs_results["files"]) * 100
             
             print(f"   MC success rate: {mc_success_rate:.1f}%")
             print(f"   VS success rate: {vs_success_rate:.1f}%")
@@ -320,23 +371,12 @@ class BatchPDFTester:
         print(f"\n📅 ANALYSIS BY MONTH")
         print("-" * 80)
         
-        months = {}
-        for result in self.test_results.values():
-            month = result["month"]
-            if month not in months:
-                months[month] = {"files": 0, "successful": 0, "total_expenses": 0}
-            
-            months[month]["files"] += 1
-            if result["success"]:
-                months[month]["successful"] += 1
-                months[month]["total_expenses"] += result["expenses_found"]
-        
-        for month, data in months.items():
+        for month, data in self.month_rollup.items():
             success_rate = (data["successful"] / data["files"]) * 100
             print(f"📅 {month}:")
             print(f"   Files: {data['files']}")
             print(f"   Success rate: {success_rate:.1f}%")
-            print(f"   Total expenses: {data['total_expenses']}")
+            print(f"   Total expenses: {data['successful_expenses']}")
     
     def save_detailed_results(self) -> None:
         """
@@ -3,7 +3,7 @@ Application settings and configuration.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
 @dataclass
@@ -16,6 +16,10 @@ class Settings:
     # PDF processing settings
     pdf_libraries: List[str] = None
     max_retries: int = 3
+    race_backends: bool = False  # Evaluate PDF libraries concurrently
+    race_deadline_seconds: float = 30.0
+    evaluation_sample_pages: int = 2  # Pages PDF libraries are scored on, 0 for whole document
+    backend_store_path: Optional[str] = None  # JSON file of learned PDF library choices, None disables
     
     # Output settings
     table_width: int = 80
@@ -47,6 +51,10 @@ class Settings:
             'amount_tolerance': self.amount_tolerance,
             'pdf_libraries': self.pdf_libraries,
             'max_retries': self.max_retries,
+            'race_backends': self.race_backends,
+            'race_deadline_seconds': self.race_deadline_seconds,
+            'evaluation_sample_pages': self.evaluation_sample_pages,
+            'backend_store_path': self.backend_store_path,
             'table_width': self.table_width,
             'show_progress': self.show_progress,
             'verbose': self.verbose,
@@ -25,7 +25,12 @@ class ExpenseExtractorCLI:
             settings: Application settings
         """
         self.settings = settings or Settings.default()
-        self.parser_factory = PDFParserFactory()
+        self.parser_factory = PDFParserFactory(
+            race_backends=self.settings.race_backends,
+            race_deadline=self.settings.race_deadline_seconds,
+            backend_store_path=Path(self.settings.backend_store_path) if self.settings.backend_store_path else None,
+            sample_pages=self.settings.evaluation_sample_pages
+        )
         self.pattern_detector = TransactionPatternDetector()
         self.validator = TransactionValidator(self.settings.amount_tolerance)
         self.formatter = CLITableFormatter(self.settings.table_width)
@@ -176,8 +181,8 @@ class ExpenseExtractorCLI:
         Returns:
             List of extracted transactions
         """
-        # Get the best parser for this PDF
-        parser = self.parser_factory.get_best_parser(pdf_file)
+        # Get the best parser for this PDF (and the text it extracted while scoring)
+        parser, text = self.parser_factory.get_best_parser_with_text(pdf_file)
         
         if not parser:
             raise RuntimeError("No suitable PDF parser available")
@@ -185,11 +190,12 @@ class ExpenseExtractorCLI:
         if self.settings.verbose:
             self.formatter.display_info(f"Using {parser.library_name} parser")
         
-        # Extract text from PDF
-        try:
-            text = parser.extract_text(pdf_file)
-        except Exception as e:
-            raise RuntimeError(f"Failed to extract text: {e}")
+        # Extract text from PDF unless evaluation already did
+        if text is None:
+            try:
+                text = parser.extract_text(pdf_file)
+            except Exception as e:
+                raise RuntimeError(f"Failed to extract text: {e}")
         
         if not text:
             raise RuntimeError("No text extracted from PDF")
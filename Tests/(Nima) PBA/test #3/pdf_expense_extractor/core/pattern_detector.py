@@ -12,6 +12,37 @@ from ..utils.date_parser import parse_date, extract_date_from_line
 from ..utils.amount_parser import parse_amount, extract_amounts_from_line
 
 
+class LinePositionIndex:
+    """Maps each stripped line of a document to the positions where it occurs."""
+    
+    def __init__(self, lines: List[str]):
+        """
+        Build the index in a single pass over the lines.
+        
+        Args:
+            lines: List of text lines
+        """
+        self.positions: Dict[str, List[int]] = {}
+        for i, line in enumerate(lines):
+            self.positions.setdefault(line.strip(), []).append(i)
+        
+        # First description-like line of the document, resolved on first use
+        self.fallback_description: Optional[str] = None
+        self.fallback_resolved = False
+    
+    def find(self, line: str) -> List[int]:
+        """
+        Get the positions of a line, in document order.
+        
+        Args:
+            line: Stripped line text
+            
+        Returns:
+            List of line indices (empty if the line does not occur)
+        """
+        return self.positions.get(line, [])
+
+
 class TransactionPatternDetector:
     """Detects and parses transaction patterns from PDF text."""
     
@@ -124,17 +155,20 @@ class TransactionPatternDetector:
         # First, try to parse using multi-line patterns on the full text
         full_text = '\n'.join(lines)
         
+        # Built once so description lookups do not rescan the document per match
+        line_index = LinePositionIndex(lines)
+        
+        # Create a mock match object for _extract_transaction_data
+        class MockMatch:
+            def __init__(self, groups):
+                self._groups = groups
+            def groups(self):
+                return self._groups
+        
         for pattern_idx, pattern in enumerate(self.transaction_patterns):
             matches = pattern.findall(full_text)
             
             for match_idx, match in enumerate(matches):
-                # Create a mock match object for _extract_transaction_data
-                class MockMatch:
-                    def __init__(self, groups):
-                        self._groups = groups
-                    def groups(self):
-                        return self._groups
-                
                 mock_match = MockMatch(match)
                 transaction_data = self._extract_transaction_data(mock_match, str(match))
                 
@@ -144,7 +178,7 @@ class TransactionPatternDetector:
                     
                     # If no description in extracted data, look for it in the text
                     if not description:
-                        description = self._find_description_for_match(lines, match)
+                        description = self._find_description_for_match(lines, match, line_index)
                     
                     # Use a default description if none found
                     if not description:
@@ -482,17 +516,22 @@ class TransactionPatternDetector:
         
         return None
     
-    def _find_description_for_match(self, lines: List[str], match: tuple) -> Optional[str]:
+    def _find_description_for_match(self, lines: List[str], match: tuple,
+                                    line_index: Optional[LinePositionIndex] = None) -> Optional[str]:
         """
         Find transaction description for a specific match.
         
         Args:
             lines: List of text lines
             match: The regex match tuple
+            line_index: Position index of lines (built here if not given)
             
         Returns:
             Cleaned description or None
         """
+        if line_index is None:
+            line_index = LinePositionIndex(lines)
+        
         # For multi-line structure, find the description that follows the transaction data
         # The match contains (transaction_id, day, month, year, amount) or (day, month, year, amount)
         
@@ -507,15 +546,13 @@ class TransactionPatternDetector:
                 day, month, year = str(match[0]), str(match[1]), str(match[2])
                 search_components = [day, month, year]
             
-            # Find the transaction block in the lines
+            # Find the transaction block: only lines equal to the first component can start it
             transaction_start_idx = None
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if line == search_components[0]:  # Found the first component
-                    # Check if the following lines match the pattern
-                    if self._matches_transaction_sequence(lines, i, search_components):
-                        transaction_start_idx = i
-                        break
+            for i in line_index.find(search_components[0]):
+                # Check if the following lines match the pattern
+                if self._matches_transaction_sequence(lines, i, search_components):
+                    transaction_start_idx = i
+                    break
             
             if transaction_start_idx is not None:
                 # Look for description after the transaction block
@@ -527,12 +564,11 @@ class TransactionPatternDetector:
                     if self._is_description_line(potential_description):
                         return clean_description(potential_description)
         
-        # Fallback: look for description lines that contain text but not numbers/amounts
-        for line in lines:
-            line = line.strip()
-            if self._is_description_line(line):
-                return clean_description(line)
-        return None
+        # Fallback: the first line that contains text but not numbers/amounts (same for every match)
+        if not line_index.fallback_resolved:
+            line_index.fallback_description = self._find_description_in_block(lines)
+            line_index.fallback_resolved = True
+        return line_index.fallback_description
     
     def _matches_transaction_sequence(self, lines: List[str], start_idx: int, search_components: List[str]) -> bool:
         """
@@ -68,6 +68,36 @@ Examples:
         help='Process a single PDF file'
     )
     
+    parser.add_argument(
+        '--race',
+        action='store_true',
+        help='Run the PDF libraries concurrently and keep the first usable result'
+    )
+    
+    parser.add_argument(
+        '--race-deadline',
+        type=float,
+        default=30.0,
+        metavar='SECONDS',
+        help='Seconds to wait for racing PDF libraries (default: 30)'
+    )
+    
+    parser.add_argument(
+        '--sample-pages',
+        type=int,
+        default=Settings.evaluation_sample_pages,
+        metavar='N',
+        help='Score PDF libraries on N sample pages, 0 for the whole document (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--backend-store',
+        type=str,
+        metavar='JSON_FILE',
+        help='Remember the best PDF library per statement layout in JSON_FILE and reuse it '
+             '(default: evaluate the libraries for every file)'
+    )
+    
     parser.add_argument(
         '--report',
         action='store_true',
@@ -94,7 +124,11 @@ def main():
             amount_tolerance=args.tolerance,
             verbose=args.verbose,
             show_progress=not args.no_progress,
-            pdf_directory=args.dir or "../Test PDFs/base_6"
+            pdf_directory=args.dir or "../Test PDFs/base_6",
+            race_backends=args.race,
+            race_deadline_seconds=args.race_deadline,
+            backend_store_path=args.backend_store,
+            evaluation_sample_pages=args.sample_pages
         )
         
         # Create CLI interface
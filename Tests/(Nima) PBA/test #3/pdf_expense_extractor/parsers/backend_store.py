@@ -0,0 +1,159 @@
+"""
+Persistent store of the best PDF library per statement layout.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from typing import Optional, Dict, Any
+from pathlib import Path
+
+
+class BackendSelectionStore:
+    """
+    Remembers which PDF library scored best for each statement layout.
+    
+    Entries are keyed by a layout fingerprint derived from the first page
+    of a statement, so next month's statement from the same issuer reuses
+    the library chosen for this month's one. The store is a small JSON file
+    that is rewritten atomically on every update.
+    """
+    
+    # Number of leading non-empty first-page lines that identify a layout
+    FINGERPRINT_LINES = 8
+    
+    def __init__(self, store_path: Path):
+        """
+        Initialize the store.
+        
+        Args:
+            store_path: JSON file holding the learned selections
+        """
+        self.store_path = Path(store_path).expanduser()
+        self._entries = self._load()
+    
+    def _load(self) -> Dict[str, dict]:
+        """Load stored selections, starting empty if the file is missing or unreadable."""
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save(self):
+        """Write all selections to disk atomically."""
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(self.store_path.parent), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.store_path)
+        except OSError:
+            # A read-only cache location should never break extraction
+            pass
+    
+    @classmethod
+    def fingerprint(cls, first_page_text: Optional[str]) -> Optional[str]:
+        """
+        Derive a layout fingerprint from the first page of a statement.
+        
+        Digits are masked so amounts, dates and card numbers do not change
+        the fingerprint from one month to the next.
+        
+        Args:
+            first_page_text: Text of the first page
+        
+        Returns:
+            Hex fingerprint or None if the page has no text
+        """
+        if not first_page_text:
+            return None
+        
+        lines = []
+        for line in first_page_text.splitlines():
+            normalized = re.sub(r'\s+', ' ', re.sub(r'\d', '#', line.upper())).strip()
+            if normalized:
+                lines.append(normalized)
+            if len(lines) >= cls.FINGERPRINT_LINES:
+                break
+        
+        if not lines:
+            return None
+        
+        return hashlib.sha1('\n'.join(lines).encode('utf-8')).hexdigest()[:16]
+    
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored selection for a layout.
+        
+        Args:
+            fingerprint: Layout fingerprint
+        
+        Returns:
+            Entry with library, score, elapsed and uses, or None if unknown
+        """
+        return self._entries.get(fingerprint)
+    
+    def record(self, fingerprint: str, library_name: str, score: Optional[float], elapsed: float):
+        """
+        Record the library chosen by a full evaluation of a layout.
+        
+        Args:
+            fingerprint: Layout fingerprint
+            library_name: Winning PDF library
+            score: Full-document score of the winning text, or None to take
+                the baseline from the first reuse
+            elapsed: Extraction time of the winning library in seconds
+        """
+        self._entries[fingerprint] = {
+            'library': library_name,
+            'score': score,
+            'elapsed': elapsed,
+            'uses': 0,
+            'updated': datetime.now().isoformat(timespec='seconds')
+        }
+        self._save()
+    
+    def record_use(self, fingerprint: str, score: float, elapsed: float):
+        """
+        Record a reuse of a stored selection.
+        
+        The stored score is kept as the quality baseline (set here if the
+        evaluation did not provide one); otherwise only the usage count and
+        a running average of the extraction time are updated.
+        
+        Args:
+            fingerprint: Layout fingerprint
+            score: Score of the text extracted with the stored library
+            elapsed: Extraction time in seconds
+        """
+        entry = self._entries.get(fingerprint)
+        if not entry:
+            return
+        
+        if entry.get('score') is None:
+            entry['score'] = score
+        
+        entry['uses'] = entry.get('uses', 0) + 1
+        entry['elapsed'] = entry.get('elapsed', elapsed) + (elapsed - entry.get('elapsed', elapsed)) / (entry['uses'] + 1)
+        entry['last_score'] = score
+        entry['updated'] = datetime.now().isoformat(timespec='seconds')
+        self._save()
+    
+    def forget(self, fingerprint: str):
+        """
+        Remove the stored selection for a layout.
+        
+        Args:
+            fingerprint: Layout fingerprint
+        """
+        if self._entries.pop(fingerprint, None) is not None:
+            self._save()
+    
+    def __len__(self) -> int:
+        """Get the number of known layouts."""
+        return len(self._entries)
@@ -68,6 +68,26 @@ class BaseParser(ABC):
         """
         pass
     
+    def extract_pages(self, pdf_path: Path, page_numbers: List[int]) -> Optional[List[str]]:
+        """
+        Extract text from selected pages only.
+        
+        Parsers override this to avoid processing the remaining pages; the
+        default falls back to extracting every page.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_numbers: Zero-based page indices; indices past the end are skipped
+            
+        Returns:
+            List of text strings (one per existing requested page) or None if extraction fails
+        """
+        pages_text = self.extract_text_by_page(pdf_path)
+        if pages_text is None:
+            return None
+        
+        return [pages_text[i] for i in page_numbers if 0 <= i < len(pages_text)]
+    
     def test_extraction(self, pdf_path: Path) -> bool:
         """
         Test if parser can successfully extract text from a PDF.
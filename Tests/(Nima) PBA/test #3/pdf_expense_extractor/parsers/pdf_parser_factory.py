@@ -2,32 +2,81 @@
 PDF parser factory for selecting and managing PDF libraries.
 """
 
-from typing import Optional, List, Dict
+import multiprocessing
+import queue
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Tuple
 from pathlib import Path
 from .base_parser import BaseParser, ParserError
+from .backend_store import BackendSelectionStore
 from .pdfplumber_parser import PDFPlumberParser
 from .pymupdf_parser import PyMuPDFParser
 from .pypdf2_parser import PyPDF2Parser
 
 
+PARSER_CLASSES = [
+    PDFPlumberParser,
+    PyMuPDFParser,
+    PyPDF2Parser
+]
+
+
+def _race_worker(parser_class, pdf_path: Path, results) -> None:
+    """
+    Extract text with one backend and report it to the racing parent process.
+    
+    Args:
+        parser_class: Parser class to instantiate in this worker
+        pdf_path: PDF file to extract
+        results: Queue receiving (library_name, text, error, elapsed)
+    """
+    start_time = time.perf_counter()
+    parser = parser_class()
+    
+    try:
+        text = parser.extract_text(pdf_path)
+        results.put((parser.library_name, text, None, time.perf_counter() - start_time))
+    except Exception as e:
+        results.put((parser.library_name, None, str(e), time.perf_counter() - start_time))
+
+
 class PDFParserFactory:
     """Factory for creating and managing PDF parsers."""
     
-    def __init__(self):
-        """Initialize the parser factory."""
+    # Number of winning extractions kept for reuse until they are consumed
+    MAX_CACHED_TEXTS = 8
+    
+    # Relative score drop below the stored baseline that triggers re-evaluation
+    QUALITY_DROP_TOLERANCE = 0.1
+    
+    # Pages searched for the transaction table when the leading sample has none
+    HEADER_SEARCH_PAGES = 6
+    
+    def __init__(self, race_backends: bool = False, race_deadline: float = 30.0,
+                 backend_store_path: Optional[Path] = None, sample_pages: int = 2):
+        """
+        Initialize the parser factory.
+        
+        Args:
+            race_backends: Evaluate backends concurrently and accept the first good result
+            race_deadline: Seconds to wait for racing backends before giving up on stragglers
+            backend_store_path: JSON file remembering the best backend per statement layout
+            sample_pages: Pages each backend is scored on (0 scores the whole document)
+        """
         self._parsers = {}
         self._evaluation_cache = {}
+        self._text_cache = OrderedDict()
+        self.race_backends = race_backends
+        self.race_deadline = race_deadline
+        self.last_race = None
+        self.backend_store = BackendSelectionStore(backend_store_path) if backend_store_path else None
+        self.sample_pages = sample_pages
         self._initialize_parsers()
     
     def _initialize_parsers(self):
         """Initialize all available parsers."""
-        parser_classes = [
-            PDFPlumberParser,
-            PyMuPDFParser,
-            PyPDF2Parser
-        ]
-        
-        for parser_class in parser_classes:
+        for parser_class in PARSER_CLASSES:
             try:
                 parser = parser_class()
                 self._parsers[parser.library_name] = parser
@@ -91,6 +140,20 @@ class PDFParserFactory:
             # Test parsers against the specific PDF
             return self._evaluate_parsers_for_pdf(pdf_path)
         
+        return self._preferred_parser()
+    
+    def _preferred_parser(self) -> Optional[BaseParser]:
+        """
+        Get the available parser highest in the static preference order.
+        
+        Returns:
+            Parser instance or None if none available
+        """
+        available = self.available_parsers
+        
+        if not available:
+            return None
+        
         # Return parsers in order of preference
         preference_order = ['pdfplumber', 'pymupdf', 'PyPDF2']
         
@@ -102,6 +165,23 @@ class PDFParserFactory:
         # Return first available parser if none match preferences
         return available[0]
     
+    def get_best_parser_with_text(self, pdf_path: Path) -> Tuple[Optional[BaseParser], Optional[str]]:
+        """
+        Get the best parser for a PDF together with the text it extracted while being scored.
+        
+        The memoized text is handed over (and dropped from the cache), so the
+        winning backend does not have to parse the document a second time.
+        
+        Args:
+            pdf_path: PDF file to select a parser for
+            
+        Returns:
+            Tuple of (parser, text); text is None if no evaluation text is cached
+        """
+        parser = self.get_best_parser(pdf_path)
+        text = self._text_cache.pop(str(pdf_path), None) if parser else None
+        return parser, text
+    
     def _evaluate_parsers_for_pdf(self, pdf_path: Path) -> Optional[BaseParser]:
         """
         Evaluate parsers against a specific PDF file.
@@ -118,23 +198,315 @@ class PDFParserFactory:
             parser_name = self._evaluation_cache[cache_key]
             return self._parsers.get(parser_name)
         
+        fingerprint = self._layout_fingerprint(pdf_path) if self.backend_store is not None else None
+        
+        if fingerprint:
+            stored_parser, stored_text = self._reuse_stored_backend(pdf_path, fingerprint)
+            if stored_parser:
+                self._evaluation_cache[cache_key] = stored_parser.library_name
+                self._remember_text(cache_key, stored_text)
+                return stored_parser
+        
+        best_parser = None
+        best_text = None
+        best_score = 0.0
+        best_elapsed = 0.0
+        
+        if self.race_backends and len(self.available_parsers) > 1:
+            best_parser, best_text, best_elapsed = self._race_parsers(pdf_path)
+            best_score = self._score_text(best_text)
+        
+        if not best_parser:
+            best_parser, best_text, best_score, best_elapsed = self._evaluate_sequentially(pdf_path)
+        
+        if best_parser:
+            self._evaluation_cache[cache_key] = best_parser.library_name
+            self._remember_text(cache_key, best_text)
+            
+            if fingerprint:
+                # A sampled score is not comparable to full-document scores, so the
+                # quality baseline is then taken from the first reuse instead
+                baseline = best_score if best_text is not None else None
+                self.backend_store.record(fingerprint, best_parser.library_name, baseline, best_elapsed)
+        
+        return best_parser
+    
+    def _evaluate_sequentially(self, pdf_path: Path) -> Tuple[Optional[BaseParser], Optional[str], float, float]:
+        """
+        Score every available backend in turn and keep the best one.
+        
+        When sampling is enabled, backends are scored on a few sample pages
+        only, so evaluation cost does not grow with the page count; the
+        winning text is then returned only if the sample covered the whole
+        document. The preferred parser's sample pages come from the probe
+        that chose them, so it does not extract them again.
+        
+        Args:
+            pdf_path: PDF file to test against
+            
+        Returns:
+            Tuple of (parser, full text or None, score, extraction seconds),
+            or (None, None, 0.0, 0.0) if all fail
+        """
+        sample, covers_document, probed_pages = None, True, None
+        probe_elapsed = 0.0
+        if self.sample_pages:
+            probe_start = time.perf_counter()
+            sample, covers_document, probed_pages = self._sample_page_numbers(pdf_path)
+            probe_elapsed = time.perf_counter() - probe_start
+        preferred = self._preferred_parser()
+        
         best_parser = None
         best_score = -1
+        best_text = None
+        best_elapsed = 0.0
         
         for parser in self.available_parsers:
             try:
-                score = self._evaluate_parser(parser, pdf_path)
+                start_time = time.perf_counter()
+                if sample is None:
+                    text = parser.extract_text(pdf_path)
+                    elapsed = time.perf_counter() - start_time
+                else:
+                    if parser is preferred and probed_pages is not None:
+                        # The sample was chosen with this parser, reuse its pages
+                        pages = probed_pages
+                        elapsed = probe_elapsed
+                    else:
+                        pages = parser.extract_pages(pdf_path, sample)
+                        elapsed = time.perf_counter() - start_time
+                    text = '\n'.join(page for page in pages if page) if pages else None
+                score = self._score_text(text)
                 if score > best_score:
                     best_score = score
                     best_parser = parser
+                    best_text = text
+                    best_elapsed = elapsed
             except Exception:
                 # Parser failed evaluation, skip it
                 continue
         
-        if best_parser:
-            self._evaluation_cache[cache_key] = best_parser.library_name
+        if not best_parser:
+            return None, None, 0.0, 0.0
         
-        return best_parser
+        return best_parser, best_text if covers_document else None, best_score, best_elapsed
+    
+    def _sample_page_numbers(self, pdf_path: Path) -> Tuple[Optional[List[int]], bool, Optional[List[str]]]:
+        """
+        Choose the pages backends are scored on.
+        
+        The leading pages are used when they already contain transactions;
+        otherwise the first page with a transaction table (within
+        HEADER_SEARCH_PAGES) is used instead, so cover pages and summaries
+        do not decide the backend. One page past the leading sample is
+        probed to tell whether the sample covers the whole document.
+        
+        Args:
+            pdf_path: PDF file to sample
+            
+        Returns:
+            Tuple of (zero-based page numbers or None to score the whole
+            document, whether the sample covers every page, the preferred
+            parser's text of the sample pages or None)
+        """
+        parser = self._preferred_parser()
+        leading = list(range(self.sample_pages))
+        
+        try:
+            probe = parser.extract_pages(pdf_path, leading + [self.sample_pages])
+        except Exception:
+            return None, True, None
+        
+        if probe is None:
+            return None, True, None
+        
+        if len(probe) <= len(leading):
+            # Short document: the sample is the whole document
+            return list(range(len(probe))), True, probe
+        
+        next_page = probe[len(leading)]
+        probe = probe[:len(leading)]
+        if any(self._is_acceptable_text(page) for page in probe if page):
+            return leading, False, probe
+        
+        if next_page and self._is_acceptable_text(next_page):
+            return [self.sample_pages], False, [next_page]
+        
+        later = list(range(self.sample_pages + 1, self.HEADER_SEARCH_PAGES))
+        try:
+            later_pages = parser.extract_pages(pdf_path, later) or []
+        except Exception:
+            later_pages = []
+        
+        for page_num, page_text in zip(later, later_pages):
+            if page_text and self._is_acceptable_text(page_text):
+                return [page_num], False, [page_text]
+        
+        return leading, False, probe
+    
+    def _layout_fingerprint(self, pdf_path: Path) -> Optional[str]:
+        """
+        Fingerprint a statement's layout from its first page.
+        
+        Args:
+            pdf_path: PDF file to fingerprint
+            
+        Returns:
+            Layout fingerprint or None if the first page yields no text
+        """
+        parser = self._preferred_parser()
+        if not parser:
+            return None
+        
+        try:
+            pages = parser.extract_pages(pdf_path, [0])
+        except Exception:
+            return None
+        
+        return BackendSelectionStore.fingerprint(pages[0] if pages else None)
+    
+    def _reuse_stored_backend(self, pdf_path: Path, fingerprint: str) -> Tuple[Optional[BaseParser], Optional[str]]:
+        """
+        Extract with the backend learned for this layout, if its quality still holds.
+        
+        Args:
+            pdf_path: PDF file to extract
+            fingerprint: Layout fingerprint of the PDF
+            
+        Returns:
+            Tuple of (parser, text), or (None, None) if the layout needs a full evaluation
+        """
+        entry = self.backend_store.get(fingerprint)
+        if not entry:
+            return None, None
+        
+        parser = self._parsers.get(entry.get('library'))
+        if not parser or not parser.is_available:
+            return None, None
+        
+        try:
+            start_time = time.perf_counter()
+            text = parser.extract_text(pdf_path)
+            elapsed = time.perf_counter() - start_time
+        except Exception:
+            return None, None
+        
+        score = self._score_text(text)
+        baseline = entry.get('score')
+        if baseline is not None and score < baseline * (1 - self.QUALITY_DROP_TOLERANCE):
+            # Quality dropped (layout change or library regression), evaluate again
+            return None, None
+        
+        self.backend_store.record_use(fingerprint, score, elapsed)
+        return parser, text
+    
+    def _race_parsers(self, pdf_path: Path) -> Tuple[Optional[BaseParser], Optional[str], float]:
+        """
+        Run all available backends concurrently and take the first acceptable result.
+        
+        Each backend extracts in its own process. The first text that looks
+        like a statement (transaction, amount and date patterns all present)
+        wins and the remaining workers are terminated. If no result is
+        acceptable, the best-scoring text received before the deadline is used.
+        
+        Args:
+            pdf_path: PDF file to extract
+            
+        Returns:
+            Tuple of (parser, text, extraction seconds), or (None, None, 0.0) if no
+            backend returned text in time
+        """
+        context = multiprocessing.get_context()
+        results = context.Queue()
+        workers = {}
+        
+        for parser in self.available_parsers:
+            worker = context.Process(
+                target=_race_worker,
+                args=(type(parser), pdf_path, results),
+                daemon=True
+            )
+            worker.start()
+            workers[parser.library_name] = worker
+        
+        deadline = time.monotonic() + self.race_deadline
+        pending = set(workers)
+        received = {}
+        winner = None
+        
+        try:
+            while pending and winner is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                try:
+                    library_name, text, error, elapsed = results.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                
+                pending.discard(library_name)
+                received[library_name] = {'text': text, 'error': error, 'elapsed': elapsed}
+                
+                if text and self._is_acceptable_text(text):
+                    winner = library_name
+        finally:
+            for worker in workers.values():
+                if worker.is_alive():
+                    worker.terminate()
+            for worker in workers.values():
+                worker.join(timeout=1.0)
+            results.close()
+            results.cancel_join_thread()
+        
+        if winner is None:
+            scored = [(self._score_text(r['text']), name) for name, r in received.items() if r['text']]
+            if scored:
+                winner = max(scored)[1]
+        
+        self.last_race = {
+            'winner': winner,
+            'cancelled': sorted(pending),
+            'results': {
+                name: {'elapsed': r['elapsed'], 'error': r['error'], 'text_length': len(r['text'] or '')}
+                for name, r in received.items()
+            }
+        }
+        
+        if winner is None:
+            return None, None, 0.0
+        
+        return self._parsers[winner], received[winner]['text'], received[winner]['elapsed']
+    
+    def _is_acceptable_text(self, text: str) -> bool:
+        """
+        Check whether extracted text is good enough to stop evaluating other backends.
+        
+        Args:
+            text: Extracted text
+            
+        Returns:
+            True if transaction, amount and date patterns are all present
+        """
+        return (self._contains_transaction_patterns(text) and
+                self._contains_amount_patterns(text) and
+                self._contains_date_patterns(text))
+    
+    def _remember_text(self, cache_key: str, text: Optional[str]):
+        """
+        Memoize the winning backend's text for reuse, keeping the cache bounded.
+        
+        Args:
+            cache_key: Evaluation cache key of the PDF
+            text: Text extracted by the winning parser
+        """
+        if not text:
+            return
+        
+        self._text_cache[cache_key] = text
+        self._text_cache.move_to_end(cache_key)
+        while len(self._text_cache) > self.MAX_CACHED_TEXTS:
+            self._text_cache.popitem(last=False)
     
     def _evaluate_parser(self, parser: BaseParser, pdf_path: Path) -> float:
         """
@@ -144,14 +516,27 @@ class PDFParserFactory:
             parser: Parser to evaluate
             pdf_path: PDF file to test
             
+        Returns:
+            Score (higher is better)
+        """
+        try:
+            return self._score_text(parser.extract_text(pdf_path))
+        except Exception:
+            return 0.0
+    
+    def _score_text(self, text: Optional[str]) -> float:
+        """
+        Score extracted text.
+        
+        Args:
+            text: Text extracted by a parser
+            
         Returns:
             Score (higher is better)
         """
         score = 0.0
         
         try:
-            # Test basic text extraction
-            text = parser.extract_text(pdf_path)
             if text and len(text.strip()) > 0:
                 score += 1.0
                 
@@ -223,7 +608,7 @@ class PDFParserFactory:
                 results[parser.library_name] = {
                     'success': success,
                     'text_length': len(text) if text else 0,
-                    'score': self._evaluate_parser(parser, pdf_path) if success else 0.0,
+                    'score': self._score_text(text) if success else 0.0,
                     'error': None
                 }
                 
@@ -253,4 +638,5 @@ class PDFParserFactory:
     
     def clear_cache(self):
         """Clear the evaluation cache."""
-        self._evaluation_cache.clear()
\ No newline at end of file
+        self._evaluation_cache.clear()
+        self._text_cache.clear()
\ No newline at end of file
@@ -79,6 +79,36 @@ class PDFPlumberParser(BaseParser):
         except Exception as e:
             raise ParserError(f"Failed to extract text by page from {pdf_path}", self.library_name, e)
     
+    def extract_pages(self, pdf_path: Path, page_numbers: List[int]) -> Optional[List[str]]:
+        """
+        Extract text from selected pages using pdfplumber.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_numbers: Zero-based page indices; indices past the end are skipped
+            
+        Returns:
+            List of text strings (one per existing requested page) or None if extraction fails
+        """
+        if not self.is_available:
+            raise ParserError("pdfplumber library is not available", self.library_name)
+        
+        try:
+            import pdfplumber
+            
+            pages_text = []
+            
+            with pdfplumber.open(pdf_path) as pdf:
+                for page_num in page_numbers:
+                    if 0 <= page_num < len(pdf.pages):
+                        page_text = pdf.pages[page_num].extract_text()
+                        pages_text.append(page_text if page_text else "")
+            
+            return pages_text
+            
+        except Exception as e:
+            raise ParserError(f"Failed to extract pages from {pdf_path}", self.library_name, e)
+    
     def extract_tables(self, pdf_path: Path) -> Optional[List]:
         """
         Extract tables from PDF using pdfplumber.
@@ -87,6 +87,39 @@ class PyMuPDFParser(BaseParser):
         except Exception as e:
             raise ParserError(f"Failed to extract text by page from {pdf_path}", self.library_name, e)
     
+    def extract_pages(self, pdf_path: Path, page_numbers: List[int]) -> Optional[List[str]]:
+        """
+        Extract text from selected pages using pymupdf.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_numbers: Zero-based page indices; indices past the end are skipped
+            
+        Returns:
+            List of text strings (one per existing requested page) or None if extraction fails
+        """
+        if not self.is_available:
+            raise ParserError("pymupdf library is not available", self.library_name)
+        
+        try:
+            import fitz
+            
+            pages_text = []
+            
+            doc = fitz.open(pdf_path)
+            try:
+                for page_num in page_numbers:
+                    if 0 <= page_num < doc.page_count:
+                        page_text = doc[page_num].get_text()
+                        pages_text.append(page_text if page_text else "")
+            finally:
+                doc.close()
+            
+            return pages_text
+            
+        except Exception as e:
+            raise ParserError(f"Failed to extract pages from {pdf_path}", self.library_name, e)
+    
     def extract_text_with_layout(self, pdf_path: Path) -> Optional[str]:
         """
         Extract text with layout preservation using pymupdf.
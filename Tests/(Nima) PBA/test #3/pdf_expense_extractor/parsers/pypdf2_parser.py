@@ -83,6 +83,38 @@ class PyPDF2Parser(BaseParser):
         except Exception as e:
             raise ParserError(f"Failed to extract text by page from {pdf_path}", self.library_name, e)
     
+    def extract_pages(self, pdf_path: Path, page_numbers: List[int]) -> Optional[List[str]]:
+        """
+        Extract text from selected pages using PyPDF2.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_numbers: Zero-based page indices; indices past the end are skipped
+            
+        Returns:
+            List of text strings (one per existing requested page) or None if extraction fails
+        """
+        if not self.is_available:
+            raise ParserError("PyPDF2 library is not available", self.library_name)
+        
+        try:
+            import PyPDF2
+            
+            pages_text = []
+            
+            with open(pdf_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                
+                for page_num in page_numbers:
+                    if 0 <= page_num < len(pdf_reader.pages):
+                        page_text = pdf_reader.pages[page_num].extract_text()
+                        pages_text.append(page_text if page_text else "")
+            
+            return pages_text
+            
+        except Exception as e:
+            raise ParserError(f"Failed to extract pages from {pdf_path}", self.library_name, e)
+    
     def get_page_info(self, pdf_path: Path) -> Optional[dict]:
         """
         Get information about PDF pages.
@@ -0,0 +1,59 @@
+"""
+Tests for description lookup through the line position index.
+"""
+
+from pdf_expense_extractor.core.pattern_detector import LinePositionIndex, TransactionPatternDetector
+
+
+def transaction_block(transaction_id, day, month, year, description):
+    """Lines of one multi-line transaction: ID, date, rate, three amounts, three quotas, description."""
+    return [transaction_id, day, month, year, "2,5",
+            "$100.000", "$0", "$100.000", "1", "1", "0", description]
+
+
+def test_index_keeps_positions_in_document_order():
+    """Repeated lines map to every position where they occur, stripped."""
+    index = LinePositionIndex(["12345", " 15 ", "12345", "COMPRA"])
+
+    assert index.find("12345") == [0, 2]
+    assert index.find("15") == [1]
+    assert index.find("missing") == []
+
+
+def test_description_found_after_repeated_first_component():
+    """Earlier lines equal to the first component are skipped until the full sequence matches."""
+    lines = (["ESTADO DE CUENTA", "12345", "99", "$5.000"]
+             + transaction_block("12345", "15", "02", "2025", "SUPERMERCADO EXITO")
+             + transaction_block("12345", "16", "02", "2025", "FARMACIA PASTEUR"))
+    detector = TransactionPatternDetector()
+    index = LinePositionIndex(lines)
+
+    assert index.find("12345") == [1, 4, 16]
+    assert detector._find_description_for_match(
+        lines, ("12345", "15", "02", "2025", "100.000"), index) == "SUPERMERCADO EXITO"
+    assert detector._find_description_for_match(
+        lines, ("12345", "16", "02", "2025", "100.000"), index) == "FARMACIA PASTEUR"
+    assert detector._find_description_for_match(
+        lines, ("16", "02", "2025", "100.000"), index) == "FARMACIA PASTEUR"
+    assert not index.fallback_resolved
+
+
+def test_fallback_description_is_resolved_once():
+    """Matches without a transaction block share the first description line, scanned only once."""
+    lines = ["$5.000", "12345", "PAGOS Y ABONOS"] + transaction_block("12345", "15", "02", "2025", "$1")
+    detector = TransactionPatternDetector()
+    index = LinePositionIndex(lines)
+    scans = []
+    find_in_block = detector._find_description_in_block
+
+    def counting_find_in_block(block_lines):
+        scans.append(len(block_lines))
+        return find_in_block(block_lines)
+
+    detector._find_description_in_block = counting_find_in_block
+
+    for match in [("12345", "15", "02", "2025", "1"), ("99999", "01", "03", "2025", "1")]:
+        assert detector._find_description_for_match(lines, match, index) == "PAGOS Y ABONOS"
+
+    assert index.fallback_resolved
+    assert scans == [len(lines)]
@@ -59,10 +59,18 @@ extras_require = {
     'performance': [
         'psutil>=5.9.0',
         'cachetools>=5.0.0',
+        'numpy>=1.22.0',
     ],
     'fuzzy': [
         'fuzzywuzzy>=0.18.0',
         'python-Levenshtein>=0.20.0',
+    ],
+    'pymupdf': [
+        'PyMuPDF>=1.23.0',
+    ],
+    'ocr': [
+        'pytesseract>=0.3.10',
+        'pdf2image>=1.16.0',
     ]
 }
 
@@ -0,0 +1,18 @@
+"""
+Synthetic corpus generation and throughput benchmarks.
+"""
+
+from .synthetic import CorpusSpec, StatementGenerator, SyntheticStatement, generate_corpus, write_pdf
+from .harness import BenchmarkHarness, BenchmarkResult, format_results, save_results
+
+__all__ = [
+    "CorpusSpec",
+    "StatementGenerator",
+    "SyntheticStatement",
+    "generate_corpus",
+    "write_pdf",
+    "BenchmarkHarness",
+    "BenchmarkResult",
+    "format_results",
+    "save_results"
+]
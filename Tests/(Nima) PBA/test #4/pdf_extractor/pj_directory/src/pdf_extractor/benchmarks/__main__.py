@@ -0,0 +1,119 @@
+"""
+Command-line entry point for the benchmark suite.
+
+Usage:
+    python -m pdf_extractor.benchmarks --sizes 10 50 200
+    python -m pdf_extractor.benchmarks --generate-only ./corpus --files 20 --layout wrapped
+"""
+
+import argparse
+import logging
+import sys
+
+from .synthetic import CorpusSpec, LAYOUTS, generate_corpus
+from .harness import BenchmarkHarness, OPERATIONS, format_results, save_results
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create and configure the benchmark argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pdf_extractor.benchmarks",
+        description="Generate synthetic statements and benchmark extraction throughput"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 50, 200],
+        help="Corpus sizes (number of files) to benchmark (default: 10 50 200)"
+    )
+    parser.add_argument(
+        "--operations",
+        nargs="+",
+        choices=OPERATIONS,
+        default=list(OPERATIONS),
+        help="Workflows to benchmark (default: all)"
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=2,
+        help="Statement pages per file (default: 2)"
+    )
+    parser.add_argument(
+        "--density",
+        type=int,
+        default=30,
+        help="Transactions per statement page (default: 30)"
+    )
+    parser.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        default="compact",
+        help="Transaction row layout (default: compact)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed for reproducible corpora (default: 42)"
+    )
+    parser.add_argument(
+        "--work-dir",
+        help="Keep generated corpora in this directory instead of a temp dir"
+    )
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run measurements in-process (peak RSS becomes cumulative)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Save results as JSON for baseline comparison"
+    )
+    parser.add_argument(
+        "--generate-only",
+        metavar="DIR",
+        help="Only generate a corpus (PDF, text fixtures, ground truth) into DIR"
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=10,
+        help="Number of files for --generate-only (default: 10)"
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    """Run the benchmark CLI."""
+    args = create_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    spec = CorpusSpec(
+        files=args.files,
+        pages_per_file=args.pages,
+        transactions_per_page=args.density,
+        layout=args.layout,
+        seed=args.seed
+    )
+
+    if args.generate_only:
+        manifest = generate_corpus(args.generate_only, spec)
+        print(f"Generated {manifest['total_files']} files, {manifest['total_pages']} pages, "
+              f"{manifest['total_transactions']} transactions in {args.generate_only}")
+        return 0
+
+    harness = BenchmarkHarness(spec, work_dir=args.work_dir, isolate=not args.no_isolate)
+    results = harness.run(args.sizes, args.operations)
+
+    print(format_results(results))
+
+    if args.output and save_results(results, args.output, spec):
+        print(f"Results saved to {args.output}")
+
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""
+End-to-end throughput benchmarks for the extract, batch and validate workflows.
+"""
+
+import json
+import logging
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from multiprocessing import get_context
+from pathlib import Path
+from typing import List, Dict, Optional, Any
+
+from .synthetic import CorpusSpec, generate_corpus
+
+
+OPERATIONS = ("extract", "batch", "validate")
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and memory figures for one operation on one corpus size."""
+
+    operation: str
+    corpus_size: int
+    files: int
+    pages: int
+    transactions: int
+    elapsed: float
+    peak_rss_mb: float
+    accuracy: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def files_per_second(self) -> float:
+        """Get files processed per second."""
+        return self.files / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        """Get pages processed per second."""
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def transactions_per_second(self) -> float:
+        """Get transactions extracted per second."""
+        return self.transactions / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert benchmark result to dictionary format."""
+        return {
+            "operation": self.operation,
+            "corpus_size": self.corpus_size,
+            "files": self.files,
+            "pages": self.pages,
+            "transactions": self.transactions,
+            "elapsed": round(self.elapsed, 4),
+            "files_per_second": round(self.files_per_second, 2),
+            "pages_per_second": round(self.pages_per_second, 2),
+            "transactions_per_second": round(self.transactions_per_second, 2),
+            "peak_rss_mb": round(self.peak_rss_mb, 1),
+            "accuracy": self.accuracy,
+            "error": self.error
+        }
+
+
+def peak_rss_mb() -> float:
+    """
+    Get the peak resident set size of the current process in MB.
+
+    Returns:
+        Peak RSS in MB, or 0.0 if it cannot be determined
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        pass
+
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    except ImportError:
+        return 0.0
+
+
+def run_operation(operation: str, corpus_dir: str, manifest: Dict[str, Any]) -> BenchmarkResult:
+    """
+    Run one workflow over a generated corpus and measure it.
+
+    Args:
+        operation: One of OPERATIONS
+        corpus_dir: Directory containing the generated PDFs
+        manifest: Manifest returned by generate_corpus
+
+    Returns:
+        BenchmarkResult for the run
+    """
+    from ..core.pdf_parser import PDFParser
+    from ..core.processor import PDFProcessor
+
+    logging.getLogger("pdf_extractor").setLevel(logging.WARNING)
+
+    files = manifest["total_files"]
+    pages = manifest["total_pages"]
+    transactions = 0
+    accuracy = None
+
+    try:
+        if operation == "extract":
+            parser = PDFParser()
+            pdf_paths = [s["files"]["pdf"] for s in manifest["statements"]]
+
+            start_time = time.perf_counter()
+            for pdf_path in pdf_paths:
+                result = parser.process_file(pdf_path)
+                transactions += len(result.transactions)
+            elapsed = time.perf_counter() - start_time
+
+        elif operation in ("batch", "validate"):
+            validate = operation == "validate"
+            processor = PDFProcessor(ground_truth_path=manifest["ground_truth"] if validate else None)
+
+            start_time = time.perf_counter()
+            results = processor.process_batch_folder(corpus_dir, validate=validate)
+            elapsed = time.perf_counter() - start_time
+
+            if results.get("error"):
+                raise RuntimeError(results["error"])
+
+            summary = results.get("summary", {})
+            transactions = summary.get("total_transactions", 0)
+            if summary.get("validation"):
+                accuracy = summary["validation"]["overall_accuracy"]
+
+        else:
+            raise ValueError(f"Unknown operation: {operation}. Supported: {list(OPERATIONS)}")
+
+    except Exception as e:
+        return BenchmarkResult(
+            operation=operation, corpus_size=files, files=files, pages=pages,
+            transactions=0, elapsed=0.0, peak_rss_mb=peak_rss_mb(), error=str(e)
+        )
+
+    if accuracy is None:
+        expected = manifest["total_transactions"]
+        accuracy = min(transactions, expected) / expected if expected else None
+
+    return BenchmarkResult(
+        operation=operation,
+        corpus_size=files,
+        files=files,
+        pages=pages,
+        transactions=transactions,
+        elapsed=elapsed,
+        peak_rss_mb=peak_rss_mb(),
+        accuracy=accuracy
+    )
+
+
+class BenchmarkHarness:
+    """Generates corpora of several sizes and benchmarks each workflow on them."""
+
+    def __init__(self, spec: Optional[CorpusSpec] = None, work_dir: Optional[str] = None,
+                 isolate: bool = True):
+        """
+        Initialize the benchmark harness.
+
+        Args:
+            spec: Base corpus shape; its file count is overridden per size
+            work_dir: Directory for generated corpora, a temp dir if omitted
+            isolate: Run each measurement in a fresh process so peak RSS is per run
+        """
+        self.logger = logging.getLogger(__name__)
+        self.spec = spec or CorpusSpec()
+        self.work_dir = work_dir
+        self.isolate = isolate
+
+    def run(self, sizes: List[int], operations: Optional[List[str]] = None) -> List[BenchmarkResult]:
+        """
+        Run the benchmark matrix.
+
+        Args:
+            sizes: Corpus sizes (number of files) to benchmark
+            operations: Operations to run, defaults to all OPERATIONS
+
+        Returns:
+            List of BenchmarkResult, one per (size, operation)
+        """
+        operations = operations or list(OPERATIONS)
+        results = []
+
+        with tempfile.TemporaryDirectory(prefix="pdf_extractor_bench_") as temp_dir:
+            base_dir = Path(self.work_dir or temp_dir)
+
+            for size in sizes:
+                corpus_dir = base_dir / f"corpus_{size}"
+                spec = replace(self.spec, files=size, write_pdf=True)
+                manifest = generate_corpus(str(corpus_dir), spec)
+
+                for operation in operations:
+                    self.logger.info(f"Benchmarking {operation} on {size} files")
+                    result = self._measure(operation, str(corpus_dir), manifest)
+                    results.append(result)
+
+                    if result.error:
+                        self.logger.error(f"{operation} on {size} files failed: {result.error}")
+
+        return results
+
+    def _measure(self, operation: str, corpus_dir: str, manifest: Dict[str, Any]) -> BenchmarkResult:
+        """Run one measurement, in a fresh worker process when isolation is enabled."""
+        if not self.isolate:
+            return run_operation(operation, corpus_dir, manifest)
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            return executor.submit(run_operation, operation, corpus_dir, manifest).result()
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """
+    Format benchmark results as a plain-text table.
+
+    Args:
+        results: Results returned by BenchmarkHarness.run
+
+    Returns:
+        Formatted table
+    """
+    header = f"{'operation':<10} {'files':>6} {'pages':>6} {'txns':>7} {'sec':>8} " \
+             f"{'files/s':>9} {'pages/s':>9} {'txns/s':>10} {'rss MB':>8} {'acc':>6}"
+    lines = [header, "-" * len(header)]
+
+    for r in results:
+        if r.error:
+            lines.append(f"{r.operation:<10} {r.files:>6} ERROR: {r.error}")
+            continue
+
+        accuracy = f"{r.accuracy:.1%}" if r.accuracy is not None else "-"
+        lines.append(
+            f"{r.operation:<10} {r.files:>6} {r.pages:>6} {r.transactions:>7} {r.elapsed:>8.2f} "
+            f"{r.files_per_second:>9.2f} {r.pages_per_second:>9.2f} {r.transactions_per_second:>10.1f} "
+            f"{r.peak_rss_mb:>8.1f} {accuracy:>6}"
+        )
+
+    return "\n".join(lines)
+
+
+def save_results(results: List[BenchmarkResult], file_path: str, spec: CorpusSpec) -> bool:
+    """
+    Save benchmark results as JSON so later runs can be compared to a baseline.
+
+    Args:
+        results: Results returned by BenchmarkHarness.run
+        file_path: Output JSON path
+        spec: Corpus shape the results were measured on
+
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    try:
+        data = {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "spec": spec.to_dict(),
+            "results": [r.to_dict() for r in results]
+        }
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return True
+
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Error saving benchmark results to {file_path}: {str(e)}")
+        return False
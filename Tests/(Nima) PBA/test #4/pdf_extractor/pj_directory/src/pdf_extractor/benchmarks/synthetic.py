@@ -0,0 +1,328 @@
+"""
+Synthetic Avianca-style statement generator for benchmarks and fixtures.
+"""
+
+import json
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Tuple
+
+
+# Row layouts the generator can emit:
+#   compact  - "DD MM YY DESCRIPTION CITY $AMOUNT"
+#   columnar - compact row followed by balance, interest and installment columns
+#   wrapped  - compact row followed by a non-transaction reference line
+LAYOUTS = ("compact", "columnar", "wrapped")
+
+MERCHANTS = [
+    "EXITO CALLE 80", "CARULLA OVIEDO", "RAPPI RESTAURANTES", "UBER TRIP HELP",
+    "NETFLIX COM", "SPOTIFY PREMIUM", "AVIANCA COM", "TERPEL EDS LA 33",
+    "JUAN VALDEZ CAFE", "FALABELLA SANTAFE", "HOMECENTER SUBA", "CRUZ VERDE 134",
+    "DROGUERIA ALEMANA", "CINE COLOMBIA", "AMAZON MKTPLACE", "APPLE COM BILL",
+    "MERCADO LIBRE", "PANAMERICANA", "DIDI FOOD", "ETB SERVICIOS"
+]
+
+CITIES = ["BOGOTA", "MEDELLIN", "CALI", "BARRANQUI", "CARTAGENA", "ONLINE"]
+
+MONTHS = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+
+# Letter page geometry used by the PDF writer
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+FONT_SIZE = 9
+LINE_HEIGHT = 11
+MARGIN = 40
+
+
+@dataclass
+class CorpusSpec:
+    """Shape of a synthetic statement corpus."""
+
+    files: int = 10
+    pages_per_file: int = 2
+    transactions_per_page: int = 30
+    layout: str = "compact"
+    card_types: Tuple[str, ...] = ("MC", "VS")
+    start_date: date = date(2025, 1, 1)
+    seed: int = 42
+    write_pdf: bool = True
+    write_text: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert corpus spec to dictionary format."""
+        return {
+            "files": self.files,
+            "pages_per_file": self.pages_per_file,
+            "transactions_per_page": self.transactions_per_page,
+            "layout": self.layout,
+            "card_types": list(self.card_types),
+            "start_date": self.start_date.isoformat(),
+            "seed": self.seed,
+            "write_pdf": self.write_pdf,
+            "write_text": self.write_text
+        }
+
+
+@dataclass
+class SyntheticStatement:
+    """A generated statement with its page text and expected totals."""
+
+    bill_name: str
+    card_type: str
+    pages: List[List[str]]
+    expected_total: Decimal
+    expected_count: int
+    files: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def page_count(self) -> int:
+        """Get the number of pages in the statement."""
+        return len(self.pages)
+
+    def text(self) -> str:
+        """Get the statement as plain text (pages separated by newlines)."""
+        return "\n".join("\n".join(lines) for lines in self.pages)
+
+    def ground_truth(self) -> Dict[str, Any]:
+        """Get the ground truth entry for this statement."""
+        return {
+            "bill_name": self.bill_name,
+            "expected_total": str(self.expected_total),
+            "expected_count": self.expected_count
+        }
+
+
+class StatementGenerator:
+    """Generates Avianca-style statement text with known ground truth."""
+
+    def __init__(self, spec: Optional[CorpusSpec] = None):
+        """
+        Initialize the statement generator.
+
+        Args:
+            spec: Corpus shape, defaults to CorpusSpec()
+        """
+        self.logger = logging.getLogger(__name__)
+        self.spec = spec or CorpusSpec()
+
+        if self.spec.layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout: {self.spec.layout}. Supported: {list(LAYOUTS)}")
+
+        self.random = random.Random(self.spec.seed)
+
+    def generate_statement(self, index: int) -> SyntheticStatement:
+        """
+        Generate one statement.
+
+        Args:
+            index: Sequence number of the statement in the corpus
+
+        Returns:
+            SyntheticStatement with page lines and ground truth
+        """
+        spec = self.spec
+        card_type = spec.card_types[index % len(spec.card_types)]
+        month_index = spec.start_date.month - 1 + index % 12
+        period_start = date(spec.start_date.year + month_index // 12, month_index % 12 + 1, 1)
+        period = f"{MONTHS[period_start.month - 1]}-{period_start.year}"
+        bill_name = f"{card_type} - {period} - {index:05d}"
+
+        pages = []
+        total = Decimal('0')
+        count = 0
+
+        for page_number in range(1, spec.pages_per_file + 1):
+            lines = self._page_header(card_type, period, page_number, spec.pages_per_file)
+
+            for _ in range(spec.transactions_per_page):
+                txn_date = period_start + timedelta(days=self.random.randint(0, 27))
+                amount = Decimal(self.random.randint(500, 250000)) / 100
+                lines.extend(self._transaction_lines(txn_date, amount))
+                total += amount
+                count += 1
+
+            pages.append(lines)
+
+        pages[-1].append(f"TOTAL MOVIMIENTOS DEL PERIODO {count}")
+
+        return SyntheticStatement(
+            bill_name=bill_name,
+            card_type=card_type,
+            pages=pages,
+            expected_total=total,
+            expected_count=count
+        )
+
+    def _page_header(self, card_type: str, period: str, page_number: int, page_count: int) -> List[str]:
+        """Build the header lines that mark a page as an Avianca statement."""
+        return [
+            "AVIANCA LIFEMILES TARJETA DE CREDITO",
+            f"AV - {card_type}   **** {self.random.randint(1000, 9999)}",
+            f"PERIODO {period}   PAGINA {page_number} DE {page_count}",
+            "FECHA     DESCRIPCION                         VALOR"
+        ]
+
+    def _transaction_lines(self, txn_date: date, amount: Decimal) -> List[str]:
+        """Render one transaction according to the configured layout."""
+        description = f"{self.random.choice(MERCHANTS)} {self.random.choice(CITIES)}"
+        row = f"{txn_date.strftime('%d %m %y')} {description} ${amount:,.2f}"
+
+        if self.spec.layout == "columnar":
+            installments = self.random.choice([1, 1, 1, 3, 6, 12])
+            row += f" ${amount:,.2f} $0.00 {1:02d}/{installments:02d}"
+            return [row]
+
+        if self.spec.layout == "wrapped":
+            return [row, f"    REF AUT {self.random.randint(100000, 999999)}"]
+
+        return [row]
+
+
+def write_pdf(pages: List[List[str]], file_path: str) -> int:
+    """
+    Write text pages to a minimal PDF file (Helvetica, one text object per page).
+
+    Lines that do not fit on a page are moved to continuation pages.
+
+    Args:
+        pages: List of pages, each a list of text lines
+        file_path: Output PDF path
+
+    Returns:
+        Number of PDF pages written
+    """
+    lines_per_page = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT
+    physical_pages = []
+    for lines in pages:
+        for start in range(0, max(len(lines), 1), lines_per_page):
+            physical_pages.append(lines[start:start + lines_per_page])
+
+    # Object layout: 1 catalog, 2 pages tree, 3 font, then (page, content) pairs
+    objects: List[bytes] = []
+    page_ids = [4 + 2 * i for i in range(len(physical_pages))]
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("latin-1"))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    for page_id, lines in zip(page_ids, physical_pages):
+        stream_lines = [
+            "BT",
+            f"/F1 {FONT_SIZE} Tf",
+            f"{LINE_HEIGHT} TL",
+            f"{MARGIN} {PAGE_HEIGHT - MARGIN} Td"
+        ]
+        for line in lines:
+            stream_lines.append(f"({_escape_pdf_text(line)}) Tj T*")
+        stream_lines.append("ET")
+        stream = "\n".join(stream_lines).encode("latin-1", errors="replace")
+
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode("latin-1")
+        )
+        objects.append(b"<< /Length " + str(len(stream)).encode("latin-1") + b" >>\nstream\n"
+                       + stream + b"\nendstream")
+
+    output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode("latin-1") + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n".encode("latin-1")
+    output += b"0000000000 65535 f \n"
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode("latin-1")
+    output += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+               f"startxref\n{xref_offset}\n%%EOF\n").encode("latin-1")
+
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(bytes(output))
+
+    return len(physical_pages)
+
+
+def _escape_pdf_text(text: str) -> str:
+    """Escape a string for use inside a PDF literal string."""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def generate_corpus(output_dir: str, spec: Optional[CorpusSpec] = None) -> Dict[str, Any]:
+    """
+    Generate a synthetic corpus with PDFs, text fixtures and ground truth.
+
+    Writes <bill_name>.pdf and/or <bill_name>.txt per statement, plus
+    ground_truth.json (validator format) and manifest.json (corpus shape,
+    per-file page and transaction counts).
+
+    Args:
+        output_dir: Directory to write the corpus into
+        spec: Corpus shape, defaults to CorpusSpec()
+
+    Returns:
+        Manifest dictionary
+    """
+    spec = spec or CorpusSpec()
+    generator = StatementGenerator(spec)
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    ground_truth = []
+    statements = []
+    total_pages = 0
+    total_transactions = 0
+
+    for index in range(spec.files):
+        statement = generator.generate_statement(index)
+
+        if spec.write_text:
+            text_path = output / f"{statement.bill_name}.txt"
+            text_path.write_text(statement.text(), encoding="utf-8")
+            statement.files["text"] = str(text_path)
+
+        page_count = statement.page_count
+        if spec.write_pdf:
+            pdf_path = output / f"{statement.bill_name}.pdf"
+            page_count = write_pdf(statement.pages, str(pdf_path))
+            statement.files["pdf"] = str(pdf_path)
+
+        total_pages += page_count
+        total_transactions += statement.expected_count
+        ground_truth.append(statement.ground_truth())
+        statements.append({
+            "bill_name": statement.bill_name,
+            "card_type": statement.card_type,
+            "pages": page_count,
+            "transactions": statement.expected_count,
+            "files": statement.files
+        })
+
+    ground_truth_path = output / "ground_truth.json"
+    with open(ground_truth_path, 'w', encoding='utf-8') as f:
+        json.dump(ground_truth, f, indent=2)
+
+    manifest = {
+        "spec": spec.to_dict(),
+        "ground_truth": str(ground_truth_path),
+        "total_files": spec.files,
+        "total_pages": total_pages,
+        "total_transactions": total_transactions,
+        "statements": statements
+    }
+
+    with open(output / "manifest.json", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    logging.getLogger(__name__).info(
+        f"Generated {spec.files} statements ({total_pages} pages, {total_transactions} transactions) in {output_dir}"
+    )
+
+    return manifest
@@ -2,12 +2,13 @@
 Command-line interface modules for the PDF extractor.
 """
 
-from .interface import CLIInterface
-from .commands import CommandHandler
+from .main import main, create_parser
+from .handlers import CommandHandler
 from .formatters import OutputFormatter
 
 __all__ = [
-    "CLIInterface",
+    "main",
+    "create_parser",
     "CommandHandler", 
     "OutputFormatter"
-]
\ No newline at end of file
+]
@@ -86,16 +86,21 @@ class OutputFormatter:
         
         # Write transactions
         for transaction in transactions:
-            writer.writerow([
-                transaction.date.strftime("%Y-%m-%d"),
-                transaction.description,
-                str(transaction.amount),
-                str(transaction.confidence),
-                transaction.raw_text.replace('\n', ' ').replace('\r', ' ')
-            ])
+            writer.writerow(self.transaction_csv_row(transaction))
         
         return output.getvalue()
     
+    @staticmethod
+    def transaction_csv_row(transaction: Transaction) -> List[str]:
+        """Get the CSV columns of a transaction (Date, Description, Amount, Confidence, Raw_Text)."""
+        return [
+            transaction.date.strftime("%Y-%m-%d"),
+            transaction.description,
+            str(transaction.amount),
+            str(transaction.confidence),
+            transaction.raw_text.replace('\n', ' ').replace('\r', ' ')
+        ]
+    
     def format_processing_result(self, result: ProcessingResult, format_type: str = "table") -> str:
         """
         Format processing result for display.
@@ -228,23 +233,29 @@ class OutputFormatter:
         if "file_results" in results:
             output_lines.append("FILE RESULTS:")
             
-            file_data = []
-            for file_name, file_result in results["file_results"].items():
-                pr = file_result.get("processing_result")
-                vr = file_result.get("validation_result")
-                
-                status = "✓" if file_result.get("overall_success") else "✗"
-                transactions = len(pr.transactions) if pr else 0
-                amount = f"${pr.total_amount:,.2f}" if pr else "$0.00"
-                accuracy = f"{vr.accuracy:.1%}" if vr else "N/A"
-                
-                file_data.append([status, file_name, transactions, amount, accuracy])
+            file_data = [
+                self.batch_file_row(file_name, file_result)
+                for file_name, file_result in results["file_results"].items()
+            ]
             
             headers = ["Status", "File", "Transactions", "Amount", "Accuracy"]
             output_lines.append(tabulate(file_data, headers=headers, tablefmt="grid"))
         
         return "\n".join(output_lines)
     
+    @staticmethod
+    def batch_file_row(file_name: str, file_result: Dict[str, Any]) -> List[Any]:
+        """Get the batch table row of a file (Status, File, Transactions, Amount, Accuracy)."""
+        pr = file_result.get("processing_result")
+        vr = file_result.get("validation_result")
+        
+        status = "✓" if file_result.get("overall_success") else "✗"
+        transactions = len(pr.transactions) if pr else 0
+        amount = f"${pr.total_amount:,.2f}" if pr else "$0.00"
+        accuracy = f"{vr.accuracy:.1%}" if vr else "N/A"
+        
+        return [status, file_name, transactions, amount, accuracy]
+    
     def format_pattern_list(self, patterns: List[str], pattern_info: Optional[Dict[str, Any]] = None) -> str:
         """
         Format list of available patterns.
@@ -6,27 +6,40 @@ import os
 import sys
 import time
 import json
+from contextlib import nullcontext, ExitStack
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 
 from ..core.processor import PDFProcessor
-from ..core.validator import GroundTruthValidator
+from ..core.aggregation import BatchAggregator
+from ..core.journal import BatchJournal
+from ..core.manifest import FileManifest
+from ..core.work_queue import WorkQueue, QueueWorker
+from ..core.scheduler import CostModel
+from ..config.settings import get_settings
 from ..patterns.pattern_repository import PatternRepository
 from .formatters import OutputFormatter
+from .writers import STREAMING_FORMATS, open_output, create_writer
 
 
 class CommandHandler:
     """Handles CLI command execution."""
     
-    def __init__(self):
-        self.processor = PDFProcessor()
-        self.validator = GroundTruthValidator()
+    def __init__(self, config_file: Optional[str] = None):
+        self.settings = get_settings(config_file)
+        self.processor = PDFProcessor(self.settings)
         self.pattern_repo = PatternRepository()
         self.formatter = OutputFormatter()
+        self.profiler = None
+    
+    def _profile_file(self, file_path: str):
+        """Get the per-file profiling scope (a no-op unless --profile-scope file)."""
+        return self.profiler.file_scope(file_path) if self.profiler else nullcontext()
     
     def handle_extract(self, file_path: str, pattern: Optional[str] = None, 
                       output_format: str = "table", output_file: Optional[str] = None,
-                      validate: bool = False, ground_truth_file: Optional[str] = None) -> int:
+                      validate: bool = False, ground_truth_file: Optional[str] = None,
+                      compress: bool = False) -> int:
         """
         Handle single file extraction command.
         
@@ -37,6 +50,7 @@ class CommandHandler:
             output_file: Output file path (optional)
             validate: Whether to validate against ground truth
             ground_truth_file: Path to ground truth file
+            compress: Gzip the output file
             
         Returns:
             Exit code (0 for success, 1 for error)
@@ -51,33 +65,38 @@ class CommandHandler:
                 print(self.formatter.format_error(f"File must be a PDF: {file_path}"))
                 return 1
             
+            processor = self.processor
+            if validate and ground_truth_file:
+                processor = self._validating_processor(ground_truth_file) or self.processor
+            
             print(self.formatter.format_info(f"Processing: {file_path}"))
             
             # Process the PDF
             start_time = time.time()
-            result = self.processor.process_pdf(file_path, pattern_name=pattern)
+            with self._profile_file(file_path):
+                file_result = processor.process_single_file(file_path, pattern_name=pattern, validate=validate)
             processing_time = time.time() - start_time
             
-            if not result.success:
-                print(self.formatter.format_error(f"Processing failed: {', '.join(result.errors)}"))
+            result = file_result["processing_result"]
+            if not self._check_processed(file_result):
                 return 1
             
             print(self.formatter.format_success(f"Extracted {len(result.transactions)} transactions in {processing_time:.2f}s"))
             
             # Format output
+            format_start = time.perf_counter()
             output_content = self.formatter.format_processing_result(result, output_format)
+            result.stage_timings["format"] = time.perf_counter() - format_start
             
             # Validation if requested
             validation_output = ""
-            if validate and ground_truth_file:
-                validation_result = self._validate_result(result, ground_truth_file)
-                if validation_result:
-                    validation_output = "\n\n" + self.formatter.format_validation_result(validation_result)
+            if file_result["validation_result"]:
+                validation_output = "\n\n" + self.formatter.format_validation_result(file_result["validation_result"])
             
             # Output to file or console
             full_output = output_content + validation_output
             if output_file:
-                self._write_output_file(full_output, output_file, output_format)
+                self._write_output_file(full_output, output_file, compress)
                 print(self.formatter.format_success(f"Results saved to: {output_file}"))
             else:
                 print(full_output)
@@ -90,10 +109,16 @@ class CommandHandler:
     
     def handle_batch(self, input_dir: str, pattern: Optional[str] = None,
                     output_format: str = "table", output_file: Optional[str] = None,
-                    validate: bool = False, ground_truth_file: Optional[str] = None) -> int:
+                    validate: bool = False, ground_truth_file: Optional[str] = None,
+                    compress: bool = False, journal_file: Optional[str] = None,
+                    resume: bool = False, incremental: bool = False,
+                    manifest_file: Optional[str] = None, fresh: bool = False) -> int:
         """
         Handle batch processing command.
         
+        Table, JSONL and CSV output are written file by file as the batch
+        runs; JSON output is a single document written at the end.
+        
         Args:
             input_dir: Directory containing PDF files
             pattern: Pattern name to use (optional)
@@ -101,6 +126,12 @@ class CommandHandler:
             output_file: Output file path (optional)
             validate: Whether to validate against ground truth
             ground_truth_file: Path to ground truth file
+            compress: Gzip the output file
+            journal_file: Journal recording each completed file (optional)
+            resume: Reuse the journaled results and process only the remaining files
+            incremental: Reuse the stored results of unchanged files and process only new or changed ones
+            manifest_file: Manifest used by incremental runs (default: in the input directory)
+            fresh: Start the journal afresh, replacing an existing one
             
         Returns:
             Exit code (0 for success, 1 for error)
@@ -111,6 +142,10 @@ class CommandHandler:
                 print(self.formatter.format_error(f"Directory not found: {input_dir}"))
                 return 1
             
+            if resume and fresh:
+                print(self.formatter.format_error("--resume and --fresh cannot be combined"))
+                return 1
+            
             # Find PDF files
             pdf_files = self._find_pdf_files(input_dir)
             if not pdf_files:
@@ -120,27 +155,50 @@ class CommandHandler:
             print(self.formatter.format_info(f"Found {len(pdf_files)} PDF files"))
             
             # Load ground truth if validation requested
-            ground_truth_data = None
+            processor = self.processor
             if validate and ground_truth_file:
-                ground_truth_data = self._load_ground_truth(ground_truth_file)
-                if not ground_truth_data:
-                    print(self.formatter.format_warning("Could not load ground truth file"))
+                processor = self._validating_processor(ground_truth_file)
+                if processor is None:
+                    processor = self.processor
                     validate = False
             
-            # Process files
-            batch_results = self._process_batch(pdf_files, pattern, validate, ground_truth_data)
-            
-            # Format and output results
-            output_content = self.formatter.format_batch_summary(batch_results, output_format)
-            
-            if output_file:
-                self._write_output_file(output_content, output_file, output_format)
-                print(self.formatter.format_success(f"Batch results saved to: {output_file}"))
-            else:
-                print(output_content)
+            with ExitStack() as stack:
+                try:
+                    journal, manifest = stack.enter_context(processor.open_batch_tracking(
+                        input_dir, pattern, journal_file, resume, fresh, incremental, manifest_file
+                    ))
+                except FileExistsError as e:
+                    print(self.formatter.format_error(
+                        f"Journal already exists: {e.filename} (use --resume to continue it or --fresh to replace it)"
+                    ))
+                    return 1
+                if journal is not None and journal.completed:
+                    print(self.formatter.format_info(f"Resuming: {journal.completed} files already completed"))
+                if manifest is not None:
+                    print(self.formatter.format_info(f"Incremental: {len(manifest)} files in manifest"))
+                
+                # Process files, writing each file's results as it completes
+                if output_format in STREAMING_FORMATS:
+                    summary = self._stream_batch(processor, pdf_files, pattern, validate,
+                                                 output_format, output_file, compress, journal, manifest)
+                    if output_file:
+                        print(self.formatter.format_success(f"Batch results saved to: {output_file}"))
+                else:
+                    batch_results = self._process_batch(processor, pdf_files, pattern, validate,
+                                                        journal, manifest)
+                    summary = batch_results["summary"]
+                    
+                    # Format and output results
+                    output_content = self.formatter.format_batch_summary(batch_results, output_format)
+                    
+                    if output_file:
+                        self._write_output_file(output_content, output_file, compress)
+                        print(self.formatter.format_success(f"Batch results saved to: {output_file}"))
+                    else:
+                        print(output_content)
             
             # Return appropriate exit code
-            success_rate = batch_results.get("summary", {}).get("success_rate", 0)
+            success_rate = summary.get("success_rate", 0)
             return 0 if success_rate > 50 else 1
             
         except Exception as e:
@@ -171,16 +229,20 @@ class CommandHandler:
                 print(self.formatter.format_error(f"Ground truth file not found: {ground_truth_file}"))
                 return 1
             
+            processor = self._validating_processor(ground_truth_file)
+            if processor is None:
+                print(self.formatter.format_error("Validation failed"))
+                return 1
+            
             # Process PDF
             print(self.formatter.format_info(f"Processing and validating: {file_path}"))
-            result = self.processor.process_pdf(file_path, pattern_name=pattern)
+            file_result = processor.process_single_file(file_path, pattern_name=pattern, validate=True)
             
-            if not result.success:
-                print(self.formatter.format_error(f"Processing failed: {', '.join(result.errors)}"))
+            if not self._check_processed(file_result):
                 return 1
             
             # Validate
-            validation_result = self._validate_result(result, ground_truth_file)
+            validation_result = file_result["validation_result"]
             if not validation_result:
                 print(self.formatter.format_error("Validation failed"))
                 return 1
@@ -282,6 +344,152 @@ class CommandHandler:
             print(self.formatter.format_error(f"Error getting file info: {str(e)}"))
             return 1
     
+    def handle_enqueue(self, input_dir: str, queue_dir: str, pattern: Optional[str] = None,
+                       validate: bool = False, cost_history_file: Optional[str] = None) -> int:
+        """
+        Handle queueing a directory's PDF files for workers, longest first.
+        
+        Args:
+            input_dir: Directory containing PDF files
+            queue_dir: Queue directory shared by the workers
+            pattern: Pattern name to use (optional)
+            validate: Whether workers should validate against ground truth
+            cost_history_file: Timings of earlier runs to estimate file costs from (optional)
+            
+        Returns:
+            Exit code (0 for success, 1 for error)
+        """
+        try:
+            if not os.path.exists(input_dir):
+                print(self.formatter.format_error(f"Directory not found: {input_dir}"))
+                return 1
+            
+            pdf_files = self._find_pdf_files(input_dir)
+            if not pdf_files:
+                print(self.formatter.format_error(f"No PDF files found in: {input_dir}"))
+                return 1
+            
+            queue = WorkQueue(queue_dir)
+            added = queue.enqueue(pdf_files, pattern, validate, CostModel(cost_history_file))
+            print(self.formatter.format_success(
+                f"Queued {added} of {len(pdf_files)} PDF files ({len(pdf_files) - added} already queued)"
+            ))
+            self._print_queue_status(queue)
+            return 0
+            
+        except Exception as e:
+            print(self.formatter.format_error(f"Enqueue error: {str(e)}"))
+            return 1
+    
+    def handle_worker(self, queue_dir: str, ground_truth_file: Optional[str] = None,
+                      worker_id: Optional[str] = None, lease_timeout: Optional[float] = None,
+                      max_tasks: Optional[int] = None, wait: bool = False) -> int:
+        """
+        Handle running a worker that processes queued files.
+        
+        Args:
+            queue_dir: Queue directory shared by the workers
+            ground_truth_file: Path to ground truth file, for tasks queued with validation
+            worker_id: Unique worker id (default: hostname and pid)
+            lease_timeout: Seconds without a heartbeat after which a lease expires
+            max_tasks: Stop after this many tasks
+            wait: Keep polling for new tasks when the queue is drained
+            
+        Returns:
+            Exit code (0 for success, 1 for error)
+        """
+        try:
+            queue = WorkQueue(queue_dir, **({"lease_timeout": lease_timeout} if lease_timeout else {}))
+            processor = PDFProcessor(self.settings, ground_truth_path=ground_truth_file) if ground_truth_file else self.processor
+            worker = QueueWorker(queue, processor, worker_id)
+            
+            print(self.formatter.format_info(f"Worker {worker.worker_id} processing {queue_dir}"), file=sys.stderr)
+            processed = worker.run(max_tasks=max_tasks, wait=wait)
+            print(self.formatter.format_success(f"Worker {worker.worker_id} processed {processed} files"), file=sys.stderr)
+            return 0
+            
+        except Exception as e:
+            print(self.formatter.format_error(f"Worker error: {str(e)}"))
+            return 1
+    
+    def handle_merge(self, queue_dir: str, output_format: str = "table",
+                     output_file: Optional[str] = None, compress: bool = False,
+                     cost_history_file: Optional[str] = None) -> int:
+        """
+        Handle merging the workers' result shards into one batch result.
+        
+        Args:
+            queue_dir: Queue directory shared by the workers
+            output_format: Output format
+            output_file: Output file path (optional)
+            compress: Gzip the output file
+            cost_history_file: Timings file to update with the merged results (optional)
+            
+        Returns:
+            Exit code (0 for success, 1 for error)
+        """
+        try:
+            if not os.path.isdir(queue_dir):
+                print(self.formatter.format_error(f"Queue not found: {queue_dir}"))
+                return 1
+            
+            queue = WorkQueue(queue_dir)
+            status = self._print_queue_status(queue)
+            if status["pending"] or status["leased"]:
+                print(self.formatter.format_warning("Tasks are still queued; the merged results are partial"), file=sys.stderr)
+            aggregator = BatchAggregator()
+            cost_model = CostModel(cost_history_file) if cost_history_file else None
+            
+            if output_format in STREAMING_FORMATS:
+                with open_output(output_file, compress) as stream:
+                    writer = create_writer(output_format, stream)
+                    for file_name, file_result in self._iter_merged(queue, None, cost_model):
+                        self._write_file(writer, file_name, file_result, aggregator)
+                    summary = aggregator.summary()
+                    writer.close(summary)
+            else:
+                file_results = dict(self._iter_merged(queue, aggregator, cost_model))
+                summary = aggregator.summary()
+                output_content = self.formatter.format_batch_summary(
+                    {"summary": summary, "file_results": file_results}, output_format
+                )
+                if output_file:
+                    self._write_output_file(output_content, output_file, compress)
+                else:
+                    print(output_content)
+            
+            if output_file:
+                print(self.formatter.format_success(f"Merged results saved to: {output_file}"))
+            if cost_model is not None and cost_model.save():
+                print(self.formatter.format_info(f"Cost history updated: {cost_history_file}"), file=sys.stderr)
+            
+            success_rate = summary.get("success_rate", 0)
+            return 0 if success_rate > 50 else 1
+            
+        except Exception as e:
+            print(self.formatter.format_error(f"Merge error: {str(e)}"))
+            return 1
+    
+    def _iter_merged(self, queue: WorkQueue, aggregator: Optional[BatchAggregator],
+                     cost_model: Optional[CostModel]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield the merged results of a queue, adding each to the aggregator and the cost model, if given."""
+        for file_name, file_result in queue.iter_results():
+            if aggregator is not None:
+                aggregator.add(file_result)
+            if cost_model is not None and file_result.get("processing_result"):
+                cost_model.observe(file_result["processing_result"])
+            yield file_name, file_result
+    
+    def _print_queue_status(self, queue: WorkQueue) -> Dict[str, int]:
+        """Print the task counts of a queue to stderr, warning about failed tasks, and return them."""
+        status = queue.status()
+        print(self.formatter.format_info(", ".join(f"{count} {state}" for state, count in status.items())), file=sys.stderr)
+        if status["failed"]:
+            print(self.formatter.format_warning(
+                f"{status['failed']} tasks failed repeatedly and were set aside in {queue.queue_dir / 'failed'}"
+            ), file=sys.stderr)
+        return status
+    
     def _find_pdf_files(self, directory: str) -> List[str]:
         """Find all PDF files in directory."""
         pdf_files = []
@@ -291,122 +499,93 @@ class CommandHandler:
                     pdf_files.append(os.path.join(root, file))
         return sorted(pdf_files)
     
-    def _load_ground_truth(self, ground_truth_file: str) -> Optional[Dict[str, Any]]:
-        """Load ground truth data from file."""
-        try:
-            with open(ground_truth_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(self.formatter.format_warning(f"Could not load ground truth: {str(e)}"))
+    def _validating_processor(self, ground_truth_file: str) -> Optional[PDFProcessor]:
+        """Get a processor that validates against a ground truth file, or None if the file cannot be loaded."""
+        processor = PDFProcessor(self.settings, ground_truth_path=ground_truth_file)
+        if not processor.validator.ground_truth_data:
+            print(self.formatter.format_warning(f"Could not load ground truth: {ground_truth_file}"))
             return None
+        return processor
     
-    def _validate_result(self, result, ground_truth_file: str):
-        """Validate processing result against ground truth."""
-        try:
-            # Extract bill name from file path
-            bill_name = Path(result.file_path).stem
-            
-            # Load and validate
-            return self.validator.validate_extraction(
-                result.transactions, 
-                bill_name, 
-                ground_truth_file
-            )
-        except Exception as e:
-            print(self.formatter.format_warning(f"Validation error: {str(e)}"))
-            return None
+    def _check_processed(self, file_result: Dict[str, Any]) -> bool:
+        """Print why a file could not be processed, returning False, or return True if it was."""
+        result = file_result["processing_result"]
+        if result is None:
+            print(self.formatter.format_error(f"Processing failed: {file_result.get('error', 'unknown error')}"))
+            return False
+        if not result.success:
+            print(self.formatter.format_error(f"Processing failed: {', '.join(result.errors)}"))
+            return False
+        return True
     
-    def _process_batch(self, pdf_files: List[str], pattern: Optional[str], 
-                      validate: bool, ground_truth_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    def _process_batch(self, processor: PDFProcessor, pdf_files: List[str], pattern: Optional[str],
+                      validate: bool, journal: Optional[BatchJournal] = None,
+                      manifest: Optional[FileManifest] = None) -> Dict[str, Any]:
         """Process a batch of PDF files."""
-        start_time = time.time()
-        
-        file_results = {}
-        successful_files = 0
-        failed_files = 0
-        total_transactions = 0
-        validation_passes = 0
-        total_accuracy = 0.0
-        
-        for i, file_path in enumerate(pdf_files, 1):
-            print(f"Processing {i}/{len(pdf_files)}: {os.path.basename(file_path)}")
-            
-            try:
-                # Process file
-                result = self.processor.process_pdf(file_path, pattern_name=pattern)
-                
-                file_result = {
-                    "processing_result": result,
-                    "validation_result": None,
-                    "overall_success": result.success
-                }
-                
-                if result.success:
-                    successful_files += 1
-                    total_transactions += len(result.transactions)
-                    
-                    # Validate if requested
-                    if validate and ground_truth_data:
-                        validation_result = self._validate_result(result, ground_truth_data)
-                        if validation_result:
-                            file_result["validation_result"] = validation_result
-                            total_accuracy += validation_result.accuracy
-                            if validation_result.is_valid:
-                                validation_passes += 1
-                else:
-                    failed_files += 1
-                
-                file_results[os.path.basename(file_path)] = file_result
-                
-            except Exception as e:
-                failed_files += 1
-                file_results[os.path.basename(file_path)] = {
-                    "processing_result": None,
-                    "validation_result": None,
-                    "overall_success": False,
-                    "error": str(e)
-                }
-        
-        processing_time = time.time() - start_time
-        
-        # Calculate summary statistics
-        total_files = len(pdf_files)
-        success_rate = (successful_files / total_files) * 100 if total_files > 0 else 0
-        
-        summary = {
-            "total_files": total_files,
-            "successful_files": successful_files,
-            "failed_files": failed_files,
-            "success_rate": success_rate,
-            "total_transactions": total_transactions,
-            "processing_time": processing_time
-        }
-        
-        if validate and successful_files > 0:
-            overall_accuracy = total_accuracy / successful_files if successful_files > 0 else 0
-            pass_rate = (validation_passes / successful_files) * 100 if successful_files > 0 else 0
-            
-            summary["validation"] = {
-                "overall_accuracy": overall_accuracy,
-                "validation_passes": validation_passes,
-                "pass_rate": pass_rate
-            }
+        aggregator = BatchAggregator()
+        file_results = dict(self._iter_batch(processor, pdf_files, pattern, validate,
+                                             aggregator, journal, manifest))
         
         return {
-            "summary": summary,
+            "summary": aggregator.summary(),
             "file_results": file_results
         }
     
-    def _write_output_file(self, content: str, output_file: str, output_format: str):
-        """Write output content to file."""
+    def _stream_batch(self, processor: PDFProcessor, pdf_files: List[str], pattern: Optional[str],
+                      validate: bool, output_format: str, output_file: Optional[str], compress: bool,
+                      journal: Optional[BatchJournal] = None,
+                      manifest: Optional[FileManifest] = None) -> Dict[str, Any]:
+        """Process a batch of PDF files, writing each file's results as it completes, and return the summary."""
+        aggregator = BatchAggregator()
+        
+        with open_output(output_file, compress) as stream:
+            writer = create_writer(output_format, stream)
+            for file_name, file_result in self._iter_batch(processor, pdf_files, pattern, validate,
+                                                           None, journal, manifest):
+                self._write_file(writer, file_name, file_result, aggregator)
+            
+            summary = aggregator.summary()
+            writer.close(summary)
+        
+        return summary
+    
+    def _write_file(self, writer, file_name: str, file_result: Dict[str, Any],
+                    aggregator: BatchAggregator):
+        """Write one file's result, timing it as the file's "format" stage, then add it to the aggregator."""
+        format_start = time.perf_counter()
+        writer.write_file(file_name, file_result)
+        self._add_stage_time(file_result.get("processing_result"), "format", time.perf_counter() - format_start)
+        aggregator.add(file_result)
+    
+    @staticmethod
+    def _add_stage_time(processing_result, stage: str, duration: float):
+        """Add a duration to a stage of a file's timings (if the file has a processing result)."""
+        if processing_result is not None:
+            stage_timings = processing_result.stage_timings
+            stage_timings[stage] = stage_timings.get(stage, 0.0) + duration
+    
+    def _iter_batch(self, processor: PDFProcessor, pdf_files: List[str], pattern: Optional[str],
+                    validate: bool, aggregator: Optional[BatchAggregator] = None,
+                    journal: Optional[BatchJournal] = None,
+                    manifest: Optional[FileManifest] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Process a batch of PDF files, yielding each file's result as it completes (journaled and unchanged files are reused)."""
+        for i, file_path in enumerate(pdf_files, 1):
+            # One file per call so each file gets its own profiling scope
+            with self._profile_file(file_path):
+                [(file_name, file_result)] = processor.iter_batch([file_path], pattern, validate,
+                                                                  aggregator, journal, manifest)
+            
+            # Progress goes to stderr so it never mixes with results streamed to stdout
+            reason = next((reason for reason in ("unchanged", "resumed") if file_result.get(reason)), None)
+            action = f"Reused ({reason})" if reason else "Processed"
+            print(f"{action} {i}/{len(pdf_files)}: {file_name}", file=sys.stderr)
+            yield file_name, file_result
+    
+    def _write_output_file(self, content: str, output_file: str, compress: bool = False):
+        """Write output content to file atomically, gzipped if requested."""
         try:
-            # Create output directory if needed
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write content
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with open_output(output_file, compress) as stream:
+                stream.write(content)
                 
         except Exception as e:
             print(self.formatter.format_error(f"Could not write output file: {str(e)}"))
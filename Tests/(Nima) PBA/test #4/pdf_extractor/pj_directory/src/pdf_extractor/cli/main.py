@@ -5,10 +5,19 @@ Main CLI interface for PDF Credit Card Expense Extractor.
 import argparse
 import sys
 import os
+from contextlib import nullcontext
 from typing import Optional
 
 from .handlers import CommandHandler
 from .formatters import OutputFormatter
+from .profiling import CommandProfiler, add_profiling_arguments
+from ..core.journal import DEFAULT_JOURNAL_NAME
+from ..core.manifest import DEFAULT_MANIFEST_NAME
+from ..core.work_queue import DEFAULT_LEASE_TIMEOUT
+
+
+# Value of a bare --journal flag; the journal then goes in the input directory
+JOURNAL_IN_INPUT_DIR = "<input-dir>"
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -28,6 +37,21 @@ Examples:
   # Process all PDFs in a directory
   pdf-extractor batch /path/to/pdfs --validate --ground-truth ground_truth.json
   
+  # Stream a large batch to compressed JSON Lines
+  pdf-extractor batch /path/to/pdfs --format jsonl --output transactions.jsonl.gz
+  
+  # Journal a long batch, then resume it after an interruption
+  pdf-extractor batch /path/to/pdfs --journal
+  pdf-extractor batch /path/to/pdfs --resume
+  
+  # Nightly run over a growing archive: only new or changed files are processed
+  pdf-extractor batch /path/to/archive --incremental --format jsonl --output nightly.jsonl
+  
+  # Spread a batch over several hosts sharing /mnt/queue, then merge the results
+  pdf-extractor enqueue /mnt/pdfs --queue /mnt/queue --cost-history /mnt/costs.json
+  pdf-extractor worker --queue /mnt/queue        # on each host, as many as needed
+  pdf-extractor merge --queue /mnt/queue --format jsonl --output merged.jsonl --cost-history /mnt/costs.json
+  
   # Validate extraction against ground truth
   pdf-extractor validate statement.pdf ground_truth.json
   
@@ -36,6 +60,9 @@ Examples:
   
   # Get file information
   pdf-extractor info statement.pdf
+  
+  # Profile a batch run, one profile per file
+  pdf-extractor batch /path/to/pdfs --profile cprofile --profile-scope file
         """
     )
     
@@ -52,6 +79,12 @@ Examples:
         help="Enable verbose output"
     )
     
+    parser.add_argument(
+        "--config", "-c",
+        help="Path to a YAML or JSON configuration file (default: config.yaml in the "
+             "working directory or ~/.pdf_extractor)"
+    )
+    
     # Create subparsers for commands
     subparsers = parser.add_subparsers(
         dest="command",
@@ -83,6 +116,11 @@ Examples:
         "--output", "-o",
         help="Output file path (default: stdout)"
     )
+    extract_parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the output file (implied by a .gz output path)"
+    )
     extract_parser.add_argument(
         "--validate",
         action="store_true",
@@ -92,6 +130,7 @@ Examples:
         "--ground-truth", "-g",
         help="Path to ground truth JSON file"
     )
+    add_profiling_arguments(extract_parser)
     
     # Batch command
     batch_parser = subparsers.add_parser(
@@ -109,14 +148,45 @@ Examples:
     )
     batch_parser.add_argument(
         "--format", "-f",
-        choices=["table", "json", "csv"],
+        choices=["table", "json", "jsonl", "csv"],
         default="table",
-        help="Output format (default: table)"
+        help="Output format (default: table); table, jsonl and csv are written as files complete"
     )
     batch_parser.add_argument(
         "--output", "-o",
         help="Output file path (default: stdout)"
     )
+    batch_parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the output file (implied by a .gz output path)"
+    )
+    batch_parser.add_argument(
+        "--journal",
+        nargs="?",
+        const=JOURNAL_IN_INPUT_DIR,
+        help=f"Record each completed file in a journal so the batch can be resumed "
+             f"(default path: DIRECTORY/{DEFAULT_JOURNAL_NAME})"
+    )
+    batch_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip files already recorded in the journal and rebuild the summary from it"
+    )
+    batch_parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Start the journal over, replacing an existing one"
+    )
+    batch_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Process only new or changed files and reuse stored results for the rest"
+    )
+    batch_parser.add_argument(
+        "--manifest",
+        help=f"Manifest used by --incremental (default: DIRECTORY/{DEFAULT_MANIFEST_NAME})"
+    )
     batch_parser.add_argument(
         "--validate",
         action="store_true",
@@ -126,6 +196,105 @@ Examples:
         "--ground-truth", "-g",
         help="Path to ground truth JSON file"
     )
+    add_profiling_arguments(batch_parser)
+    
+    # Enqueue command
+    enqueue_parser = subparsers.add_parser(
+        "enqueue",
+        help="Queue PDF files for processing by workers",
+        description="Add the PDF files in a directory to a shared work queue"
+    )
+    enqueue_parser.add_argument(
+        "directory",
+        help="Directory containing PDF files (must be reachable by every worker at the same path)"
+    )
+    enqueue_parser.add_argument(
+        "--queue", "-q",
+        required=True,
+        help="Queue directory on storage shared by the workers"
+    )
+    enqueue_parser.add_argument(
+        "--pattern", "-p",
+        help="Pattern name to use for extraction"
+    )
+    enqueue_parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Have workers validate extractions against ground truth"
+    )
+    enqueue_parser.add_argument(
+        "--cost-history",
+        help="Timings file (written by merge --cost-history) used to queue the slowest files first; "
+             "without it files are queued largest first"
+    )
+    
+    # Worker command
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="Process queued PDF files",
+        description="Take PDF files from a shared work queue and process them until it is drained"
+    )
+    worker_parser.add_argument(
+        "--queue", "-q",
+        required=True,
+        help="Queue directory on storage shared by the workers"
+    )
+    worker_parser.add_argument(
+        "--ground-truth", "-g",
+        help="Path to ground truth JSON file, for files queued with --validate"
+    )
+    worker_parser.add_argument(
+        "--worker-id",
+        help="Unique worker id (default: hostname and process id)"
+    )
+    worker_parser.add_argument(
+        "--lease-timeout",
+        type=float,
+        default=DEFAULT_LEASE_TIMEOUT,
+        help=f"Seconds without a heartbeat after which another worker takes over a file "
+             f"(default: {DEFAULT_LEASE_TIMEOUT:g})"
+    )
+    worker_parser.add_argument(
+        "--max-tasks",
+        type=int,
+        help="Stop after processing this many files"
+    )
+    worker_parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Keep waiting for new files when the queue is drained"
+    )
+    
+    # Merge command
+    merge_parser = subparsers.add_parser(
+        "merge",
+        help="Merge the results of queue workers",
+        description="Combine the per-worker result shards of a work queue into one batch result"
+    )
+    merge_parser.add_argument(
+        "--queue", "-q",
+        required=True,
+        help="Queue directory on storage shared by the workers"
+    )
+    merge_parser.add_argument(
+        "--format", "-f",
+        choices=["table", "json", "jsonl", "csv"],
+        default="table",
+        help="Output format (default: table)"
+    )
+    merge_parser.add_argument(
+        "--output", "-o",
+        help="Output file path (default: stdout)"
+    )
+    merge_parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the output file (implied by a .gz output path)"
+    )
+    merge_parser.add_argument(
+        "--cost-history",
+        help="Timings file to update with the merged results, for later enqueue --cost-history"
+    )
     
     # Validate command
     validate_parser = subparsers.add_parser(
@@ -202,29 +371,80 @@ def main(args: Optional[list] = None) -> int:
         return 1
     
     # Initialize handler and formatter
-    handler = CommandHandler()
     formatter = OutputFormatter()
+    if parsed_args.config and not os.path.isfile(parsed_args.config):
+        print(formatter.format_error(f"Configuration file not found: {parsed_args.config}"))
+        return 1
+    try:
+        handler = CommandHandler(parsed_args.config)
+    except Exception as e:
+        print(formatter.format_error(f"Could not load configuration: {str(e)}"))
+        return 1
+    
+    profiler = CommandProfiler.from_args(parsed_args)
+    handler.profiler = profiler
     
     try:
         # Route to appropriate command handler
         if parsed_args.command == "extract":
-            return handler.handle_extract(
-                file_path=parsed_args.file,
-                pattern=parsed_args.pattern,
-                output_format=parsed_args.format,
-                output_file=parsed_args.output,
-                validate=parsed_args.validate,
-                ground_truth_file=parsed_args.ground_truth
-            )
+            with profiler.run_scope(f"extract_{os.path.basename(parsed_args.file)}") if profiler else nullcontext():
+                exit_code = handler.handle_extract(
+                    file_path=parsed_args.file,
+                    pattern=parsed_args.pattern,
+                    output_format=parsed_args.format,
+                    output_file=parsed_args.output,
+                    validate=parsed_args.validate,
+                    ground_truth_file=parsed_args.ground_truth,
+                    compress=parsed_args.gzip
+                )
+            _print_profile_summary(profiler)
+            return exit_code
         
         elif parsed_args.command == "batch":
-            return handler.handle_batch(
+            with profiler.run_scope(f"batch_{os.path.basename(os.path.normpath(parsed_args.directory))}") if profiler else nullcontext():
+                exit_code = handler.handle_batch(
+                    input_dir=parsed_args.directory,
+                    pattern=parsed_args.pattern,
+                    output_format=parsed_args.format,
+                    output_file=parsed_args.output,
+                    validate=parsed_args.validate,
+                    ground_truth_file=parsed_args.ground_truth,
+                    compress=parsed_args.gzip,
+                    journal_file=_journal_path(parsed_args),
+                    resume=parsed_args.resume,
+                    incremental=parsed_args.incremental,
+                    manifest_file=parsed_args.manifest,
+                    fresh=parsed_args.fresh
+                )
+            _print_profile_summary(profiler)
+            return exit_code
+        
+        elif parsed_args.command == "enqueue":
+            return handler.handle_enqueue(
                 input_dir=parsed_args.directory,
+                queue_dir=parsed_args.queue,
                 pattern=parsed_args.pattern,
+                validate=parsed_args.validate,
+                cost_history_file=parsed_args.cost_history
+            )
+        
+        elif parsed_args.command == "worker":
+            return handler.handle_worker(
+                queue_dir=parsed_args.queue,
+                ground_truth_file=parsed_args.ground_truth,
+                worker_id=parsed_args.worker_id,
+                lease_timeout=parsed_args.lease_timeout,
+                max_tasks=parsed_args.max_tasks,
+                wait=parsed_args.wait
+            )
+        
+        elif parsed_args.command == "merge":
+            return handler.handle_merge(
+                queue_dir=parsed_args.queue,
                 output_format=parsed_args.format,
                 output_file=parsed_args.output,
-                validate=parsed_args.validate,
-                ground_truth_file=parsed_args.ground_truth
+                compress=parsed_args.gzip,
+                cost_history_file=parsed_args.cost_history
             )
         
         elif parsed_args.command == "validate":
@@ -251,6 +471,10 @@ def main(args: Optional[list] = None) -> int:
     
     except KeyboardInterrupt:
         print(formatter.format_info("Operation cancelled by user"))
+        if parsed_args.command == "batch" and (parsed_args.journal or parsed_args.resume):
+            print(formatter.format_info("Completed files are saved in the journal; rerun with --resume to continue"))
+        if parsed_args.command == "worker":
+            print(formatter.format_info("The interrupted file was returned to the queue"))
         return 1
     
     except Exception as e:
@@ -262,6 +486,19 @@ def main(args: Optional[list] = None) -> int:
         return 1
 
 
+def _journal_path(parsed_args: argparse.Namespace) -> Optional[str]:
+    """Get the batch journal path, resolving the bare --journal flag to the input directory."""
+    if parsed_args.journal == JOURNAL_IN_INPUT_DIR:
+        return os.path.join(parsed_args.directory, DEFAULT_JOURNAL_NAME)
+    return parsed_args.journal
+
+
+def _print_profile_summary(profiler: Optional[CommandProfiler]):
+    """Print the profiling summary to stderr so it never mixes with command output."""
+    if profiler:
+        print(profiler.format_summary(), file=sys.stderr)
+
+
 def cli_entry_point():
     """Entry point for console script."""
     sys.exit(main())
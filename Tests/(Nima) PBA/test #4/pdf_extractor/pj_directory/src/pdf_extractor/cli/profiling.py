@@ -0,0 +1,417 @@
+"""
+Built-in profiling for CLI commands (cProfile or a sampling profiler).
+"""
+
+import argparse
+import cProfile
+import io
+import logging
+import pstats
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+
+PROFILE_MODES = ("cprofile", "sampling")
+PROFILE_SCOPES = ("run", "file")
+
+# Components time is attributed to, matched against the source path of a
+# frame. Third-party libraries count towards the component that drives them.
+COMPONENTS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("OCR", ("pdf_extractor/extraction/ocr.py", "/pytesseract/", "/pdf2image/")),
+    ("PyMuPDFExtractor", ("pdf_extractor/extraction/pymupdf_extractor.py", "/fitz/", "/pymupdf/")),
+    ("PDFPlumberExtractor", ("pdf_extractor/extraction/", "/pdfplumber/", "/pdfminer/")),
+    ("PatternMatcher", ("pdf_extractor/patterns/", "pdf_extractor/core/pattern_engine.py")),
+    ("parsers", ("pdf_extractor/data/parsers.py", "/dateutil/")),
+    ("formatters", ("pdf_extractor/cli/formatters.py", "/tabulate")),
+]
+
+OTHER_COMPONENT = "other"
+
+
+def classify_path(file_path: str) -> Optional[str]:
+    """
+    Map a source file path to a profiling component.
+
+    Args:
+        file_path: Source file of a frame or profiled function
+
+    Returns:
+        Component name, or None if the path belongs to no component
+    """
+    normalized = file_path.replace("\\", "/")
+    for component, markers in COMPONENTS:
+        if any(marker in normalized for marker in markers):
+            return component
+    return None
+
+
+def add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the --profile* options to a command parser.
+
+    Args:
+        parser: Subcommand parser to extend
+    """
+    group = parser.add_argument_group("profiling")
+    group.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        help="Profile the command with cProfile (deterministic) or a low-overhead sampler"
+    )
+    group.add_argument(
+        "--profile-dir",
+        default="profiles",
+        help="Directory for .pstats and .collapsed profile output (default: profiles)"
+    )
+    group.add_argument(
+        "--profile-scope",
+        choices=PROFILE_SCOPES,
+        default="run",
+        help="Write one profile for the whole run or one per file (default: run)"
+    )
+    group.add_argument(
+        "--profile-top",
+        type=int,
+        default=15,
+        metavar="N",
+        help="Show the top N functions in the console summary (default: 15, 0 to disable)"
+    )
+    group.add_argument(
+        "--profile-interval",
+        type=float,
+        default=5.0,
+        metavar="MS",
+        help="Sampling interval in milliseconds for --profile sampling (default: 5)"
+    )
+
+
+class SamplingProfiler:
+    """Samples the call stack of one thread at a fixed interval."""
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Initialize the sampling profiler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.stacks: Dict[Tuple[Tuple[str, str], ...], int] = {}
+        self.sample_count = 0
+        self.elapsed = 0.0
+        self._start_time = 0.0
+        self._target_thread: Optional[int] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling the calling thread."""
+        self._target_thread = threading.get_ident()
+        self._start_time = time.perf_counter()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="pdf-extractor-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.elapsed += time.perf_counter() - self._start_time
+
+    def _run(self) -> None:
+        """Sampling loop executed on the background thread."""
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._target_thread)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                name = getattr(code, "co_qualname", code.co_name)
+                stack.append((code.co_filename, name))
+                frame = frame.f_back
+
+            # Stored root-first, as collapsed stacks are written
+            key = tuple(reversed(stack))
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.sample_count += 1
+
+
+class CommandProfiler:
+    """
+    Profiles CLI commands and writes pstats / collapsed-stack output.
+
+    With scope "run" the whole command is one profile; with scope "file"
+    each processed PDF gets its own profile. The console summary always
+    covers everything profiled during the run.
+    """
+
+    def __init__(self, mode: str = "cprofile", output_dir: str = "profiles",
+                 scope: str = "run", top: int = 15, interval_ms: float = 5.0):
+        """
+        Initialize the command profiler.
+
+        Args:
+            mode: "cprofile" or "sampling"
+            output_dir: Directory for profile output files
+            scope: "run" or "file"
+            top: Number of functions in the console summary
+            interval_ms: Sampling interval in milliseconds (sampling mode)
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}. Supported: {list(PROFILE_MODES)}")
+        if scope not in PROFILE_SCOPES:
+            raise ValueError(f"Unknown profile scope: {scope}. Supported: {list(PROFILE_SCOPES)}")
+
+        self.logger = logging.getLogger(__name__)
+        self.mode = mode
+        self.output_dir = Path(output_dir)
+        self.scope = scope
+        self.top = top
+        self.interval = interval_ms / 1000.0
+
+        self.written_files: List[str] = []
+        self._combined_stats: Optional[pstats.Stats] = None
+        self._combined_stacks: Dict[Tuple[Tuple[str, str], ...], int] = {}
+        self._sampled_seconds = 0.0
+        self._active = False
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> Optional["CommandProfiler"]:
+        """
+        Create a profiler from parsed CLI arguments.
+
+        Args:
+            args: Parsed arguments (with the add_profiling_arguments options)
+
+        Returns:
+            CommandProfiler, or None if profiling was not requested
+        """
+        mode = getattr(args, "profile", None)
+        if not mode:
+            return None
+
+        return cls(
+            mode=mode,
+            output_dir=args.profile_dir,
+            scope=args.profile_scope,
+            top=args.profile_top,
+            interval_ms=args.profile_interval
+        )
+
+    def run_scope(self, label: str):
+        """Profile the enclosed block when profiling the whole run."""
+        return self._profile(label) if self.scope == "run" else nullcontext()
+
+    def file_scope(self, file_path: str):
+        """Profile the enclosed block when profiling per file."""
+        return self._profile(Path(file_path).stem) if self.scope == "file" else nullcontext()
+
+    @contextmanager
+    def _profile(self, label: str):
+        """Profile the enclosed block and write its output files."""
+        if self._active:
+            # Nested scopes are already covered by the enclosing profile
+            yield
+            return
+
+        self._active = True
+        start_time = time.perf_counter()
+
+        if self.mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                self._active = False
+                self._save_cprofile(profiler, label)
+        else:
+            sampler = SamplingProfiler(self.interval)
+            sampler.start()
+            try:
+                yield
+            finally:
+                sampler.stop()
+                self._active = False
+                self._save_samples(sampler, label)
+
+        self.logger.debug(f"Profiled {label} in {time.perf_counter() - start_time:.2f}s")
+
+    def _output_path(self, label: str, suffix: str) -> Path:
+        """Build a filesystem-safe output path for a profile label."""
+        safe_label = re.sub(r"[^A-Za-z0-9._-]+", "_", label).strip("_") or "profile"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir / f"{safe_label}.{self.mode}{suffix}"
+
+    def _save_cprofile(self, profiler: cProfile.Profile, label: str) -> None:
+        """Write .pstats and caller->callee collapsed output for a cProfile run."""
+        try:
+            pstats_path = self._output_path(label, ".pstats")
+            profiler.dump_stats(str(pstats_path))
+            self.written_files.append(str(pstats_path))
+
+            stats = pstats.Stats(profiler)
+            if self._combined_stats is None:
+                self._combined_stats = pstats.Stats(profiler)
+            else:
+                self._combined_stats.add(stats)
+
+            # cProfile only records caller edges, so stacks are two frames deep
+            collapsed_path = self._output_path(label, ".collapsed")
+            with open(collapsed_path, 'w', encoding='utf-8') as f:
+                for func, (_, _, _, _, callers) in stats.stats.items():
+                    for caller, caller_stats in callers.items():
+                        own_time_us = int(caller_stats[2] * 1_000_000)
+                        if own_time_us > 0:
+                            f.write(f"{_function_label(caller)};{_function_label(func)} {own_time_us}\n")
+            self.written_files.append(str(collapsed_path))
+
+        except Exception as e:
+            self.logger.error(f"Error writing cProfile output for {label}: {str(e)}")
+
+    def _save_samples(self, sampler: SamplingProfiler, label: str) -> None:
+        """Write full-depth collapsed stacks for a sampling run."""
+        try:
+            collapsed_path = self._output_path(label, ".collapsed")
+            with open(collapsed_path, 'w', encoding='utf-8') as f:
+                for stack, count in sorted(sampler.stacks.items(), key=lambda item: -item[1]):
+                    frames = ";".join(_frame_label(file_path, name) for file_path, name in stack)
+                    f.write(f"{frames} {count}\n")
+            self.written_files.append(str(collapsed_path))
+
+            for stack, count in sampler.stacks.items():
+                self._combined_stacks[stack] = self._combined_stacks.get(stack, 0) + count
+            self._sampled_seconds += sampler.elapsed
+
+        except Exception as e:
+            self.logger.error(f"Error writing sampling profile for {label}: {str(e)}")
+
+    def component_times(self) -> Dict[str, float]:
+        """
+        Attribute profiled time to components.
+
+        For cProfile, each function's own time goes to its component; own
+        time of builtins and stdlib code is split over its callers and
+        follows each caller up to the nearest classified function. For
+        sampling, each sample goes to the innermost frame that belongs to a
+        component, and sample shares are scaled to the profiled wall time.
+
+        Returns:
+            Mapping of component name to seconds (estimated for sampling)
+        """
+        totals: Dict[str, float] = {}
+
+        if self.mode == "cprofile" and self._combined_stats is not None:
+            stats = self._combined_stats.stats
+            resolved: Dict[Tuple[str, int, str], str] = {}
+
+            def resolve(func: Tuple[str, int, str], visiting: frozenset = frozenset()) -> str:
+                if func in resolved:
+                    return resolved[func]
+                component = classify_path(func[0])
+                if component is None:
+                    callers = stats.get(func, (0, 0, 0, 0, {}))[4]
+                    candidates = [c for c in callers if c not in visiting]
+                    if candidates:
+                        # Follow the caller that accounts for most of this function's time
+                        dominant = max(candidates, key=lambda c: callers[c][3])
+                        component = resolve(dominant, visiting | {func})
+                    else:
+                        component = OTHER_COMPONENT
+                resolved[func] = component
+                return component
+
+            for func, (_, _, own_time, _, callers) in stats.items():
+                if classify_path(func[0]) or not callers:
+                    component = resolve(func)
+                    totals[component] = totals.get(component, 0.0) + own_time
+                    continue
+
+                for caller, caller_stats in callers.items():
+                    component = resolve(caller)
+                    totals[component] = totals.get(component, 0.0) + caller_stats[2]
+
+        elif self.mode == "sampling":
+            sample_total = sum(self._combined_stacks.values())
+            for stack, count in self._combined_stacks.items():
+                component = OTHER_COMPONENT
+                for file_path, _ in reversed(stack):
+                    matched = classify_path(file_path)
+                    if matched:
+                        component = matched
+                        break
+                seconds = count / sample_total * self._sampled_seconds
+                totals[component] = totals.get(component, 0.0) + seconds
+
+        return totals
+
+    def format_summary(self) -> str:
+        """
+        Format the console summary: time per component and the top functions.
+
+        Returns:
+            Summary text
+        """
+        lines = [f"PROFILE SUMMARY ({self.mode}, scope: {self.scope})"]
+
+        totals = self.component_times()
+        grand_total = sum(totals.values())
+        if grand_total <= 0:
+            lines.append("  No profile data collected")
+            return "\n".join(lines)
+
+        lines.append(f"  {'component':<22} {'seconds':>9} {'share':>7}")
+        for component, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+            lines.append(f"  {component:<22} {seconds:>9.3f} {seconds / grand_total:>7.1%}")
+
+        if self.top > 0:
+            lines.append("")
+            lines.append(f"  Top {self.top} functions by own time:")
+
+            if self.mode == "cprofile" and self._combined_stats is not None:
+                buffer = io.StringIO()
+                self._combined_stats.stream = buffer
+                self._combined_stats.sort_stats("tottime").print_stats(self.top)
+                lines.extend("  " + line for line in buffer.getvalue().splitlines() if line.strip())
+            else:
+                leaf_counts: Dict[str, int] = {}
+                for stack, count in self._combined_stacks.items():
+                    leaf = _frame_label(*stack[-1]) if stack else "<unknown>"
+                    leaf_counts[leaf] = leaf_counts.get(leaf, 0) + count
+                sample_total = sum(leaf_counts.values())
+                for leaf, count in sorted(leaf_counts.items(), key=lambda item: -item[1])[:self.top]:
+                    lines.append(f"    {count / sample_total:>6.1%}  {leaf}")
+
+        if self.written_files:
+            lines.append("")
+            lines.append(f"  Profile output written to {self.output_dir} ({len(self.written_files)} files)")
+
+        return "\n".join(lines)
+
+
+def _frame_label(file_path: str, name: str) -> str:
+    """Build a compact "module:function" label for a frame."""
+    normalized = file_path.replace("\\", "/")
+    if "pdf_extractor/" in normalized:
+        module = normalized.rsplit("pdf_extractor/", 1)[1]
+    else:
+        module = Path(normalized).name
+    return f"{module}:{name}"
+
+
+def _function_label(func: Tuple[str, int, str]) -> str:
+    """Build a label for a pstats function key (file, line, name)."""
+    file_path, _, name = func
+    if file_path == "~":
+        return name
+    return _frame_label(file_path, name)
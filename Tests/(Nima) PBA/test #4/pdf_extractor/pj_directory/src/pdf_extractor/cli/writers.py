@@ -0,0 +1,265 @@
+"""
+Streaming output writers for CLI results.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, ExitStack
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator, List, TextIO
+from tabulate import tabulate
+
+from .formatters import OutputFormatter
+
+
+STREAMING_FORMATS = ("jsonl", "csv", "table")
+
+# File rows rendered per table page; each page repeats the header
+DEFAULT_TABLE_PAGE_SIZE = 50
+
+# Initial width of the table's File column, so most names fit without a new page
+MIN_FILE_COLUMN_WIDTH = 40
+
+
+@contextmanager
+def open_output(output_file: Optional[str] = None, compress: bool = False) -> Iterator[TextIO]:
+    """
+    Open an output stream that is written incrementally and published atomically.
+
+    Content goes to "<output file>.part", which is renamed over the
+    output file only once the block completes, so readers never see a
+    truncated result. The part file is created exclusively, so two runs
+    writing the same output fail instead of interleaving; a part file
+    left by a killed run must be removed by hand. Writers flush after
+    each file, so the part file can be tailed while a batch runs.
+    Without an output file the stream is stdout.
+
+    Args:
+        output_file: Output file path, or None for stdout
+        compress: Gzip the output (implied by a ".gz" suffix)
+
+    Yields:
+        Text stream to write to
+
+    Raises:
+        FileExistsError: If the part file already exists
+    """
+    if not output_file:
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+
+    path = Path(output_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    compress = compress or path.suffix == ".gz"
+
+    part_path = path.with_name(path.name + ".part")
+    try:
+        fd = os.open(str(part_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
+        raise FileExistsError(f"{part_path} exists; another run may be writing {path} (remove it if not)")
+
+    try:
+        with ExitStack() as stack:
+            raw = stack.enter_context(os.fdopen(fd, "wb"))
+            if compress:
+                gzip_name = path.stem if path.suffix == ".gz" else path.name
+                raw = stack.enter_context(gzip.GzipFile(filename=gzip_name, mode="wb", fileobj=raw))
+            stream = stack.enter_context(io.TextIOWrapper(raw, encoding="utf-8", newline=""))
+            yield stream
+
+        os.replace(part_path, path)
+    except BaseException:
+        try:
+            os.unlink(part_path)
+        except OSError:
+            pass
+        raise
+
+
+class ResultWriter(ABC):
+    """
+    Base class of writers that emit batch results one file at a time.
+    
+    Subclasses implement write_file() and optionally close().
+    """
+    
+    def __init__(self, stream: TextIO):
+        """
+        Initialize the writer.
+        
+        Args:
+            stream: Text stream to write to (see open_output())
+        """
+        self.stream = stream
+    
+    @abstractmethod
+    def write_file(self, file_name: str, file_result: Dict[str, Any]):
+        """
+        Write one file's result and flush it.
+        
+        Args:
+            file_name: Name of the processed PDF file
+            file_result: Result dictionary with processing_result,
+                validation_result, overall_success and optionally error
+        """
+    
+    def close(self, summary: Optional[Dict[str, Any]] = None):
+        """
+        Finish the output.
+        
+        Args:
+            summary: Batch summary, written by formats that have room for it
+        """
+        self.stream.flush()
+
+
+class JSONLWriter(ResultWriter):
+    """
+    Writes one JSON object per line.
+    
+    Each transaction is a {"type": "transaction", "file": ...} record with
+    the fields of Transaction.to_dict(). Files that failed add an "error"
+    record, and the batch summary is the last record.
+    """
+    
+    def _write_record(self, record: Dict[str, Any]):
+        """Write a single record line."""
+        self.stream.write(json.dumps(record, ensure_ascii=False, default=str))
+        self.stream.write("\n")
+    
+    def write_file(self, file_name: str, file_result: Dict[str, Any]):
+        pr = file_result.get("processing_result")
+        if pr:
+            for transaction in pr.transactions:
+                self._write_record({"type": "transaction", "file": file_name, **transaction.to_dict()})
+        
+        if not file_result.get("overall_success"):
+            error = file_result.get("error") or (", ".join(pr.errors) if pr else "")
+            self._write_record({"type": "error", "file": file_name, "error": error})
+        
+        self.stream.flush()
+    
+    def close(self, summary: Optional[Dict[str, Any]] = None):
+        if summary is not None:
+            self._write_record({"type": "summary", **summary})
+        super().close(summary)
+
+
+class CSVWriter(ResultWriter):
+    """
+    Writes transactions as CSV rows under a single header.
+    
+    The columns are those of OutputFormatter's CSV format with the source
+    file first.
+    """
+    
+    HEADER = ["File", "Date", "Description", "Amount", "Confidence", "Raw_Text"]
+    
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self.writer = csv.writer(stream)
+        self.writer.writerow(self.HEADER)
+    
+    def write_file(self, file_name: str, file_result: Dict[str, Any]):
+        pr = file_result.get("processing_result")
+        if pr:
+            for transaction in pr.transactions:
+                self.writer.writerow([file_name] + OutputFormatter.transaction_csv_row(transaction))
+        
+        self.stream.flush()
+
+
+class TableWriter(ResultWriter):
+    """
+    Renders the batch file table a row at a time.
+    
+    Each file's row is written and flushed as soon as it arrives. Rows
+    share the column widths of their page, which is a grid table with its
+    own header; a row that does not fit those widths, or the row after
+    page_size rows, starts a new page. The batch summary follows the
+    last page.
+    """
+    
+    HEADERS = ["Status", "File", "Transactions", "Amount", "Accuracy"]
+    
+    def __init__(self, stream: TextIO, page_size: int = DEFAULT_TABLE_PAGE_SIZE):
+        """
+        Initialize the writer.
+        
+        Args:
+            stream: Text stream to write to
+            page_size: File rows per table page
+        """
+        super().__init__(stream)
+        self.page_size = max(1, page_size)
+        # Headers padded to the column widths of the current page
+        self.headers: List[str] = [header.ljust(MIN_FILE_COLUMN_WIDTH) if header == "File" else header
+                                   for header in self.HEADERS]
+        self.separator: Optional[str] = None
+        self.page_rows = 0
+        self.pages_written = 0
+    
+    def write_file(self, file_name: str, file_result: Dict[str, Any]):
+        row = OutputFormatter.batch_file_row(file_name, file_result)
+        lines = tabulate([row], headers=self.headers, tablefmt="grid").split("\n")
+        
+        if lines[0] != self.separator or self.page_rows >= self.page_size:
+            self._start_page(lines)
+        else:
+            # Same widths as the page so far: only the row and the line below it are new
+            self.stream.write("\n".join(lines[-2:]))
+            self.stream.write("\n")
+        
+        self.page_rows += 1
+        self.stream.flush()
+    
+    def _start_page(self, lines: List[str]):
+        """Write a one-row table as the start of a new page and keep its column widths."""
+        if self.pages_written == 0:
+            self.stream.write("FILE RESULTS:\n")
+        self.stream.write("\n".join(lines))
+        self.stream.write("\n")
+        
+        self.separator = lines[0]
+        # Each grid cell has a space either side, and tabulate pads headers by two more
+        header_widths = [len(cell) - 4 for cell in self.separator.strip("+").split("+")]
+        self.headers = [header.ljust(width) for header, width in zip(self.HEADERS, header_widths)]
+        self.page_rows = 0
+        self.pages_written += 1
+    
+    def close(self, summary: Optional[Dict[str, Any]] = None):
+        if summary is not None:
+            self.stream.write("\n")
+            self.stream.write(OutputFormatter().format_batch_summary({"summary": summary}))
+            self.stream.write("\n")
+        super().close(summary)
+
+
+def create_writer(output_format: str, stream: TextIO) -> ResultWriter:
+    """
+    Create the streaming writer of an output format.
+
+    Args:
+        output_format: One of STREAMING_FORMATS
+        stream: Text stream to write to
+
+    Returns:
+        ResultWriter instance
+
+    Raises:
+        ValueError: If the format has no streaming writer
+    """
+    writers = {
+        "jsonl": JSONLWriter,
+        "csv": CSVWriter,
+        "table": TableWriter
+    }
+    if output_format not in writers:
+        raise ValueError(f"No streaming writer for format: {output_format}. Supported: {list(STREAMING_FORMATS)}")
+    return writers[output_format](stream)
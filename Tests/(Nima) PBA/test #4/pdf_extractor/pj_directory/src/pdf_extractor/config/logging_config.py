@@ -219,6 +219,9 @@ class LoggerMixin:
         self.logger.exception(message, *args, **kwargs)
 
 
+_performance_logger: Optional[logging.Logger] = None
+
+
 def create_performance_logger() -> logging.Logger:
     """Create a dedicated logger for performance metrics."""
     logger = logging.getLogger("pdf_extractor.performance")
@@ -255,14 +258,16 @@ def log_performance_metric(operation: str, duration: float,
         duration: Duration in seconds
         details: Additional details to log
     """
-    perf_logger = create_performance_logger()
+    global _performance_logger
+    if _performance_logger is None:
+        _performance_logger = create_performance_logger()
     
     message = f"Operation: {operation}, Duration: {duration:.3f}s"
     if details:
         detail_str = ", ".join(f"{k}={v}" for k, v in details.items())
         message += f", Details: {detail_str}"
     
-    perf_logger.info(message)
+    _performance_logger.info(message)
 
 
 # Initialize logging when module is imported
@@ -19,6 +19,23 @@ class ExtractionSettings:
     timeout_seconds: int = 300
     preserve_layout: bool = True
     extract_tables: bool = True
+    bounded_memory: bool = False  # Release each page's cached objects once consumed
+    track_memory: bool = False  # Record tracemalloc peaks per file
+    memory_ceiling_mb: Optional[int] = None  # Recycle the worker above this RSS
+    extractor: str = "pdfplumber"  # Text extractor backend (see extraction.registry)
+    extractor_overrides: Dict[str, str] = field(default_factory=dict)  # Pattern or issuer -> extractor
+
+
+@dataclass
+class OCRSettings:
+    """Settings for OCR of pages without a usable text layer (hybrid extractor)."""
+    min_text_chars: int = 20  # Pages with fewer non-space text-layer chars are OCR'd
+    dpi: int = 300
+    language: str = "eng"
+    tesseract_config: str = ""  # Extra Tesseract options, e.g. "--psm 6"
+    max_workers: Optional[int] = None  # Concurrent Tesseract processes (default: CPU count)
+    tesseract_cmd: Optional[str] = None  # Tesseract executable if not on PATH
+    poppler_path: Optional[str] = None  # Poppler utilities directory if not on PATH
 
 
 @dataclass
@@ -65,6 +82,7 @@ class LoggingSettings:
 class Settings:
     """Main application settings."""
     extraction: ExtractionSettings = field(default_factory=ExtractionSettings)
+    ocr: OCRSettings = field(default_factory=OCRSettings)
     validation: ValidationSettings = field(default_factory=ValidationSettings)
     patterns: PatternSettings = field(default_factory=PatternSettings)
     output: OutputSettings = field(default_factory=OutputSettings)
@@ -80,6 +98,7 @@ class Settings:
         """Create Settings from dictionary."""
         # Extract nested settings
         extraction_data = data.get('extraction', {})
+        ocr_data = data.get('ocr', {})
         validation_data = data.get('validation', {})
         patterns_data = data.get('patterns', {})
         output_data = data.get('output', {})
@@ -87,6 +106,7 @@ class Settings:
         
         return cls(
             extraction=ExtractionSettings(**extraction_data),
+            ocr=OCRSettings(**ocr_data),
             validation=ValidationSettings(**validation_data),
             patterns=PatternSettings(**patterns_data),
             output=OutputSettings(**output_data),
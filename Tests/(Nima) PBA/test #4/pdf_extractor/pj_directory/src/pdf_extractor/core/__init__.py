@@ -6,10 +6,23 @@ from .pdf_parser import PDFParser
 from .pattern_engine import PatternEngine
 from .validator import Validator
 from .processor import PDFProcessor
+from .async_processor import AsyncPDFProcessor
+from .aggregation import BatchAggregator
+from .journal import BatchJournal
+from .manifest import FileManifest
+from .work_queue import WorkQueue, QueueWorker
+from .scheduler import CostModel
 
 __all__ = [
     "PDFParser",
     "PatternEngine",
     "Validator",
-    "PDFProcessor"
+    "PDFProcessor",
+    "AsyncPDFProcessor",
+    "BatchAggregator",
+    "BatchJournal",
+    "FileManifest",
+    "WorkQueue",
+    "QueueWorker",
+    "CostModel"
 ]
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""
+Running aggregation of batch results for streamed batch processing.
+"""
+
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, List
+
+from ..data.models import BatchResult, ProcessingResult, ValidationResult, ValidationReport
+from ..utils.timing import StageTimingAggregator
+
+
+class BatchAggregator:
+    """
+    Folds per-file batch results into the batch summary as they arrive.
+    
+    Only counters, running totals and bounded latency samples are kept, so
+    memory does not grow with the number of files. With keep_results the
+    processing and validation results are also retained, for callers that
+    need BatchResult.results and ValidationReport.validation_results.
+    """
+    
+    def __init__(self, group_key: Optional[Callable[[ProcessingResult], str]] = None,
+                 keep_results: bool = False):
+        """
+        Initialize the aggregator.
+        
+        Args:
+            group_key: Optional function mapping a result to a group name
+                (e.g. its issuer) for per-group stage timings
+            keep_results: Retain processing and validation results
+        """
+        self.keep_results = keep_results
+        self.start_time = time.time()
+        
+        # Per file
+        self.total_files = 0
+        self.successful_files = 0
+        self.total_transactions = 0
+        self.duplicate_count = 0
+        self.resumed_files = 0
+        self.unchanged_files = 0
+        
+        # Per processing result
+        self.processed_results = 0
+        self.successful_results = 0
+        self.total_amount = Decimal("0")
+        self.timings = StageTimingAggregator(group_key)
+        self.peak_rss_mb: Optional[float] = None
+        self.peak_traced_mb: Optional[float] = None
+        self.largest_file: Optional[str] = None
+        
+        # Per validation result
+        self.validated_files = 0
+        self.passed_validations = 0
+        self.expected_total = Decimal("0")
+        self.accuracy_sum = 0.0
+        self.weighted_accuracy_sum = 0.0
+        
+        self.processing_results: List[ProcessingResult] = []
+        self.validation_results: List[ValidationResult] = []
+    
+    def add(self, result: Dict[str, Any]) -> None:
+        """
+        Add one file's result.
+        
+        Args:
+            result: Result dictionary with processing_result, validation_result,
+                overall_success and optionally duplicates
+        """
+        self.total_files += 1
+        if result.get("overall_success"):
+            self.successful_files += 1
+        self.duplicate_count += len(result.get("duplicates", []))
+        if result.get("resumed"):
+            self.resumed_files += 1
+        if result.get("unchanged"):
+            self.unchanged_files += 1
+        
+        pr = result.get("processing_result")
+        if pr is not None:
+            self._add_processing_result(pr)
+        
+        vr = result.get("validation_result")
+        if vr is not None:
+            self._add_validation_result(vr)
+    
+    def _add_processing_result(self, pr: ProcessingResult) -> None:
+        """Fold a processing result into the counters, timings and memory peaks."""
+        self.processed_results += 1
+        if pr.success:
+            self.successful_results += 1
+            self.total_transactions += len(pr.transactions)
+            self.total_amount += pr.total_amount
+        
+        self.timings.add(pr)
+        
+        if pr.peak_rss_mb is not None:
+            self.peak_rss_mb = pr.peak_rss_mb if self.peak_rss_mb is None else max(self.peak_rss_mb, pr.peak_rss_mb)
+        if pr.peak_traced_mb is not None and (self.peak_traced_mb is None or pr.peak_traced_mb >= self.peak_traced_mb):
+            self.peak_traced_mb = pr.peak_traced_mb
+            self.largest_file = Path(pr.file_path).name
+        
+        if self.keep_results:
+            self.processing_results.append(pr)
+    
+    def _add_validation_result(self, vr: ValidationResult) -> None:
+        """Fold a validation result into the running accuracy."""
+        self.validated_files += 1
+        if vr.is_valid:
+            self.passed_validations += 1
+        self.expected_total += vr.expected_total
+        self.accuracy_sum += vr.accuracy
+        self.weighted_accuracy_sum += vr.accuracy * float(vr.expected_total)
+        
+        if self.keep_results:
+            self.validation_results.append(vr)
+    
+    @property
+    def processing_time(self) -> float:
+        """Get the time since the aggregator was created."""
+        return time.time() - self.start_time
+    
+    @property
+    def overall_accuracy(self) -> float:
+        """Get the accuracy weighted by expected totals, as Validator.generate_validation_report computes it."""
+        if self.validated_files == 0:
+            return 0.0
+        if self.expected_total > 0:
+            return self.weighted_accuracy_sum / float(self.expected_total)
+        return self.accuracy_sum / self.validated_files
+    
+    def batch_result(self) -> BatchResult:
+        """
+        Get the BatchResult of the files added so far.
+        
+        Returns:
+            BatchResult (with results only when keep_results is set)
+        """
+        return BatchResult(
+            results=list(self.processing_results),
+            total_files=self.processed_results,
+            successful_files=self.successful_results,
+            failed_files=self.processed_results - self.successful_results,
+            total_transactions=self.total_transactions,
+            processing_time=self.processing_time,
+            aggregate_amount=self.total_amount
+        )
+    
+    def validation_report(self) -> Optional[ValidationReport]:
+        """
+        Get the ValidationReport of the files validated so far.
+        
+        Returns:
+            ValidationReport (with validation_results only when keep_results
+            is set), or None if no file was validated
+        """
+        if self.validated_files == 0:
+            return None
+        
+        return ValidationReport(
+            validation_results=list(self.validation_results),
+            overall_accuracy=self.overall_accuracy,
+            total_files_validated=self.validated_files,
+            passed_validations=self.passed_validations,
+            failed_validations=self.validated_files - self.passed_validations
+        )
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the file-level batch summary.
+        
+        Returns:
+            Dictionary with file counts, success rate, transactions,
+            processing time and, if files were validated, validation totals
+        """
+        summary = {
+            "total_files": self.total_files,
+            "successful_files": self.successful_files,
+            "failed_files": self.total_files - self.successful_files,
+            "total_transactions": self.total_transactions,
+            "processing_time": self.processing_time,
+            "success_rate": self.successful_files / self.total_files * 100 if self.total_files else 0.0
+        }
+        
+        if self.resumed_files:
+            summary["resumed_files"] = self.resumed_files
+        if self.unchanged_files:
+            summary["unchanged_files"] = self.unchanged_files
+        
+        if self.validated_files:
+            report = self.validation_report()
+            summary["validation"] = {
+                "overall_accuracy": report.overall_accuracy,
+                "passed_validations": report.passed_validations,
+                "failed_validations": report.failed_validations,
+                "pass_rate": report.pass_rate
+            }
+        
+        return summary
+    
+    def memory_summary(self) -> Dict[str, Any]:
+        """
+        Get the batch's memory peaks.
+        
+        Returns:
+            Dictionary with max RSS and traced peaks and the file with the largest traced peak
+        """
+        return {
+            "peak_rss_mb": self.peak_rss_mb,
+            "peak_traced_mb": self.peak_traced_mb,
+            "largest_file": self.largest_file
+        }
@@ -0,0 +1,273 @@
+"""
+Asyncio facade over the PDF processor for embedding in async services.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, AsyncIterator, Tuple, List
+from pathlib import Path
+
+from .pdf_parser import PDFParser
+from .pattern_engine import PatternEngine
+from .processor import PDFProcessor
+from .scheduler import CostModel, order_longest_first
+from .validator import Validator
+
+
+# Parser of the current worker process, built once by _init_worker
+_worker_parser: Optional[PDFParser] = None
+
+
+def _init_worker(config_manager, ground_truth_path: Optional[str]) -> None:
+    """
+    Build the parsing components once per worker process.
+
+    Args:
+        config_manager: Configuration manager instance
+        ground_truth_path: Path to ground truth JSON file
+    """
+    global _worker_parser
+
+    validator = Validator(ground_truth_path) if ground_truth_path else None
+    _worker_parser = PDFParser(config_manager, PatternEngine(), validator)
+
+
+def _process_in_worker(pdf_path: str, pattern_name: Optional[str], validate: bool) -> Dict[str, Any]:
+    """
+    Extract (and optionally validate) one file in a worker process.
+
+    Args:
+        pdf_path: Path to the PDF file
+        pattern_name: Specific pattern to use, or None for auto-detection
+        validate: Whether to validate against ground truth
+
+    Returns:
+        Result dictionary as returned by PDFParser.process_with_validation
+    """
+    if validate and _worker_parser.validator:
+        return _worker_parser.process_with_validation(pdf_path, None, pattern_name)
+
+    processing_result = _worker_parser.process_file(pdf_path, pattern_name)
+    return {
+        "processing_result": processing_result,
+        "validation_result": None,
+        "bill_name": Path(pdf_path).stem,
+        "overall_success": processing_result.success
+    }
+
+
+class AsyncPDFProcessor:
+    """
+    Runs PDF extraction from asyncio code without blocking the event loop.
+    
+    Extraction runs in a managed process pool whose workers each build
+    their parser once. File system calls run on the loop's default thread
+    executor. At most max_concurrency files are in flight at a time, so a
+    large batch neither floods the pool's queue nor holds every pending
+    result. Rollups and the duplicate index are maintained in this process
+    by a PDFProcessor, exactly as for synchronous processing. Batch files
+    are dispatched longest-first by a CostModel, which learns from each
+    processed file.
+    
+    Use as an async context manager, or call aclose() when done:
+        
+        async with AsyncPDFProcessor(settings) as processor:
+            result = await processor.aprocess_file("statement.pdf")
+            async for file_name, result in processor.aiter_batch("statements/"):
+                ...
+    """
+    
+    def __init__(self, config_manager=None, ground_truth_path: Optional[str] = None,
+                 rollup_path: Optional[str] = None, max_workers: Optional[int] = None,
+                 max_concurrency: Optional[int] = None, cost_history_path: Optional[str] = None,
+                 duplicate_index_path: Optional[str] = None):
+        """
+        Initialize the async processor.
+        
+        Args:
+            config_manager: Configuration manager instance
+            ground_truth_path: Path to ground truth JSON file
+            rollup_path: Path to a JSON file persisting transaction rollups
+            max_workers: Extraction worker processes (default: CPU count)
+            max_concurrency: Files in flight at once (default: twice the worker count)
+            cost_history_path: Path to a JSON file persisting the per-file timings
+                that batch files are ordered by
+            duplicate_index_path: Path to a JSON file persisting the duplicate index
+                (default: next to the rollups, if any)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.config = config_manager
+        self.ground_truth_path = ground_truth_path
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.max_concurrency = max(1, max_concurrency or self.max_workers * 2)
+        
+        self.processor = PDFProcessor(config_manager, ground_truth_path, rollup_path,
+                                      duplicate_index_path=duplicate_index_path)
+        self.cost_model = CostModel(cost_history_path)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rollup_lock: Optional[asyncio.Lock] = None
+    
+    async def __aenter__(self) -> 'AsyncPDFProcessor':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the worker pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.config, self.ground_truth_path)
+            )
+        return self._executor
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limit, created inside the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def _ingest(self, result: Dict[str, Any], save: bool) -> None:
+        """
+        Add a file's result to the rollups and duplicate index.
+        
+        Serialized with rollup saves, which run on a thread and must not
+        see the rollups change underneath them.
+        
+        Args:
+            result: Result dictionary from a worker
+            save: Whether to save the rollups and duplicate index afterwards
+        """
+        if self._rollup_lock is None:
+            self._rollup_lock = asyncio.Lock()
+        
+        async with self._rollup_lock:
+            if result["processing_result"]:
+                self.processor.summarize_file_result(result)
+            if save:
+                await self._run_io(self.processor.save_state)
+    
+    async def _run_io(self, func, *args):
+        """Run a blocking file system call on the loop's default thread executor."""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    
+    async def _extract(self, pdf_path: str, pattern_name: Optional[str], validate: bool) -> Dict[str, Any]:
+        """
+        Extract one file in the worker pool, within the concurrency limit.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pattern_name: Specific pattern to use, or None for auto-detection
+            validate: Whether to validate against ground truth
+        
+        Returns:
+            Result dictionary (with "error" if the worker failed)
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    self._get_executor(), _process_in_worker, pdf_path, pattern_name, validate
+                )
+            except Exception as e:
+                error_msg = f"Error processing {Path(pdf_path).name}: {str(e)}"
+                self.logger.error(error_msg)
+                return {
+                    "processing_result": None,
+                    "validation_result": None,
+                    "bill_name": Path(pdf_path).stem,
+                    "overall_success": False,
+                    "error": error_msg
+                }
+    
+    async def aprocess_file(self, pdf_path: str, pattern_name: Optional[str] = None,
+                            validate: bool = True) -> Dict[str, Any]:
+        """
+        Process a single PDF file with optional validation.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pattern_name: Specific pattern to use, or None for auto-detection
+            validate: Whether to validate against ground truth
+        
+        Returns:
+            Dictionary containing processing and validation results, as
+            returned by PDFProcessor.process_single_file
+        """
+        self.logger.info(f"Processing single file: {pdf_path}")
+        
+        result = await self._extract(pdf_path, pattern_name, validate)
+        await self._ingest(result, save=result["processing_result"] is not None)
+        
+        return result
+    
+    async def aiter_batch(self, folder_path: str, pattern_name: Optional[str] = None,
+                          validate: bool = True) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Process all PDF files in a folder, yielding each file's result as it completes.
+        
+        Files are dispatched longest-first by estimated processing time, so
+        a few large statements do not finish long after the rest. Results
+        arrive in completion order, not file order. Rollups and the cost
+        history are saved once the folder is done.
+        
+        Args:
+            folder_path: Path to the folder containing PDF files
+            pattern_name: Specific pattern to use, or None for auto-detection
+            validate: Whether to validate against ground truth
+        
+        Yields:
+            (file name, result dictionary) for each PDF file
+        
+        Raises:
+            FileNotFoundError: If the folder does not exist
+        """
+        folder = Path(folder_path)
+        if not await self._run_io(folder.exists):
+            raise FileNotFoundError(f"Folder not found: {folder_path}")
+        
+        scheduled = await self._run_io(lambda: order_longest_first(folder.glob("*.pdf"), self.cost_model))
+        pdf_files: List[Path] = [pdf_file for pdf_file, _ in scheduled]
+        self.logger.info(f"Found {len(pdf_files)} PDF files to process")
+        
+        pending = set()
+        file_names = {}
+        remaining = iter(pdf_files)
+        
+        try:
+            while True:
+                # Keep max_concurrency files in flight; the semaphore guards the pool itself
+                for pdf_file in remaining:
+                    task = asyncio.ensure_future(self._extract(str(pdf_file), pattern_name, validate))
+                    pending.add(task)
+                    file_names[task] = pdf_file.name
+                    if len(pending) >= self.max_concurrency:
+                        break
+                
+                if not pending:
+                    break
+                
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    file_name = file_names.pop(task)
+                    result = task.result()
+                    await self._ingest(result, save=False)
+                    if result["processing_result"]:
+                        await self._run_io(self.cost_model.observe, result["processing_result"])
+                    yield file_name, result
+        finally:
+            for task in pending:
+                task.cancel()
+            await self._ingest({"processing_result": None}, save=True)
+            await self._run_io(self.cost_model.save)
+    
+    async def aclose(self) -> None:
+        """Shut down the worker pool without blocking the event loop."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await self._run_io(executor.shutdown)
@@ -0,0 +1,295 @@
+"""
+Append-only journal of completed batch files for crash-safe resume.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Iterable, Iterator
+
+from ..data.models import ProcessingResult, ValidationResult
+
+
+# Journal file written next to the batch input when no path is given
+DEFAULT_JOURNAL_NAME = ".pdf-extractor-journal.jsonl"
+
+# Bump when the entry format changes so old journals are not resumed from
+JOURNAL_VERSION = 1
+
+
+def serialize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a per-file result dictionary to JSON-compatible form.
+
+    Args:
+        result: Result dictionary with processing_result and validation_result
+
+    Returns:
+        Dictionary with the models replaced by their to_dict() form
+    """
+    data = dict(result)
+    for key in ("processing_result", "validation_result"):
+        if data.get(key) is not None:
+            data[key] = data[key].to_dict()
+    return data
+
+
+def deserialize_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild a per-file result dictionary written by serialize_result().
+
+    Args:
+        data: Serialized result dictionary
+
+    Returns:
+        Result dictionary with ProcessingResult and ValidationResult objects
+    """
+    result = dict(data)
+    if result.get("processing_result") is not None:
+        result["processing_result"] = ProcessingResult.from_dict(result["processing_result"])
+    if result.get("validation_result") is not None:
+        result["validation_result"] = ValidationResult.from_dict(result["validation_result"])
+    return result
+
+
+def entry_succeeded(entry: Dict[str, Any]) -> bool:
+    """
+    Check whether a journal entry records a successfully processed file.
+
+    Args:
+        entry: Journal entry dictionary
+
+    Returns:
+        True if the entry's processing_result succeeded
+    """
+    processing_result = entry["result"].get("processing_result")
+    return bool(processing_result and processing_result.get("success"))
+
+
+def read_journal(journal_path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Read the entries of a journal without opening it for writing.
+
+    Lines that are incomplete (e.g. still being written by another
+    process) or from another journal version are skipped, so a journal
+    can be read while it is appended to.
+
+    Args:
+        journal_path: Path to the journal file
+
+    Yields:
+        (byte offset of the entry, entry dictionary) in journal order
+    """
+    logger = logging.getLogger(__name__)
+    with open(journal_path, "rb") as f:
+        offset = 0
+        for line_number, line in enumerate(f, 1):
+            line_offset, offset = offset, offset + len(line)
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Skipping incomplete journal line {line_number} in {journal_path}")
+                continue
+
+            if entry.get("version") != JOURNAL_VERSION:
+                continue
+            yield line_offset, entry
+
+
+class BatchJournal:
+    """
+    Records each completed file of a batch as it finishes.
+    
+    The journal is a JSON Lines file of {"hash", "pattern", "file",
+    "validated", "recorded_at", "result"} entries keyed by the SHA-256 of the PDF content
+    and the requested pattern, so a renamed or moved file is still
+    recognized but a file is reprocessed when resumed with another
+    pattern. Each entry is flushed and fsynced before the next file
+    starts; a line cut short by a crash is skipped on load. Resuming a
+    batch reuses the journaled results of the files that succeeded and
+    processes the rest, including the ones that failed. Only each entry's
+    offset is kept in memory; results are read back from the file on demand.
+    
+    Use as a context manager, or call close() when done.
+    """
+    
+    def __init__(self, journal_path: str, resume: bool = False, overwrite: bool = False):
+        """
+        Open the journal.
+        
+        Args:
+            journal_path: Path to the journal file
+            resume: Load existing entries and append to them; otherwise
+                the journal is started afresh
+            overwrite: Allow starting afresh over an existing journal
+        
+        Raises:
+            FileExistsError: If the journal exists and neither resume nor
+                overwrite is set
+        """
+        self.logger = logging.getLogger(__name__)
+        self.journal_path = Path(journal_path)
+        # (pattern name, content hash) -> (byte offset of the entry, validated, succeeded)
+        self.entries: Dict[Tuple[str, str], Tuple[int, bool, bool]] = {}
+        # Lines of entries that were superseded by a later one
+        self.superseded = 0
+        
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.journal_path.exists():
+            self._load()
+            self._file = open(self.journal_path, "ab")
+            self._terminate_partial_line()
+            self.logger.info(f"Resuming from journal {self.journal_path} ({self.completed} files completed)")
+        else:
+            # Exclusive creation, so an earlier journal is never lost by accident
+            self._file = open(self.journal_path, "wb" if overwrite else "xb")
+    
+    def __enter__(self) -> 'BatchJournal':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    @property
+    def completed(self) -> int:
+        """Number of journaled files that succeeded and will not be processed again."""
+        return sum(1 for _, _, succeeded in self.entries.values() if succeeded)
+    
+    def _load(self) -> None:
+        """Read the journal's entries, skipping lines that are incomplete or from another version."""
+        for offset, entry in read_journal(str(self.journal_path)):
+            key = (entry.get("pattern") or "", entry["hash"])
+            if key in self.entries:
+                self.superseded += 1
+            self.entries[key] = (offset, bool(entry.get("validated")), entry_succeeded(entry))
+    
+    def _terminate_partial_line(self) -> None:
+        """End a line cut short by a crash so the next entry starts on its own line."""
+        if self.journal_path.stat().st_size == 0:
+            return
+        with open(self.journal_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                self._file.write(b"\n")
+    
+    def get(self, content_hash: str, validate: bool = False,
+            pattern_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the journaled result of a file.
+        
+        Args:
+            content_hash: SHA-256 of the PDF content
+            validate: Whether the caller needs a validated result; entries
+                recorded without validation are then ignored
+            pattern_name: Pattern the file is processed with, or None for auto-detection
+        
+        Returns:
+            Result dictionary, or None if the file must be processed
+            (not journaled, or its journaled processing failed)
+        """
+        key = (pattern_name or "", content_hash)
+        if key not in self.entries:
+            return None
+        
+        offset, validated, succeeded = self.entries[key]
+        if not succeeded or (validate and not validated):
+            return None
+        
+        self._file.flush()
+        with open(self.journal_path, "rb") as f:
+            f.seek(offset)
+            entry = json.loads(f.readline())
+        return deserialize_result(entry["result"])
+    
+    def record(self, content_hash: str, file_name: str, result: Dict[str, Any],
+               validated: bool = False, pattern_name: Optional[str] = None) -> None:
+        """
+        Append a completed file's result and sync it to disk.
+        
+        Args:
+            content_hash: SHA-256 of the PDF content
+            file_name: Name of the PDF file
+            result: Result dictionary of the file
+            validated: Whether the file was validated against ground truth
+            pattern_name: Pattern the file was processed with, or None for auto-detection
+        """
+        entry = {
+            "version": JOURNAL_VERSION,
+            "hash": content_hash,
+            "pattern": pattern_name,
+            "file": file_name,
+            "validated": validated,
+            "recorded_at": time.time(),
+            "result": serialize_result(result)
+        }
+        
+        offset = self._file.tell()
+        self._file.write(json.dumps(entry, ensure_ascii=False, default=str).encode("utf-8"))
+        self._file.write(b"\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        
+        key = (pattern_name or "", content_hash)
+        if key in self.entries:
+            self.superseded += 1
+        processing_result = result.get("processing_result")
+        self.entries[key] = (offset, validated, bool(processing_result and processing_result.success))
+    
+    def compact(self, keep_hashes: Iterable[str]) -> int:
+        """
+        Rewrite the journal with only the current entries of the given files.
+        
+        Superseded entries and entries of other files are dropped. The
+        journal is written to a temporary file that is then renamed over
+        it, so a crash leaves either the old or the compacted journal.
+        
+        Args:
+            keep_hashes: Content hashes of the files whose entries are kept
+        
+        Returns:
+            Number of entries dropped
+        """
+        keep = set(keep_hashes)
+        kept = sorted((offset, key, flags)
+                      for key, (offset, *flags) in self.entries.items() if key[1] in keep)
+        dropped = len(self.entries) - len(kept) + self.superseded
+        if dropped == 0:
+            return 0
+        
+        self._file.flush()
+        entries: Dict[Tuple[str, str], Tuple[int, bool, bool]] = {}
+        fd, temp_path = tempfile.mkstemp(dir=str(self.journal_path.parent), suffix=".tmp")
+        try:
+            with open(self.journal_path, "rb") as source, os.fdopen(fd, "wb") as target:
+                for offset, key, flags in kept:
+                    source.seek(offset)
+                    line = source.readline()
+                    entries[key] = (target.tell(), *flags)
+                    target.write(line if line.endswith(b"\n") else line + b"\n")
+                target.flush()
+                os.fsync(target.fileno())
+            os.replace(temp_path, self.journal_path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        self._file.close()
+        self._file = open(self.journal_path, "ab")
+        self.entries = entries
+        self.superseded = 0
+        self.logger.info(f"Compacted journal {self.journal_path}: dropped {dropped} entries, kept {len(entries)}")
+        return dropped
+    
+    def close(self) -> None:
+        """Close the journal file."""
+        if not self._file.closed:
+            self._file.close()
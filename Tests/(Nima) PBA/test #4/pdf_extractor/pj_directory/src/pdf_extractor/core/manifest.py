@@ -0,0 +1,228 @@
+"""
+Manifest of processed files for incremental (skip-unchanged) batch runs.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..utils.hashing import file_sha256
+from .journal import BatchJournal
+
+
+# Manifest file written next to the batch input when no path is given
+DEFAULT_MANIFEST_NAME = ".pdf-extractor-manifest.json"
+
+# Bump when the manifest format changes so old manifests are ignored
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """What a file looked like when it was processed, and with which patterns and extractor."""
+    
+    path: str
+    size: int
+    mtime: float
+    content_hash: str
+    pattern_hash: str
+    extractor_version: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ManifestEntry':
+        """Create a manifest entry from its dictionary format."""
+        return cls(
+            path=data["path"],
+            size=int(data["size"]),
+            mtime=float(data["mtime"]),
+            content_hash=data["content_hash"],
+            pattern_hash=data["pattern_hash"],
+            extractor_version=data["extractor_version"]
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert manifest entry to dictionary format."""
+        return {
+            "path": self.path,
+            "size": self.size,
+            "mtime": self.mtime,
+            "content_hash": self.content_hash,
+            "pattern_hash": self.pattern_hash,
+            "extractor_version": self.extractor_version
+        }
+
+
+class FileManifest:
+    """
+    Tracks processed files so unchanged ones can reuse their stored results.
+    
+    A file is unchanged when its content hash, the pattern hash and the
+    extractor version all match its entry. The content is only re-hashed
+    when size or modification time differ, so an unchanged archive costs
+    one stat per file. Results are kept in a BatchJournal next to the
+    manifest, keyed by content hash, and read back only when reused; it
+    is compacted to the files still in the manifest on save(). Failed
+    results are never reused, so those files are processed again.
+    
+    Call scan() before processing a file, stored_result() to reuse it,
+    record() after processing it, and save() (or close()) at the end.
+    """
+    
+    def __init__(self, manifest_path: str, pattern_hash: str, extractor_version: str):
+        """
+        Open the manifest and its result store.
+        
+        Args:
+            manifest_path: Path to the manifest JSON file
+            pattern_hash: Hash of the patterns that results depend on
+            extractor_version: Version of the extraction code and backend
+        """
+        self.logger = logging.getLogger(__name__)
+        self.manifest_path = Path(manifest_path)
+        self.pattern_hash = pattern_hash
+        self.extractor_version = extractor_version
+        self.entries: Dict[str, ManifestEntry] = {}
+        
+        if self.manifest_path.exists():
+            self._load()
+        self.results = BatchJournal(str(self.manifest_path) + ".results.jsonl", resume=True)
+    
+    def __enter__(self) -> 'FileManifest':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def _load(self) -> None:
+        """Read the manifest, ignoring it if it is unreadable or from another version."""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable manifest {self.manifest_path}: {str(e)}")
+            return
+        
+        if data.get("version") != MANIFEST_VERSION:
+            self.logger.warning(f"Ignoring manifest {self.manifest_path} from another version")
+            return
+        
+        for entry_data in data.get("files", []):
+            entry = ManifestEntry.from_dict(entry_data)
+            self.entries[entry.path] = entry
+    
+    def scan(self, pdf_path: str) -> ManifestEntry:
+        """
+        Describe a file as it is now.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            ManifestEntry with the current size, mtime and content hash and
+            this run's pattern hash and extractor version
+        
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = str(Path(pdf_path).resolve())
+        stat = os.stat(path)
+        
+        stored = self.entries.get(path)
+        if stored is not None and stored.size == stat.st_size and stored.mtime == stat.st_mtime:
+            content_hash = stored.content_hash
+        else:
+            content_hash = file_sha256(path)
+        
+        return ManifestEntry(
+            path=path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            content_hash=content_hash,
+            pattern_hash=self.pattern_hash,
+            extractor_version=self.extractor_version
+        )
+    
+    def stored_result(self, entry: ManifestEntry, validate: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored result of a file if it is unchanged.
+        
+        On a hit, the entry's size and mtime are refreshed, so a file that
+        was only touched is not re-hashed next time.
+        
+        Args:
+            entry: Current description of the file from scan()
+            validate: Whether the caller needs a validated result
+        
+        Returns:
+            Result dictionary, or None if the file is new, changed or failed last time
+        """
+        stored = self.entries.get(entry.path)
+        if stored is None or replace(stored, size=entry.size, mtime=entry.mtime) != entry:
+            return None
+        
+        # Failed results are not returned by the store, so those files are retried
+        result = self.results.get(entry.content_hash, validate)
+        if result is None:
+            return None
+        
+        self.entries[entry.path] = entry
+        return result
+    
+    def record(self, entry: ManifestEntry, result: Dict[str, Any], validated: bool = False) -> None:
+        """
+        Store a processed file's result.
+        
+        Args:
+            entry: Description of the file from scan(), taken before processing
+            result: Result dictionary of the file
+            validated: Whether the file was validated against ground truth
+        """
+        self.results.record(entry.content_hash, Path(entry.path).name, result, validated)
+        self.entries[entry.path] = entry
+    
+    def save(self) -> None:
+        """
+        Write the manifest atomically, dropping entries of files that no longer exist.
+        
+        The result store is then compacted to the results of the files
+        left in the manifest, so it does not grow with every changed,
+        re-processed or deleted file.
+        """
+        live = [entry for path, entry in sorted(self.entries.items()) if os.path.exists(path)]
+        files = [entry.to_dict() for entry in live]
+        data = {"version": MANIFEST_VERSION, "files": files}
+        
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(self.manifest_path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.manifest_path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        self.logger.info(f"Saved manifest of {len(files)} files to {self.manifest_path}")
+        
+        try:
+            self.results.compact(entry.content_hash for entry in live)
+        except OSError as e:
+            # The uncompacted store is still valid
+            self.logger.warning(f"Could not compact result store {self.results.journal_path}: {str(e)}")
+    
+    def close(self) -> None:
+        """Save the manifest and close the result store."""
+        try:
+            self.save()
+        finally:
+            self.results.close()
@@ -3,13 +3,17 @@ Pattern engine for managing transaction pattern recognition and learning.
 """
 
 import logging
+from contextlib import nullcontext
 from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
-from ..data.models import Pattern, Transaction
+from ..data.models import Pattern, Transaction, OCRProfile
 from ..patterns.pattern_matcher import PatternMatcher
 from ..patterns.pattern_repository import PatternRepository
 from ..patterns.avianca_patterns import AviancaPatterns
+from ..patterns.table_extractor import TableTransactionExtractor
+from ..utils.timing import StageTimer
+from ..utils.hashing import json_sha256
 
 
 class PatternEngine:
@@ -28,6 +32,7 @@ class PatternEngine:
         self.pattern_repository = PatternRepository(patterns_file)
         self.pattern_matcher = PatternMatcher()
         self.avianca_patterns = AviancaPatterns()
+        self.table_extractor = TableTransactionExtractor(self.pattern_matcher.validate_transaction)
         
         self.logger.info("Pattern engine initialized")
     
@@ -65,13 +70,15 @@ class PatternEngine:
             self.logger.error(f"Error detecting pattern: {str(e)}")
             return None
     
-    def extract_transactions(self, text: str, pattern_name: Optional[str] = None) -> List[Transaction]:
+    def extract_transactions(self, text: str, pattern_name: Optional[str] = None,
+                             timer: Optional[StageTimer] = None) -> List[Transaction]:
         """
         Extract transactions using detected or specified pattern.
         
         Args:
             text: PDF text content
             pattern_name: Specific pattern to use, or None for auto-detection
+            timer: Optional StageTimer receiving detect/match/parse spans
             
         Returns:
             List of extracted transactions
@@ -79,7 +86,8 @@ class PatternEngine:
         try:
             # Auto-detect pattern if not specified
             if pattern_name is None:
-                pattern_name = self.detect_pattern(text)
+                with timer.stage("detect") if timer else nullcontext():
+                    pattern_name = self.detect_pattern(text)
             
             if pattern_name is None:
                 self.logger.warning("No pattern available for transaction extraction")
@@ -87,7 +95,7 @@ class PatternEngine:
             
             # Use Avianca-specific extraction if it's an Avianca pattern
             if pattern_name in self.avianca_patterns.list_available_patterns():
-                transactions = self.avianca_patterns.extract_transactions(text, pattern_name)
+                transactions = self.avianca_patterns.extract_transactions(text, pattern_name, timer)
                 self.logger.info(f"Extracted {len(transactions)} transactions using Avianca pattern {pattern_name}")
                 return transactions
             
@@ -97,7 +105,7 @@ class PatternEngine:
                 self.logger.error(f"Pattern not found: {pattern_name}")
                 return []
             
-            transactions = self.pattern_matcher.match_transactions(text, pattern)
+            transactions = self.pattern_matcher.match_transactions(text, pattern, timer)
             self.logger.info(f"Extracted {len(transactions)} transactions using pattern {pattern_name}")
             return transactions
             
@@ -105,6 +113,65 @@ class PatternEngine:
             self.logger.error(f"Error extracting transactions: {str(e)}")
             return []
     
+    def get_table_pattern(self, pattern_name: Optional[str]) -> Optional[Pattern]:
+        """
+        Get a pattern if it extracts transactions from tables.
+        
+        Args:
+            pattern_name: Name of the pattern
+            
+        Returns:
+            Pattern declaring table_columns, or None
+        """
+        if not pattern_name:
+            return None
+        
+        pattern = self.pattern_repository.get_pattern(pattern_name)
+        return pattern if pattern is not None and pattern.uses_tables else None
+    
+    def get_ocr_profile(self, pattern_name: Optional[str]) -> Optional[OCRProfile]:
+        """
+        Get a pattern's OCR profile.
+        
+        Args:
+            pattern_name: Name of the pattern
+            
+        Returns:
+            OCR profile, or None if the pattern has none
+        """
+        if not pattern_name:
+            return None
+        
+        pattern = self.pattern_repository.get_pattern(pattern_name)
+        return pattern.ocr_profile if pattern is not None else None
+    
+    def extract_transactions_from_tables(self, tables: List[List[List[Optional[str]]]], pattern_name: str,
+                                         timer: Optional[StageTimer] = None) -> List[Transaction]:
+        """
+        Extract transactions from tables using a table-driven pattern.
+        
+        Args:
+            tables: Tables as returned by an extractor's extract_tables()
+            pattern_name: Name of a pattern declaring table_columns
+            timer: Optional StageTimer receiving the "parse" span
+            
+        Returns:
+            List of extracted transactions
+        """
+        try:
+            pattern = self.get_table_pattern(pattern_name)
+            if pattern is None:
+                self.logger.error(f"Pattern {pattern_name} does not declare table columns")
+                return []
+            
+            transactions = self.table_extractor.extract_transactions(tables, pattern, timer)
+            self.logger.info(f"Extracted {len(transactions)} transactions from tables using pattern {pattern_name}")
+            return transactions
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting transactions from tables: {str(e)}")
+            return []
+    
     def learn_new_pattern(self, text: str, expected_transactions: List[Transaction], pattern_name: str) -> Optional[Pattern]:
         """
         Learn a new pattern from user-provided examples.
@@ -370,6 +437,21 @@ class PatternEngine:
             self.logger.error(f"Error saving patterns: {str(e)}")
             return False
     
+    def get_patterns_hash(self) -> str:
+        """
+        Get a hash of every loaded pattern definition.
+        
+        Changes to any pattern can change detection and extraction, so
+        stored results are only reusable while this hash is unchanged.
+        
+        Returns:
+            Hex digest of the Avianca and repository patterns
+        """
+        return json_sha256({
+            "avianca": {name: pattern.to_dict() for name, pattern in self.avianca_patterns.patterns.items()},
+            "repository": {name: pattern.to_dict() for name, pattern in self.pattern_repository.patterns.items()}
+        })
+    
     def get_engine_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the pattern engine.
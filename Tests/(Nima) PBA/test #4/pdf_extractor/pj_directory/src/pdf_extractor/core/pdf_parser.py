@@ -7,8 +7,12 @@ import time
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
+from ..config.logging_config import log_performance_metric
+from ..config.settings import ExtractionSettings, OCRSettings
 from ..data.models import ProcessingResult, Transaction
-from ..extraction.pdfplumber_extractor import PDFPlumberExtractor
+from ..extraction.registry import get_extractor, OCR_EXTRACTORS
+from ..utils.timing import StageTimer
+from ..utils.memory import MemoryTracker
 from .pattern_engine import PatternEngine
 from .validator import Validator
 
@@ -28,21 +32,192 @@ class PDFParser:
         """
         self.logger = logging.getLogger(__name__)
         self.config = config_manager
+        self.extraction_settings = self._resolve_extraction_settings(config_manager)
+        ocr_settings = getattr(config_manager, "ocr", None)
+        self.ocr_settings = ocr_settings if isinstance(ocr_settings, OCRSettings) else OCRSettings()
         
         # Initialize components
         self.pattern_engine = pattern_engine or PatternEngine()
         self.validator = validator
-        self.text_extractor = PDFPlumberExtractor()
+        self._extractors: Dict[str, Any] = {}
+        self.text_extractor = self._get_extractor(self.extraction_settings.extractor)
+        self.memory_tracker = MemoryTracker(
+            trace_allocations=self.extraction_settings.track_memory,
+            ceiling_mb=self.extraction_settings.memory_ceiling_mb
+        )
         
         self.logger.info("PDF parser initialized")
     
+    @staticmethod
+    def _resolve_extraction_settings(config_manager) -> ExtractionSettings:
+        """
+        Get extraction settings from a Settings object, or the defaults.
+        
+        Args:
+            config_manager: Settings instance (or None)
+            
+        Returns:
+            ExtractionSettings to use
+        """
+        extraction = getattr(config_manager, "extraction", None)
+        return extraction if isinstance(extraction, ExtractionSettings) else ExtractionSettings()
+    
+    def _get_extractor(self, name: str):
+        """
+        Get a text extractor by registry name, creating it on first use.
+        
+        Args:
+            name: Registered extractor name
+            
+        Returns:
+            Extractor instance
+        """
+        if name not in self._extractors:
+            kwargs = {"bounded_memory": self.extraction_settings.bounded_memory}
+            if name.lower() in OCR_EXTRACTORS:
+                kwargs["ocr_settings"] = self.ocr_settings
+            self._extractors[name] = get_extractor(name, **kwargs)
+            self.logger.debug(f"Initialized {name} text extractor")
+        return self._extractors[name]
+    
+    def _extractor_for(self, pattern_name: Optional[str]):
+        """
+        Select the text extractor for a file.
+        
+        extractor_overrides is keyed by pattern name or issuer.
+        
+        Args:
+            pattern_name: Pattern the file will be processed with (given,
+                the default pattern or probed, see _selection_pattern())
+            
+        Returns:
+            Extractor instance
+        """
+        overrides = self.extraction_settings.extractor_overrides
+        pattern_name = pattern_name or self.extraction_settings.default_pattern
+        
+        if overrides and pattern_name:
+            name = overrides.get(pattern_name)
+            if name is None:
+                pattern_info = self.pattern_engine.get_pattern_info(pattern_name) or {}
+                name = overrides.get(pattern_info.get("issuer"))
+            
+            if name:
+                try:
+                    return self._get_extractor(name)
+                except ImportError as e:
+                    self.logger.warning(f"{str(e)}; using {self.extraction_settings.extractor} instead")
+        
+        return self.text_extractor
+    
+    def _selection_pattern(self, pdf_path: str, pattern_name: Optional[str], timer: StageTimer) -> Optional[str]:
+        """
+        Get the pattern that selects a file's extractor.
+        
+        This is the given pattern or extraction.default_pattern. For
+        auto-detected files, when extractor_overrides are configured or the
+        default extractor takes OCR profiles, the pattern is detected from
+        the first page with the default extractor (the "probe" stage). The
+        pattern the file is matched with is still detected from its full
+        text.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pattern_name: Specific pattern to use, or None for auto-detection
+            timer: StageTimer receiving the "probe" span
+            
+        Returns:
+            Pattern name, or None if it is unknown
+        """
+        pattern_name = pattern_name or self.extraction_settings.default_pattern
+        if pattern_name:
+            return pattern_name
+        if not (self.extraction_settings.extractor_overrides
+                or getattr(self.text_extractor, "supports_ocr_profile", False)):
+            return None
+        
+        extract_page_text = getattr(self.text_extractor, "extract_page_text", None)
+        if extract_page_text is None:
+            return None
+        
+        try:
+            with timer.stage("probe"):
+                page_text = extract_page_text(pdf_path, 1)
+                probed = self.pattern_engine.detect_pattern(page_text) if page_text.strip() else None
+        except Exception as e:
+            self.logger.warning(f"Could not probe the pattern of {pdf_path}: {str(e)}")
+            return None
+        
+        self.logger.debug(f"Probed pattern {probed} from the first page of {pdf_path}")
+        return probed
+    
+    def _extract_text(self, pdf_path: str, pattern_name: Optional[str], timer: StageTimer) -> str:
+        """
+        Extract a file's text with the extractor selected for its pattern.
+        
+        When the pattern declares an OCR profile, OCR extractors read only
+        the profile's regions with its DPI and preprocessing.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pattern_name: Specific pattern to use, or None for auto-detection
+            timer: StageTimer receiving the extraction spans
+            
+        Returns:
+            Extracted text
+        """
+        selection = self._selection_pattern(pdf_path, pattern_name, timer)
+        extractor = self._extractor_for(selection)
+        
+        ocr_profile = self.pattern_engine.get_ocr_profile(selection)
+        if ocr_profile is not None and getattr(extractor, "supports_ocr_profile", False):
+            return extractor.extract_text(pdf_path, timer, ocr_profile=ocr_profile)
+        
+        return extractor.extract_text(pdf_path, timer)
+    
     def process_file(self, pdf_path: str, pattern_name: Optional[str] = None) -> ProcessingResult:
         """
         Process a single PDF file.
         
+        Stage spans (probe, open, extract, detect, match, parse, filter) and
+        memory peaks are recorded on the result and logged once as a
+        performance metric.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pattern_name: Specific pattern to use, or None for auto-detection
+            
+        Returns:
+            ProcessingResult object with extraction results
+        """
+        timer = StageTimer()
+        with self.memory_tracker.track() as memory:
+            result = self._process_file(pdf_path, pattern_name, timer)
+        
+        result.stage_timings = timer.stages
+        result.page_timings = timer.page_timings
+        result.peak_traced_mb = memory.peak_traced_mb
+        result.peak_rss_mb = memory.peak_rss_mb
+        
+        log_performance_metric("process_file", result.processing_time, {
+            "file": Path(pdf_path).name,
+            "pattern": result.pattern_used,
+            "pages": len(timer.page_timings),
+            "transactions": len(result.transactions),
+            "peak_rss_mb": result.peak_rss_mb,
+            **{stage: f"{duration:.4f}" for stage, duration in timer.stages.items()}
+        })
+        
+        return result
+    
+    def _process_file(self, pdf_path: str, pattern_name: Optional[str], timer: StageTimer) -> ProcessingResult:
+        """
+        Run extraction, detection and matching for one file.
+        
         Args:
             pdf_path: Path to the PDF file
             pattern_name: Specific pattern to use, or None for auto-detection
+            timer: StageTimer receiving the stage spans
             
         Returns:
             ProcessingResult object with extraction results
@@ -66,9 +241,16 @@ class PDFParser:
                     success=False
                 )
             
+            # Table-driven patterns read rows straight from the statement's tables
+            table_pattern = self.pattern_engine.get_table_pattern(pattern_name or self.extraction_settings.default_pattern)
+            if table_pattern:
+                result = self._process_tables(pdf_path, table_pattern.name, timer, start_time)
+                if result is not None:
+                    return result
+            
             # Extract text from PDF
             try:
-                text_content = self.text_extractor.extract_text(pdf_path)
+                text_content = self._extract_text(pdf_path, pattern_name, timer)
                 if not text_content.strip():
                     warning_msg = f"No text content extracted from {pdf_path}"
                     self.logger.warning(warning_msg)
@@ -97,7 +279,8 @@ class PDFParser:
             
             # Detect or use specified pattern
             if pattern_name is None:
-                pattern_name = self.pattern_engine.detect_pattern(text_content)
+                with timer.stage("detect"):
+                    pattern_name = self.pattern_engine.detect_pattern(text_content)
                 if pattern_name is None:
                     warning_msg = "No suitable pattern detected for PDF"
                     self.logger.warning(warning_msg)
@@ -112,13 +295,19 @@ class PDFParser:
             
             self.logger.info(f"Using pattern: {pattern_name}")
             
+            if table_pattern is None and self.pattern_engine.get_table_pattern(pattern_name):
+                result = self._process_tables(pdf_path, pattern_name, timer, start_time)
+                if result is not None:
+                    return result
+            
             # Extract transactions
             try:
-                transactions = self.pattern_engine.extract_transactions(text_content, pattern_name)
+                transactions = self.pattern_engine.extract_transactions(text_content, pattern_name, timer)
                 self.logger.info(f"Extracted {len(transactions)} transactions")
                 
                 # Validate transactions
-                valid_transactions = [t for t in transactions if t.validate()]
+                with timer.stage("filter"):
+                    valid_transactions = [t for t in transactions if t.validate()]
                 if len(valid_transactions) < len(transactions):
                     invalid_count = len(transactions) - len(valid_transactions)
                     warning_msg = f"Filtered out {invalid_count} invalid transactions"
@@ -164,6 +353,48 @@ class PDFParser:
                 success=False
             )
     
+    def _process_tables(self, pdf_path: str, pattern_name: str, timer: StageTimer,
+                        start_time: float) -> Optional[ProcessingResult]:
+        """
+        Extract transactions from the PDF's tables with a table-driven pattern.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pattern_name: Pattern declaring table_columns
+            timer: StageTimer receiving extract/parse/validate spans
+            start_time: Processing start time of the file
+            
+        Returns:
+            ProcessingResult, or None if no valid transactions were found in
+            tables and the text path should be used instead
+        """
+        try:
+            with timer.stage("extract"):
+                tables = self._extractor_for(pattern_name).extract_tables(pdf_path)
+        except Exception as e:
+            self.logger.warning(f"Table extraction failed for {pdf_path}, falling back to text: {str(e)}")
+            return None
+        
+        transactions = self.pattern_engine.extract_transactions_from_tables(tables, pattern_name, timer)
+        
+        with timer.stage("filter"):
+            valid_transactions = [t for t in transactions if t.validate()]
+        
+        if not valid_transactions:
+            self.logger.info(f"No transactions found in {len(tables)} tables of {pdf_path}, falling back to text")
+            return None
+        
+        processing_time = time.time() - start_time
+        self.logger.info(f"Extracted {len(valid_transactions)} transactions from tables in {processing_time:.2f}s")
+        
+        return ProcessingResult(
+            file_path=pdf_path,
+            transactions=valid_transactions,
+            pattern_used=pattern_name,
+            processing_time=processing_time,
+            success=True
+        )
+    
     def process_batch(self, folder_path: str, pattern_name: Optional[str] = None) -> Dict[str, ProcessingResult]:
         """
         Process all PDFs in a folder.
@@ -237,9 +468,14 @@ class PDFParser:
             # Validate if validator is available
             validation_result = None
             if self.validator:
+                validation_start = time.perf_counter()
                 validation_result = self.validator.validate_extraction(
                     bill_name, processing_result.transactions
                 )
+                validation_time = time.perf_counter() - validation_start
+                processing_result.stage_timings["validate"] = (
+                    processing_result.stage_timings.get("validate", 0.0) + validation_time
+                )
             
             return {
                 "processing_result": processing_result,
@@ -298,7 +534,14 @@ class PDFParser:
             
             # Generate recommendations
             if tables:
-                analysis["recommendations"].append(f"Found {len(tables)} tables - consider table-based extraction")
+                analysis["recommendations"].append(f"Found {len(tables)} tables - declare table_columns (date, description, amount) on the pattern for table-based extraction")
+            
+            scanned_pages = [
+                page["page_number"] for page in pdf_info.get("pages_info", [])
+                if page.get("char_count", 0) < self.ocr_settings.min_text_chars
+            ]
+            if scanned_pages and self.extraction_settings.extractor not in OCR_EXTRACTORS:
+                analysis["recommendations"].append(f"Pages {scanned_pages} have no text layer - use the hybrid extractor to OCR them")
             
             if not pattern_analysis.get("detected_patterns"):
                 analysis["recommendations"].append("No existing patterns detected - may need custom pattern")
@@ -327,7 +570,7 @@ class PDFParser:
             self.logger.info(f"Testing pattern {pattern_name} on {pdf_path}")
             
             # Extract text
-            text_content = self.text_extractor.extract_text(pdf_path)
+            text_content = self._extractor_for(pattern_name).extract_text(pdf_path)
             
             # Test pattern
             pattern_validation = self.pattern_engine.validate_pattern_against_text(
@@ -400,7 +643,8 @@ class PDFParser:
             return {
                 "parser_status": "operational",
                 "pattern_engine": pattern_stats,
-                "text_extractor": "pdfplumber",
+                "text_extractor": self.extraction_settings.extractor,
+                "extractor_overrides": dict(self.extraction_settings.extractor_overrides),
                 "validator_available": self.validator is not None,
                 "config_loaded": self.config is not None
             }
@@ -4,25 +4,46 @@ Main processing orchestrator that coordinates all components.
 
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from contextlib import ExitStack, contextmanager
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 from pathlib import Path
 
-from ..data.models import BatchResult, ProcessingResult, ValidationReport
+from .. import __version__
+from ..data.models import ProcessingResult
+from ..data.rollups import TransactionRollup
+from ..data.duplicates import DuplicateIndex
+from ..utils.timing import format_stage_histograms
+from ..utils.memory import MB, current_rss_bytes, release_memory
+from ..utils.hashing import file_sha256, json_sha256
 from .pdf_parser import PDFParser
 from .pattern_engine import PatternEngine
 from .validator import Validator
+from .aggregation import BatchAggregator
+from .journal import BatchJournal, DEFAULT_JOURNAL_NAME
+from .manifest import FileManifest, DEFAULT_MANIFEST_NAME
+
+
+# RSS growth since the last recycle, as a fraction of the memory ceiling,
+# needed before recycling again
+RECYCLE_MARGIN = 0.1
 
 
 class PDFProcessor:
     """Main processing orchestrator that coordinates all components."""
     
-    def __init__(self, config_manager=None, ground_truth_path: Optional[str] = None):
+    def __init__(self, config_manager=None, ground_truth_path: Optional[str] = None,
+                 rollup_path: Optional[str] = None, duplicate_window_days: int = 3,
+                 duplicate_index_path: Optional[str] = None):
         """
         Initialize the PDF processor.
         
         Args:
             config_manager: Configuration manager instance
             ground_truth_path: Path to ground truth JSON file
+            rollup_path: Path to a JSON file persisting transaction rollups
+            duplicate_window_days: Date window (+/- days) for near-duplicate detection
+            duplicate_index_path: Path to a JSON file persisting the duplicate index
+                (default: "<rollup file>.duplicates.json" next to the rollups, if any)
         """
         self.logger = logging.getLogger(__name__)
         self.config = config_manager
@@ -31,6 +52,13 @@ class PDFProcessor:
         self.pattern_engine = PatternEngine()
         self.validator = Validator(ground_truth_path) if ground_truth_path else None
         self.pdf_parser = PDFParser(config_manager, self.pattern_engine, self.validator)
+        self.rollups = TransactionRollup(rollup_path)
+        if duplicate_index_path is None and rollup_path:
+            duplicate_index_path = str(Path(rollup_path).with_suffix(".duplicates.json"))
+        self.duplicate_index = DuplicateIndex(date_window_days=duplicate_window_days,
+                                              index_path=duplicate_index_path)
+        self.recycle_count = 0
+        self._rss_after_recycle: Optional[int] = None
         
         self.logger.info("PDF processor initialized")
     
@@ -65,24 +93,8 @@ class PDFProcessor:
             
             # Add summary information
             if result["processing_result"]:
-                pr = result["processing_result"]
-                result["summary"] = {
-                    "file_path": pr.file_path,
-                    "transactions_extracted": len(pr.transactions),
-                    "total_amount": str(pr.total_amount),
-                    "pattern_used": pr.pattern_used,
-                    "processing_time": pr.processing_time,
-                    "success": pr.success
-                }
-                
-                if result["validation_result"]:
-                    vr = result["validation_result"]
-                    result["summary"]["validation"] = {
-                        "accuracy": vr.accuracy,
-                        "total_match": vr.total_match,
-                        "count_match": vr.count_match,
-                        "is_valid": vr.is_valid
-                    }
+                self.summarize_file_result(result)
+                self.save_state()
             
             return result
             
@@ -96,15 +108,72 @@ class PDFProcessor:
                 "error": str(e)
             }
     
+    def summarize_file_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Ingest a single file's result into the rollups and duplicate index and add its summary.
+        
+        Rollups and the duplicate index are updated in memory only; callers
+        save them with save_state().
+        
+        Args:
+            result: Result dictionary with a processing_result
+            
+        Returns:
+            The same dictionary with "summary" (and "duplicates" if any) added
+        """
+        pr = result["processing_result"]
+        self._update_rollups(pr)
+        duplicates = self._detect_duplicates(pr)
+        if duplicates:
+            result["duplicates"] = duplicates
+        result["summary"] = {
+            "file_path": pr.file_path,
+            "transactions_extracted": len(pr.transactions),
+            "total_amount": str(pr.total_amount),
+            "pattern_used": pr.pattern_used,
+            "processing_time": pr.processing_time,
+            "success": pr.success
+        }
+        
+        if result["validation_result"]:
+            vr = result["validation_result"]
+            result["summary"]["validation"] = {
+                "accuracy": vr.accuracy,
+                "total_match": vr.total_match,
+                "count_match": vr.count_match,
+                "is_valid": vr.is_valid
+            }
+        
+        return result
+    
+    def save_state(self) -> None:
+        """Persist the rollups and the duplicate index (each only if it has a path)."""
+        self.rollups.save()
+        self.duplicate_index.save()
+    
     def process_batch_folder(self, folder_path: str, pattern_name: Optional[str] = None, 
-                           validate: bool = True) -> Dict[str, Any]:
+                           validate: bool = True, journal_path: Optional[str] = None,
+                           resume: bool = False, incremental: bool = False,
+                           manifest_path: Optional[str] = None, fresh: bool = False) -> Dict[str, Any]:
         """
         Process all PDF files in a folder.
         
+        Collects every file's result; use iter_batch() to stream results
+        with memory independent of the batch size.
+        
         Args:
             folder_path: Path to the folder containing PDF files
             pattern_name: Specific pattern to use, or None for auto-detection
             validate: Whether to validate against ground truth
+            journal_path: Journal recording each completed file, so an
+                interrupted batch can be resumed
+            resume: Reuse the results already in the journal and process
+                only the remaining files
+            incremental: Reuse the stored results of files unchanged since
+                the last incremental run and process only new or changed ones
+            manifest_path: Manifest used by incremental runs (default: in the folder)
+            fresh: Start the journal afresh even if it exists (otherwise an
+                existing journal is only reused with resume)
             
         Returns:
             Dictionary containing batch processing results
@@ -129,99 +198,23 @@ class PDFProcessor:
             
             self.logger.info(f"Found {len(pdf_files)} PDF files to process")
             
-            # Process each file
-            file_results = {}
-            processing_results = []
-            validation_results = []
+            aggregator = BatchAggregator(self._issuer_for_result, keep_results=True)
+            recycles_at_start = self.recycle_count
             
-            for pdf_file in pdf_files:
-                file_name = pdf_file.name
-                self.logger.info(f"Processing {file_name}")
-                
-                try:
-                    if validate and self.validator:
-                        # Process with validation
-                        result = self.pdf_parser.process_with_validation(
-                            str(pdf_file), file_name.replace('.pdf', ''), pattern_name
-                        )
-                        
-                        if result["processing_result"]:
-                            processing_results.append(result["processing_result"])
-                        
-                        if result["validation_result"]:
-                            validation_results.append(result["validation_result"])
-                    else:
-                        # Process without validation
-                        processing_result = self.pdf_parser.process_file(str(pdf_file), pattern_name)
-                        processing_results.append(processing_result)
-                        
-                        result = {
-                            "processing_result": processing_result,
-                            "validation_result": None,
-                            "bill_name": file_name.replace('.pdf', ''),
-                            "overall_success": processing_result.success
-                        }
-                    
-                    file_results[file_name] = result
-                    
-                    if result["overall_success"]:
-                        self.logger.info(f"✓ {file_name}: Success")
-                    else:
-                        self.logger.warning(f"✗ {file_name}: Failed")
-                        
-                except Exception as e:
-                    error_msg = f"Error processing {file_name}: {str(e)}"
-                    self.logger.error(error_msg)
-                    file_results[file_name] = {
-                        "processing_result": None,
-                        "validation_result": None,
-                        "bill_name": file_name.replace('.pdf', ''),
-                        "overall_success": False,
-                        "error": error_msg
-                    }
-            
-            # Generate batch result
-            batch_result = self._create_batch_result(processing_results, time.time() - start_time)
-            
-            # Generate validation report if applicable
-            validation_report = None
-            if validation_results and self.validator:
-                validation_report = self.validator.generate_validation_report(validation_results)
-            
-            # Create summary
-            successful_files = sum(1 for r in file_results.values() if r["overall_success"])
-            total_transactions = sum(
-                len(r["processing_result"].transactions) 
-                for r in file_results.values() 
-                if r["processing_result"] and r["processing_result"].success
-            )
-            
-            summary = {
-                "total_files": len(pdf_files),
-                "successful_files": successful_files,
-                "failed_files": len(pdf_files) - successful_files,
-                "total_transactions": total_transactions,
-                "processing_time": time.time() - start_time,
-                "success_rate": successful_files / len(pdf_files) * 100
-            }
-            
-            if validation_report:
-                summary["validation"] = {
-                    "overall_accuracy": validation_report.overall_accuracy,
-                    "passed_validations": validation_report.passed_validations,
-                    "failed_validations": validation_report.failed_validations,
-                    "pass_rate": validation_report.pass_rate
-                }
+            with self.open_batch_tracking(folder_path, pattern_name, journal_path, resume, fresh,
+                                          incremental, manifest_path) as (journal, manifest):
+                file_results = dict(self.iter_batch(pdf_files, pattern_name, validate, aggregator,
+                                                    journal, manifest))
             
             result = {
-                "summary": summary,
-                "batch_result": batch_result,
-                "validation_report": validation_report,
+                "summary": self.summarize_batch(aggregator, self.recycle_count - recycles_at_start),
+                "batch_result": aggregator.batch_result(),
+                "validation_report": aggregator.validation_report(),
                 "file_results": file_results,
-                "success": successful_files > 0
+                "success": aggregator.successful_files > 0
             }
             
-            self.logger.info(f"Batch processing completed: {successful_files}/{len(pdf_files)} files successful")
+            self.logger.info(f"Batch processing completed: {aggregator.successful_files}/{len(pdf_files)} files successful")
             return result
             
         except Exception as e:
@@ -232,31 +225,373 @@ class PDFProcessor:
                 "processing_time": time.time() - start_time
             }
     
-    def _create_batch_result(self, processing_results: List[ProcessingResult], 
-                           total_time: float) -> BatchResult:
+    def iter_batch(self, pdf_files: Iterable[Path], pattern_name: Optional[str] = None,
+                   validate: bool = True, aggregator: Optional[BatchAggregator] = None,
+                   journal: Optional[BatchJournal] = None,
+                   manifest: Optional[FileManifest] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Process PDF files one at a time, yielding each file's result as it completes.
+        
+        Nothing is retained between files except the rollups, the duplicate
+        index and whatever the aggregator keeps, so a caller that handles
+        each result and drops it runs in memory independent of the batch
+        size. Rollups are saved when the iteration ends, including when the
+        caller stops early.
+        
+        With a journal, each completed file is recorded before it is
+        yielded, and files already in the journal are not processed again:
+        their journaled results are yielded (with "resumed" set) and
+        re-applied to the rollups and duplicate index. With a manifest
+        (see open_manifest()), files unchanged since they were last
+        processed are reused the same way (with "unchanged" set).
+        
+        Args:
+            pdf_files: PDF file paths (any iterable, e.g. a lazy glob)
+            pattern_name: Specific pattern to use, or None for auto-detection
+            validate: Whether to validate against ground truth
+            aggregator: Optional BatchAggregator fed each result before it is yielded
+            journal: Optional BatchJournal of completed files
+            manifest: Optional FileManifest for incremental runs
+            
+        Yields:
+            (file name, result dictionary) for each PDF file
+        """
+        try:
+            for pdf_file in pdf_files:
+                pdf_file = Path(pdf_file)
+                if journal is not None or manifest is not None:
+                    result = self._process_tracked_file(pdf_file, pattern_name, validate, journal, manifest)
+                else:
+                    result = self._process_batch_file(pdf_file, pattern_name, validate)
+                if aggregator is not None:
+                    aggregator.add(result)
+                yield pdf_file.name, result
+        finally:
+            self.save_state()
+    
+    def _process_batch_file(self, pdf_file: Path, pattern_name: Optional[str],
+                            validate: bool) -> Dict[str, Any]:
+        """
+        Process one file of a batch and ingest it into the rollups and duplicate index.
+        
+        Args:
+            pdf_file: Path to the PDF file
+            pattern_name: Specific pattern to use, or None for auto-detection
+            validate: Whether to validate against ground truth
+            
+        Returns:
+            Result dictionary (with "error" if processing raised)
+        """
+        file_name = pdf_file.name
+        self.logger.info(f"Processing {file_name}")
+        
+        try:
+            if validate and self.validator:
+                # Process with validation
+                result = self.pdf_parser.process_with_validation(
+                    str(pdf_file), file_name.replace('.pdf', ''), pattern_name
+                )
+                
+                if result["processing_result"]:
+                    self._update_rollups(result["processing_result"])
+            else:
+                # Process without validation
+                processing_result = self.pdf_parser.process_file(str(pdf_file), pattern_name)
+                self._update_rollups(processing_result)
+                
+                result = {
+                    "processing_result": processing_result,
+                    "validation_result": None,
+                    "bill_name": file_name.replace('.pdf', ''),
+                    "overall_success": processing_result.success
+                }
+            
+            duplicates = self._detect_duplicates(result["processing_result"])
+            if duplicates:
+                result["duplicates"] = duplicates
+            
+            self._recycle_if_over_ceiling()
+            
+            if result["overall_success"]:
+                self.logger.info(f"✓ {file_name}: Success")
+            else:
+                self.logger.warning(f"✗ {file_name}: Failed")
+            
+            return result
+                
+        except Exception as e:
+            error_msg = f"Error processing {file_name}: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "processing_result": None,
+                "validation_result": None,
+                "bill_name": file_name.replace('.pdf', ''),
+                "overall_success": False,
+                "error": error_msg
+            }
+    
+    def _process_tracked_file(self, pdf_file: Path, pattern_name: Optional[str], validate: bool,
+                              journal: Optional[BatchJournal], manifest: Optional[FileManifest]) -> Dict[str, Any]:
         """
-        Create a BatchResult from individual processing results.
+        Reuse a batch file's result from the manifest or journal, or process and record it.
+        
+        Files that raised during processing are journaled but not added to
+        the manifest, so incremental runs retry them; failed files are
+        retried when the batch is resumed.
         
         Args:
-            processing_results: List of ProcessingResult objects
-            total_time: Total processing time
+            pdf_file: Path to the PDF file
+            pattern_name: Specific pattern to use, or None for auto-detection
+            validate: Whether to validate against ground truth
+            journal: Journal of completed files, if any
+            manifest: Manifest of previously processed files, if any
             
         Returns:
-            BatchResult object
+            Result dictionary
         """
-        successful_results = [r for r in processing_results if r.success]
-        failed_results = [r for r in processing_results if not r.success]
+        validating = bool(validate and self.validator)
+        entry = None
+        content_hash = None
+        try:
+            if manifest is not None:
+                entry = manifest.scan(str(pdf_file))
+                content_hash = entry.content_hash
+                result = manifest.stored_result(entry, validating)
+                if result is not None:
+                    return self._reuse_result(pdf_file, result, "unchanged")
+            
+            if journal is not None:
+                content_hash = content_hash or file_sha256(str(pdf_file))
+                result = journal.get(content_hash, validating, pattern_name)
+                if result is not None:
+                    if entry is not None:
+                        manifest.record(entry, result, validating)
+                    return self._reuse_result(pdf_file, result, "resumed")
+        except OSError:
+            # Unreadable files are reported by the regular processing path
+            return self._process_batch_file(pdf_file, pattern_name, validate)
         
-        total_transactions = sum(len(r.transactions) for r in successful_results)
+        result = self._process_batch_file(pdf_file, pattern_name, validate)
+        if journal is not None:
+            journal.record(content_hash, pdf_file.name, result, validating, pattern_name)
+        if entry is not None and result["processing_result"] is not None:
+            manifest.record(entry, result, validating)
         
-        return BatchResult(
-            results=processing_results,
-            total_files=len(processing_results),
-            successful_files=len(successful_results),
-            failed_files=len(failed_results),
-            total_transactions=total_transactions,
-            processing_time=total_time
+        return result
+    
+    def _reuse_result(self, pdf_file: Path, result: Dict[str, Any], reason: str) -> Dict[str, Any]:
+        """
+        Re-apply a stored result to the rollups and duplicate index.
+        
+        Args:
+            pdf_file: Path to the PDF file
+            result: Stored result dictionary
+            reason: "resumed" (from the journal) or "unchanged" (from the manifest); set on the result
+            
+        Returns:
+            The same result dictionary
+        """
+        self.logger.info(f"Reused stored result for {pdf_file.name} ({reason})")
+        result[reason] = True
+        
+        pr = result["processing_result"]
+        if pr:
+            # The stored result may come from an identical file under another name
+            pr.file_path = str(pdf_file)
+            self._update_rollups(pr)
+            if pr.success:
+                self.duplicate_index.add_statement(str(pdf_file.resolve()), pr.transactions)
+        
+        return result
+    
+    @contextmanager
+    def open_batch_tracking(self, folder_path: str, pattern_name: Optional[str] = None,
+                            journal_path: Optional[str] = None, resume: bool = False,
+                            fresh: bool = False, incremental: bool = False,
+                            manifest_path: Optional[str] = None
+                            ) -> Iterator[Tuple[Optional[BatchJournal], Optional[FileManifest]]]:
+        """
+        Open the journal and manifest of a batch, closing them when the block exits.
+        
+        Args:
+            folder_path: Folder the batch reads, where the default journal and manifest live
+            pattern_name: Pattern the batch is run with, or None for auto-detection
+            journal_path: Journal recording each completed file (default:
+                in the folder when resuming, otherwise no journal)
+            resume: Reuse the results already in the journal
+            fresh: Start the journal afresh even if it exists
+            incremental: Open a manifest for an incremental batch
+            manifest_path: Manifest used by incremental runs (default: in the folder)
+            
+        Yields:
+            (journal, manifest), each None when not requested
+            
+        Raises:
+            FileExistsError: If the journal exists and neither resume nor fresh is set
+        """
+        if resume and not journal_path:
+            journal_path = str(Path(folder_path) / DEFAULT_JOURNAL_NAME)
+        if incremental and not manifest_path:
+            manifest_path = str(Path(folder_path) / DEFAULT_MANIFEST_NAME)
+        
+        with ExitStack() as stack:
+            journal = stack.enter_context(BatchJournal(journal_path, resume, fresh)) if journal_path else None
+            manifest = stack.enter_context(self.open_manifest(manifest_path, pattern_name)) if incremental else None
+            yield journal, manifest
+    
+    def open_manifest(self, manifest_path: str, pattern_name: Optional[str] = None) -> FileManifest:
+        """
+        Open a file manifest for incremental batches with this processor's configuration.
+        
+        Stored results are reused only while the patterns, the requested
+        pattern, the extractor overrides and the extractor version match.
+        
+        Args:
+            manifest_path: Path to the manifest JSON file
+            pattern_name: Pattern the batch is run with, or None for auto-detection
+            
+        Returns:
+            FileManifest instance (close it when done)
+        """
+        settings = self.pdf_parser.extraction_settings
+        pattern_hash = json_sha256({
+            "patterns": self.pattern_engine.get_patterns_hash(),
+            "pattern_name": pattern_name,
+            "extractor_overrides": settings.extractor_overrides
+        })
+        return FileManifest(manifest_path, pattern_hash, f"{__version__}/{settings.extractor}")
+    
+    def summarize_batch(self, aggregator: BatchAggregator, recycles: int = 0) -> Dict[str, Any]:
+        """
+        Build the batch summary from a BatchAggregator.
+        
+        Args:
+            aggregator: Aggregator fed every result of the batch
+            recycles: Number of worker recycles during the batch
+            
+        Returns:
+            Summary dictionary with file counts, validation, stage timings,
+            memory, duplicates and rollups
+        """
+        summary = aggregator.summary()
+        summary["stage_timings"] = aggregator.timings.summary()
+        summary["memory"] = aggregator.memory_summary()
+        summary["memory"]["memory_ceiling_mb"] = self.pdf_parser.memory_tracker.ceiling_mb
+        summary["memory"]["recycles"] = recycles
+        
+        summary["duplicates"] = {
+            "duplicate_transactions": aggregator.duplicate_count,
+            "index": self.duplicate_index.get_index_stats()
+        }
+        summary["rollups"] = self.rollups.summary()
+        
+        return summary
+    
+    def _update_rollups(self, processing_result: ProcessingResult):
+        """
+        Apply a processing result to the materialized rollups.
+        
+        Failed results are skipped so a bad re-run never wipes the
+        contribution of an earlier successful one.
+        
+        Args:
+            processing_result: ProcessingResult to ingest
+        """
+        if not processing_result.success:
+            return
+        
+        source_id = str(Path(processing_result.file_path).resolve())
+        self.rollups.ingest(source_id, processing_result.transactions)
+    
+    def _detect_duplicates(self, processing_result: Optional[ProcessingResult]) -> List[Dict[str, Any]]:
+        """
+        Index a processing result and flag rows duplicated from earlier statements.
+        
+        Duplicates are reported (and added as warnings) rather than removed,
+        so the extracted transactions still match the statement itself.
+        
+        Args:
+            processing_result: ProcessingResult to index
+            
+        Returns:
+            List of duplicate match dictionaries
+        """
+        if not processing_result or not processing_result.success:
+            return []
+        
+        source_id = str(Path(processing_result.file_path).resolve())
+        matches = self.duplicate_index.add_statement(source_id, processing_result.transactions)
+        
+        for match in matches:
+            processing_result.warnings.append(
+                f"Possible {match.kind} duplicate of {Path(match.original_source).name}: {match.duplicate}"
+            )
+        
+        return [match.to_dict() for match in matches]
+    
+    def _recycle_if_over_ceiling(self) -> bool:
+        """
+        Recycle the parsing components when RSS exceeds the memory ceiling.
+        
+        Rebuilds the parser, pattern engine and extractor (dropping their
+        caches), then collects garbage and returns freed heap to the OS.
+        Rollups, the duplicate index and the validator are kept.
+        
+        Memory the recycle cannot free (fragmentation, the kept state) may
+        leave RSS above the ceiling, so after a recycle the next one waits
+        until RSS has grown by RECYCLE_MARGIN of the ceiling; otherwise the
+        parser would be rebuilt after every file.
+        
+        Returns:
+            True if the worker was recycled, False otherwise
+        """
+        tracker = self.pdf_parser.memory_tracker
+        if not tracker.over_ceiling():
+            return False
+        
+        rss = current_rss_bytes()
+        if (self._rss_after_recycle is not None and rss is not None
+                and rss - self._rss_after_recycle < RECYCLE_MARGIN * tracker.ceiling_mb * MB):
+            return False
+        
+        self.pattern_engine = PatternEngine()
+        self.pdf_parser = PDFParser(self.config, self.pattern_engine, self.validator)
+        release_memory()
+        self._rss_after_recycle = current_rss_bytes()
+        
+        self.recycle_count += 1
+        self.logger.warning(
+            f"Recycled processing components at {rss / MB:.1f} MB RSS (recycle #{self.recycle_count})"
+            if rss is not None else f"Recycled processing components (recycle #{self.recycle_count})"
         )
+        return True
+    
+    def _issuer_for_result(self, processing_result: ProcessingResult) -> str:
+        """
+        Get the issuer of the pattern used for a result (for per-issuer timings).
+        
+        Args:
+            processing_result: ProcessingResult to classify
+            
+        Returns:
+            Issuer name, or "unknown" when no pattern matched
+        """
+        pattern_info = self.pattern_engine.get_pattern_info(processing_result.pattern_used)
+        if not pattern_info:
+            return "unknown"
+        return pattern_info.get("issuer") or "unknown"
+    
+    def get_rollup_summary(self, top_merchants: int = 10) -> Dict[str, Any]:
+        """
+        Get the dashboard summary from the materialized rollups.
+        
+        Args:
+            top_merchants: Number of merchants to include
+            
+        Returns:
+            Rollup summary dictionary
+        """
+        return self.rollups.summary(top_merchants)
     
     def analyze_pdf(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -429,6 +764,51 @@ class PDFProcessor:
                     report_lines.append(f"  Validation pass rate: {val.get('pass_rate', 0):.1f}%")
                 
                 report_lines.append("")
+                
+                duplicate_summary = summary.get("duplicates", {})
+                if duplicate_summary.get("duplicate_transactions"):
+                    report_lines.append(f"  Possible duplicate transactions: {duplicate_summary['duplicate_transactions']}")
+                    report_lines.append("")
+                
+                memory = summary.get("memory", {})
+                if memory.get("peak_rss_mb") is not None:
+                    report_lines.append("MEMORY:")
+                    report_lines.append(f"  Peak RSS: {memory['peak_rss_mb']:.1f} MB")
+                    if memory.get("peak_traced_mb") is not None:
+                        report_lines.append(
+                            f"  Peak traced allocations: {memory['peak_traced_mb']:.1f} MB ({memory['largest_file']})"
+                        )
+                    if memory.get("recycles"):
+                        report_lines.append(
+                            f"  Worker recycles: {memory['recycles']} (ceiling {memory['memory_ceiling_mb']} MB)"
+                        )
+                    report_lines.append("")
+                
+                stage_timings = summary.get("stage_timings", {})
+                if stage_timings.get("stages"):
+                    report_lines.append("STAGE TIMINGS (per file):")
+                    report_lines.extend(format_stage_histograms(stage_timings["stages"]))
+                    pages = stage_timings.get("pages", {})
+                    if pages.get("count"):
+                        report_lines.append(
+                            f"  Per page: p50 {pages['p50'] * 1000:.1f} ms, p95 {pages['p95'] * 1000:.1f} ms, "
+                            f"p99 {pages['p99'] * 1000:.1f} ms over {pages['count']} pages"
+                        )
+                    for issuer, issuer_stages in stage_timings.get("by_group", {}).items():
+                        report_lines.append(f"  Issuer {issuer}:")
+                        report_lines.extend(format_stage_histograms(issuer_stages, indent="    "))
+                    report_lines.append("")
+                
+                if "rollups" in summary:
+                    rollups = summary["rollups"]
+                    report_lines.append("ROLLUPS (all ingested statements):")
+                    report_lines.append(f"  Statements: {rollups.get('statements', 0)}")
+                    report_lines.append(f"  Total amount: ${rollups.get('total_amount', '0')}")
+                    for card_type, totals in rollups.get("by_card_type", {}).items():
+                        report_lines.append(f"  {card_type}: {totals['transaction_count']} transactions, ${totals['total_amount']}")
+                    for month, totals in rollups.get("by_month", {}).items():
+                        report_lines.append(f"  {month}: {totals['transaction_count']} transactions, ${totals['total_amount']}")
+                    report_lines.append("")
             
             # File details section
             if "file_results" in results:
@@ -449,6 +829,12 @@ class PDFProcessor:
                             report_lines.append(f"    Accuracy: {vr.accuracy:.1%}")
                             report_lines.append(f"    Expected: {vr.expected_count} transactions, ${vr.expected_total}")
                     
+                    for duplicate in file_result.get("duplicates", []):
+                        report_lines.append(
+                            f"    Duplicate ({duplicate['kind']}): {duplicate['duplicate']['description']} "
+                            f"${duplicate['duplicate']['amount']} also in {Path(duplicate['original_source']).name}"
+                        )
+                    
                     if file_result.get("error"):
                         report_lines.append(f"    Error: {file_result['error']}")
                     
@@ -0,0 +1,176 @@
+"""
+Cost estimation and longest-first ordering of batch files for parallel processing.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Iterable, List, Tuple
+
+from ..data.models import ProcessingResult
+from ..data.rollups import infer_card_type
+
+
+# Rates used until a file group has been observed. Only the ratio between
+# estimates matters for ordering, so without history files rank by size.
+DEFAULT_BYTES_PER_PAGE = 100 * 1024
+DEFAULT_SECONDS_PER_PAGE = 0.5
+
+
+class CostModel:
+    """
+    Estimates how long a PDF file will take to process.
+    
+    Files are grouped by issuer card type, inferred from the file name as
+    for the rollups, since that is all that is known before a file is
+    opened. For each group the model learns seconds per page and bytes
+    per page from processed results. A file processed before (same path
+    and size) is estimated from its known page count; any other file from
+    its size. Groups without history fall back to the rates of all files,
+    then to the defaults.
+    
+    History is kept in an optional JSON file: call observe() for each
+    processed result and save() at the end.
+    """
+    
+    def __init__(self, history_path: Optional[str] = None):
+        """
+        Initialize the cost model.
+        
+        Args:
+            history_path: Path to a JSON file persisting the learned timings
+        """
+        self.logger = logging.getLogger(__name__)
+        self.history_path = history_path
+        # group -> [pages, seconds, bytes] totals of observed files
+        self.groups: Dict[str, List[float]] = {}
+        # resolved path -> (size, pages) of observed files
+        self.files: Dict[str, Tuple[int, int]] = {}
+        
+        if history_path and os.path.exists(history_path):
+            self._load()
+    
+    def _load(self) -> None:
+        """Read the learned timings, ignoring a history file that is unreadable."""
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.groups = {group: [float(v) for v in totals] for group, totals in data.get("groups", {}).items()}
+            self.files = {path: (int(size), int(pages)) for path, (size, pages) in data.get("files", {}).items()}
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable cost history {self.history_path}: {str(e)}")
+    
+    def _rates(self, group: str) -> Tuple[float, float]:
+        """Get (seconds per page, bytes per page) of a group."""
+        totals = self.groups.get(group)
+        if not totals or totals[0] <= 0:
+            totals = [sum(t[i] for t in self.groups.values()) for i in range(3)]
+        
+        pages, seconds, size = totals
+        if pages <= 0:
+            return DEFAULT_SECONDS_PER_PAGE, DEFAULT_BYTES_PER_PAGE
+        return seconds / pages, size / pages
+    
+    def estimate(self, pdf_path: str) -> float:
+        """
+        Estimate the processing time of a file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Estimated seconds (0.0 if the file cannot be read)
+        """
+        try:
+            path = str(Path(pdf_path).resolve())
+            size = os.stat(path).st_size
+        except OSError:
+            return 0.0
+        
+        seconds_per_page, bytes_per_page = self._rates(infer_card_type(path))
+        known = self.files.get(path)
+        if known is not None and known[0] == size:
+            pages = known[1]
+        else:
+            pages = size / bytes_per_page
+        return pages * seconds_per_page
+    
+    def observe(self, processing_result: ProcessingResult) -> None:
+        """
+        Learn from a processed file.
+        
+        Only successful results with per-page timings are used, since
+        failed files stop early and say little about the cost of a page.
+        
+        Args:
+            processing_result: ProcessingResult of the file
+        """
+        pages = len(processing_result.page_timings)
+        if not processing_result.success or pages == 0:
+            return
+        
+        try:
+            path = str(Path(processing_result.file_path).resolve())
+            size = os.stat(path).st_size
+        except OSError:
+            return
+        
+        totals = self.groups.setdefault(infer_card_type(path), [0.0, 0.0, 0.0])
+        totals[0] += pages
+        totals[1] += processing_result.processing_time
+        totals[2] += size
+        self.files[path] = (size, pages)
+    
+    def save(self) -> bool:
+        """
+        Write the learned timings atomically to the history file.
+        
+        Returns:
+            True if saved, False if there is no history file or it could not be written
+        """
+        if not self.history_path:
+            return False
+        
+        data = {
+            "groups": self.groups,
+            "files": {path: list(entry) for path, entry in sorted(self.files.items())}
+        }
+        path = Path(self.history_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(temp_path, path)
+            except OSError:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            self.logger.error(f"Could not save cost history to {path}: {str(e)}")
+            return False
+        
+        return True
+
+
+def order_longest_first(pdf_files: Iterable[Path], cost_model: Optional[CostModel] = None) -> List[Tuple[Path, float]]:
+    """
+    Order files by estimated processing time, longest first.
+
+    Handed out in this order to workers that each take the next file when
+    they become idle, the long files start early and the short ones fill
+    the gaps at the end, so no worker is left finishing a large file
+    while the others idle (longest-processing-time-first scheduling).
+
+    Args:
+        pdf_files: PDF file paths
+        cost_model: CostModel to estimate with (default: by file size alone)
+
+    Returns:
+        (path, estimated seconds) pairs, longest first, ties in path order
+    """
+    cost_model = cost_model or CostModel()
+    estimated = [(Path(pdf_file), cost_model.estimate(str(pdf_file))) for pdf_file in pdf_files]
+    return sorted(estimated, key=lambda item: (-item[1], str(item[0])))
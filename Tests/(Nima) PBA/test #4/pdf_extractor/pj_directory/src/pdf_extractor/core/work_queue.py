@@ -0,0 +1,509 @@
+"""
+Shared-filesystem work queue for batch processing across processes and hosts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import socket
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable, Iterator, Tuple, List
+
+from .journal import BatchJournal, read_journal, deserialize_result, entry_succeeded
+from .scheduler import CostModel, order_longest_first
+
+
+# Seconds without a heartbeat after which a leased task is handed to another worker
+DEFAULT_LEASE_TIMEOUT = 300.0
+
+# Attempts a task may use up (lost leases or failed processing) before it is set aside as failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Seconds an idle worker waits before looking for work again
+DEFAULT_POLL_INTERVAL = 5.0
+
+QUEUE_STATES = ("pending", "leased", "done", "failed")
+
+# Digits of the rank that orders pending tasks; estimates are ranked in milliseconds
+RANK_DIGITS = 12
+
+
+def default_worker_id() -> str:
+    """
+    Get a worker id that is unique across the hosts sharing a queue.
+
+    Returns:
+        "<hostname>-<pid>", limited to characters safe in file names
+    """
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", f"{socket.gethostname()}-{os.getpid()}")
+
+
+@dataclass
+class Task:
+    """A PDF file to process, as stored in the queue."""
+    
+    task_id: str
+    path: str
+    pattern_name: Optional[str] = None
+    validate: bool = False
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Task':
+        """Create a task from its dictionary format."""
+        return cls(
+            task_id=data["task_id"],
+            path=data["path"],
+            pattern_name=data.get("pattern_name"),
+            validate=bool(data.get("validate", False))
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert task to dictionary format."""
+        return {
+            "task_id": self.task_id,
+            "path": self.path,
+            "pattern_name": self.pattern_name,
+            "validate": self.validate
+        }
+
+
+@dataclass
+class Lease:
+    """A task claimed by a worker, held for as long as its lease file keeps being touched."""
+    
+    task: Task
+    rank: str
+    attempt: int
+    worker_id: str
+    lease_path: Path
+
+
+class WorkQueue:
+    """
+    Directory-based task queue shared by workers on one or more hosts.
+    
+    The queue needs nothing but a directory that all workers can reach
+    (e.g. over NFS or SMB); there is no broker. Each task is a small JSON
+    file that moves between state directories by atomic rename:
+    
+        pending/<rank>-<task_id>.<attempt>.json
+        leased/<rank>-<task_id>.<attempt>@<worker_id>.json
+        done/<task_id>.json
+        failed/<task_id>.json
+    
+    A worker claims a task by renaming it from pending/ to leased/; when
+    several workers race for the same file, exactly one rename succeeds.
+    Workers claim in name order, and the rank sorts tasks by estimated
+    processing time, longest first (see order_longest_first()), so large
+    files start early and idle workers pick up the small ones at the end.
+    The lease file's modification time is the lease's heartbeat. A lease
+    that has not been touched for lease_timeout seconds (its worker
+    crashed or lost the share) is returned to pending/ by whichever worker
+    notices it, with its attempt count raised. A task whose processing
+    fails is requeued the same way by its worker. After max_attempts it
+    goes to failed/ instead, so a file that keeps failing or killing
+    workers cannot stall the queue. Modification times are compared with the local clock, so
+    lease_timeout must comfortably exceed the clock skew between hosts.
+    
+    Each worker appends its results to its own shard, a BatchJournal in
+    results/<worker_id>.jsonl keyed by task id, so workers never write
+    the same file. A result, failed or not, is recorded before its task
+    is marked done or requeued; a task that was re-run may therefore
+    have several results, and iter_results() picks the best of them.
+    """
+    
+    def __init__(self, queue_dir: str, lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Open (and if needed create) the queue.
+        
+        Args:
+            queue_dir: Queue directory on storage shared by all workers
+            lease_timeout: Seconds without a heartbeat after which a lease expires
+            max_attempts: Attempts a task may have before it is marked failed
+        """
+        self.logger = logging.getLogger(__name__)
+        self.queue_dir = Path(queue_dir)
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max(1, max_attempts)
+        
+        self.results_dir = self.queue_dir / "results"
+        self._temp_dir = self.queue_dir / "tmp"
+        for directory in [self._state_dir(state) for state in QUEUE_STATES] + [self.results_dir, self._temp_dir]:
+            directory.mkdir(parents=True, exist_ok=True)
+    
+    def _state_dir(self, state: str) -> Path:
+        """Get the directory of a task state."""
+        return self.queue_dir / state
+    
+    def _list(self, state: str) -> List[str]:
+        """List the task file names in a state directory."""
+        return sorted(name for name in os.listdir(self._state_dir(state)) if name.endswith(".json"))
+    
+    @staticmethod
+    def _parse_name(name: str) -> Tuple[str, str, int, Optional[str]]:
+        """Split a task file name into (rank, task id, attempt, worker id)."""
+        key, _, worker_id = name[:-len(".json")].partition("@")
+        rank, _, key = key.rpartition("-")
+        task_id, _, attempt = key.partition(".")
+        return rank, task_id, int(attempt or 0), worker_id or None
+    
+    @staticmethod
+    def _rank(estimated_seconds: float) -> str:
+        """Get the rank of a task, which sorts longer estimates first."""
+        limit = 10 ** RANK_DIGITS - 1
+        return str(limit - min(int(estimated_seconds * 1000), limit)).zfill(RANK_DIGITS)
+    
+    @staticmethod
+    def task_id_for(pdf_path: str) -> str:
+        """
+        Get the task id of a PDF file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Hex id derived from the file's absolute path
+        """
+        return hashlib.sha256(str(Path(pdf_path).resolve()).encode("utf-8")).hexdigest()[:32]
+    
+    def enqueue(self, pdf_paths: Iterable[str], pattern_name: Optional[str] = None,
+                validate: bool = False, cost_model: Optional[CostModel] = None) -> int:
+        """
+        Add PDF files to the queue.
+        
+        Files already in the queue, in any state, are skipped, so enqueueing
+        a directory again only adds its new files. Paths are stored as
+        absolute paths and must resolve to the same file on every worker.
+        
+        Args:
+            pdf_paths: Paths of the PDF files
+            pattern_name: Specific pattern to use, or None for auto-detection
+            validate: Whether workers should validate against ground truth
+            cost_model: CostModel ranking the files (default: by file size alone)
+        
+        Returns:
+            Number of tasks added
+        """
+        known = {self._parse_name(name)[1] for state in QUEUE_STATES for name in self._list(state)}
+        
+        added = 0
+        for pdf_path, estimated_seconds in order_longest_first(pdf_paths, cost_model):
+            task = Task(self.task_id_for(str(pdf_path)), str(pdf_path.resolve()), pattern_name, validate)
+            if task.task_id in known:
+                continue
+            
+            # Write the task outside pending/ so a worker never claims a partial file
+            fd, temp_path = tempfile.mkstemp(dir=str(self._temp_dir), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(task.to_dict(), f, ensure_ascii=False)
+            os.rename(temp_path, self._state_dir("pending") / f"{self._rank(estimated_seconds)}-{task.task_id}.0.json")
+            
+            known.add(task.task_id)
+            added += 1
+        
+        self.logger.info(f"Enqueued {added} tasks in {self.queue_dir}")
+        return added
+    
+    def claim(self, worker_id: str) -> Optional[Lease]:
+        """
+        Lease the pending task with the longest estimated processing time.
+        
+        Args:
+            worker_id: Id of the claiming worker (see default_worker_id())
+        
+        Returns:
+            Lease of the claimed task, or None if no task is pending
+        """
+        pending_dir = self._state_dir("pending")
+        for name in self._list("pending"):
+            rank, task_id, attempt, _ = self._parse_name(name)
+            source = pending_dir / name
+            lease_path = self._state_dir("leased") / f"{rank}-{task_id}.{attempt}@{worker_id}.json"
+            try:
+                # Touch first: rename keeps the modification time, which is the heartbeat
+                os.utime(source)
+                os.rename(source, lease_path)
+            except FileNotFoundError:
+                # Another worker claimed it first
+                continue
+            
+            with open(lease_path, "r", encoding="utf-8") as f:
+                task = Task.from_dict(json.load(f))
+            self.logger.info(f"{worker_id} leased {Path(task.path).name} (attempt {attempt + 1})")
+            return Lease(task, rank, attempt, worker_id, lease_path)
+        
+        return None
+    
+    def heartbeat(self, lease: Lease) -> bool:
+        """
+        Renew a lease.
+        
+        Args:
+            lease: Lease to renew
+        
+        Returns:
+            False if the lease was lost (it expired and was reclaimed)
+        """
+        try:
+            os.utime(lease.lease_path)
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def complete(self, lease: Lease, result: Dict[str, Any], shard: BatchJournal,
+                 validated: bool = False) -> bool:
+        """
+        Record a task's result in the worker's shard and mark the task done.
+        
+        Args:
+            lease: Lease of the task
+            result: Result dictionary of the file
+            shard: The worker's result shard (see open_shard())
+            validated: Whether the file was validated against ground truth
+        
+        Returns:
+            False if the lease was lost meanwhile; the result is still
+            recorded, and the task may be completed by another worker too
+        """
+        shard.record(lease.task.task_id, Path(lease.task.path).name, result, validated)
+        try:
+            os.rename(lease.lease_path, self._state_dir("done") / f"{lease.task.task_id}.json")
+            return True
+        except FileNotFoundError:
+            self.logger.warning(f"Lease of {Path(lease.task.path).name} was lost before it completed")
+            return False
+    
+    def fail(self, lease: Lease, result: Dict[str, Any], shard: BatchJournal,
+             validated: bool = False) -> bool:
+        """
+        Record a failed attempt at a task and requeue it, or mark it failed after max_attempts.
+        
+        Args:
+            lease: Lease of the task
+            result: Result dictionary of the failed attempt
+            shard: The worker's result shard (see open_shard())
+            validated: Whether the file was validated against ground truth
+        
+        Returns:
+            True if the task was requeued for another attempt
+        """
+        shard.record(lease.task.task_id, Path(lease.task.path).name, result, validated)
+        reason = result.get("error") or "processing failed"
+        attempt = lease.attempt + 1
+        moved = self._retry(lease.lease_path, lease.rank, lease.task.task_id, attempt,
+                            f"{lease.worker_id} failed to process task {lease.task.task_id}: {reason}")
+        return moved and attempt < self.max_attempts
+    
+    def _retry(self, lease_path: Path, rank: str, task_id: str, attempt: int, reason: str) -> bool:
+        """
+        Move a leased task back to pending/ with its attempt count, or to failed/ after max_attempts.
+        
+        Returns:
+            True if the task was moved, False if the lease was gone
+        """
+        if attempt < self.max_attempts:
+            target = self._state_dir("pending") / f"{rank}-{task_id}.{attempt}.json"
+            self.logger.warning(f"{reason}; requeueing it")
+        else:
+            target = self._state_dir("failed") / f"{task_id}.json"
+            self.logger.error(f"{reason}; marking it failed after {attempt} attempts")
+        
+        try:
+            os.rename(lease_path, target)
+        except FileNotFoundError:
+            # Completed, renewed elsewhere or reclaimed by another worker meanwhile
+            return False
+        return True
+    
+    def release(self, lease: Lease) -> None:
+        """
+        Return a leased task to the queue unprocessed, without counting an attempt.
+        
+        Args:
+            lease: Lease to give up
+        """
+        try:
+            pending_name = f"{lease.rank}-{lease.task.task_id}.{lease.attempt}.json"
+            os.rename(lease.lease_path, self._state_dir("pending") / pending_name)
+        except FileNotFoundError:
+            pass
+    
+    def reclaim_expired(self) -> int:
+        """
+        Return expired leases to the queue, or mark them failed after max_attempts.
+        
+        Returns:
+            Number of leases reclaimed
+        """
+        leased_dir = self._state_dir("leased")
+        deadline = time.time() - self.lease_timeout
+        
+        reclaimed = 0
+        for name in self._list("leased"):
+            lease_path = leased_dir / name
+            try:
+                if os.stat(lease_path).st_mtime > deadline:
+                    continue
+            except FileNotFoundError:
+                continue
+            
+            rank, task_id, attempt, worker_id = self._parse_name(name)
+            if self._retry(lease_path, rank, task_id, attempt + 1,
+                           f"Lease of task {task_id} held by {worker_id} expired"):
+                reclaimed += 1
+        
+        return reclaimed
+    
+    def status(self) -> Dict[str, int]:
+        """
+        Count the tasks in each state.
+        
+        Returns:
+            Dictionary of state name to number of tasks
+        """
+        return {state: len(self._list(state)) for state in QUEUE_STATES}
+    
+    def open_shard(self, worker_id: str) -> BatchJournal:
+        """
+        Open a worker's result shard for appending.
+        
+        Args:
+            worker_id: Id of the worker
+        
+        Returns:
+            BatchJournal keyed by task id
+        """
+        return BatchJournal(str(self.results_dir / f"{worker_id}.jsonl"), resume=True)
+    
+    def iter_results(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Merge the results of all worker shards.
+        
+        A task with several results (re-run after a lost lease or a failed
+        attempt) yields a successful one if there is any, otherwise the
+        latest failure, the latest recorded winning ties. Shards are only
+        read, so this is safe while workers are running; results still
+        being written are picked up by a later merge.
+        
+        Yields:
+            (file name, result dictionary) once per task with a result
+        """
+        # task id -> ((succeeded, recorded at), shard path, byte offset) of the chosen entry
+        chosen: Dict[str, Tuple[Tuple[bool, float], str, int]] = {}
+        for shard_path in sorted(self.results_dir.glob("*.jsonl")):
+            for offset, entry in read_journal(str(shard_path)):
+                preference = (entry_succeeded(entry), float(entry.get("recorded_at", 0.0)))
+                current = chosen.get(entry["hash"])
+                if current is None or preference >= current[0]:
+                    chosen[entry["hash"]] = (preference, str(shard_path), offset)
+        
+        # Read back only the chosen entries, shard by shard in file order
+        offsets: Dict[str, List[int]] = {}
+        for _, shard_path, offset in chosen.values():
+            offsets.setdefault(shard_path, []).append(offset)
+        for shard_path in sorted(offsets):
+            with open(shard_path, "rb") as f:
+                for offset in sorted(offsets[shard_path]):
+                    f.seek(offset)
+                    entry = json.loads(f.readline())
+                    yield entry["file"], deserialize_result(entry["result"])
+
+
+class QueueWorker:
+    """
+    Processes tasks from a WorkQueue until it is drained.
+    
+    While a task is processed, a background thread renews its lease every
+    third of the lease timeout, so only a worker that stops running loses
+    its lease. Run any number of workers, on any hosts, against the same
+    queue.
+    """
+    
+    def __init__(self, queue: WorkQueue, processor, worker_id: Optional[str] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initialize the worker.
+        
+        Args:
+            queue: Queue to take tasks from
+            processor: PDFProcessor that processes the files
+            worker_id: Unique id of this worker (default: hostname and pid)
+            poll_interval: Seconds to wait while other workers hold the remaining tasks
+        """
+        self.logger = logging.getLogger(__name__)
+        self.queue = queue
+        self.processor = processor
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_interval = poll_interval
+    
+    def run(self, max_tasks: Optional[int] = None, wait: bool = False) -> int:
+        """
+        Process tasks until the queue is drained.
+        
+        When nothing is pending but other workers still hold leases, the
+        worker keeps polling so it can take over the tasks of workers that
+        crash. A task interrupted by an exception (e.g. KeyboardInterrupt)
+        is released back to the queue.
+        
+        Args:
+            max_tasks: Stop after this many tasks
+            wait: Keep polling for new tasks even when the queue is drained
+        
+        Returns:
+            Number of tasks processed
+        """
+        processed = 0
+        with self.queue.open_shard(self.worker_id) as shard:
+            while max_tasks is None or processed < max_tasks:
+                lease = self.queue.claim(self.worker_id)
+                if lease is None and self.queue.reclaim_expired():
+                    lease = self.queue.claim(self.worker_id)
+                
+                if lease is None:
+                    if not wait and self.queue.status()["leased"] == 0:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+                
+                self._run_task(lease, shard)
+                processed += 1
+        
+        self.logger.info(f"Worker {self.worker_id} processed {processed} tasks")
+        return processed
+    
+    def _run_task(self, lease: Lease, shard: BatchJournal) -> None:
+        """Process a leased task under a heartbeat and complete it."""
+        task = lease.task
+        validated = bool(task.validate and self.processor.validator)
+        
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(lease, stop), daemon=True)
+        heartbeat.start()
+        try:
+            for _, result in self.processor.iter_batch([task.path], task.pattern_name, validated):
+                processing_result = result.get("processing_result")
+                if processing_result is not None and processing_result.success:
+                    self.queue.complete(lease, result, shard, validated)
+                else:
+                    self.queue.fail(lease, result, shard, validated)
+        except BaseException:
+            self.queue.release(lease)
+            raise
+        finally:
+            stop.set()
+            heartbeat.join()
+    
+    def _heartbeat(self, lease: Lease, stop: threading.Event) -> None:
+        """Renew a lease until stopped or lost."""
+        interval = max(self.queue.lease_timeout / 3, 0.1)
+        while not stop.wait(interval):
+            if not self.queue.heartbeat(lease):
+                self.logger.warning(f"Lost lease of {Path(lease.task.path).name}")
+                return
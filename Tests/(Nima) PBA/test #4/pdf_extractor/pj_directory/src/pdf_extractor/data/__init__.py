@@ -2,8 +2,10 @@
 Data models and structures for the PDF extractor.
 """
 
-from .models import Transaction, ProcessingResult, ValidationResult, BatchResult, Pattern
+from .models import Transaction, ProcessingResult, ValidationResult, BatchResult, Pattern, OCRProfile
 from .parsers import DateParser, AmountParser, DescriptionCleaner
+from .rollups import TransactionRollup
+from .duplicates import DuplicateIndex, DuplicateMatch
 
 __all__ = [
     "Transaction",
@@ -11,7 +13,11 @@ __all__ = [
     "ValidationResult",
     "BatchResult",
     "Pattern",
+    "OCRProfile",
     "DateParser",
     "AmountParser",
-    "DescriptionCleaner"
+    "DescriptionCleaner",
+    "TransactionRollup",
+    "DuplicateIndex",
+    "DuplicateMatch"
 ]
\ No newline at end of file
@@ -0,0 +1,345 @@
+"""
+Cross-statement duplicate transaction detection.
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Tuple
+
+from .models import Transaction
+from .rollups import infer_card_type
+
+
+def normalize_description(description: str) -> str:
+    """
+    Normalize a description for fingerprinting.
+
+    Upper-cases, drops digits and punctuation (reference numbers, city
+    codes glued to names) and collapses whitespace.
+
+    Args:
+        description: Transaction description
+
+    Returns:
+        Normalized description
+    """
+    cleaned = re.sub(r'[^A-Z ]+', ' ', description.upper())
+    return ' '.join(cleaned.split())
+
+
+def transaction_fingerprint(card_type: str, transaction: Transaction) -> str:
+    """
+    Compute the exact-duplicate fingerprint of a transaction.
+
+    Args:
+        card_type: Card type of the statement
+        transaction: Transaction to fingerprint
+
+    Returns:
+        Hex digest over (card, date, amount, normalized description)
+    """
+    key = "|".join([
+        card_type,
+        transaction.date.isoformat(),
+        str(transaction.amount.normalize()),
+        normalize_description(transaction.description)
+    ])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class DuplicateMatch:
+    """A transaction that duplicates one from another statement."""
+
+    kind: str  # "exact" or "near"
+    original_source: str
+    original: Transaction
+    duplicate_source: str
+    duplicate: Transaction
+    similarity: float
+    days_apart: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert duplicate match to dictionary format."""
+        return {
+            "kind": self.kind,
+            "original_source": self.original_source,
+            "original": self.original.to_dict(),
+            "duplicate_source": self.duplicate_source,
+            "duplicate": self.duplicate.to_dict(),
+            "similarity": round(self.similarity, 3),
+            "days_apart": self.days_apart
+        }
+
+
+class DuplicateIndex:
+    """
+    Fingerprint index for finding duplicate rows across statements.
+
+    Exact duplicates are found with a hash lookup. Near duplicates (same
+    card and amount, date within +/- N days, similar merchant) are found by
+    bucketing on (card, amount) and scanning a sorted date window, so each
+    new transaction is only compared against the handful of rows that could
+    possibly match instead of the whole archive.
+
+    With an index path, the indexed transactions are loaded on startup and
+    written back by save(), so duplicates are found across runs.
+    """
+
+    def __init__(self, date_window_days: int = 3, similarity_threshold: float = 0.8,
+                 index_path: Optional[str] = None):
+        """
+        Initialize the duplicate index.
+
+        Args:
+            date_window_days: Max days between near-duplicate transactions
+            similarity_threshold: Min merchant similarity (0.0-1.0) for near duplicates
+            index_path: Optional JSON file used to persist the index
+        """
+        self.logger = logging.getLogger(__name__)
+        self.date_window_days = date_window_days
+        self.similarity_threshold = similarity_threshold
+
+        # fingerprint -> [(source_id, transaction)]
+        self._fingerprints: Dict[str, List[Tuple[str, Transaction]]] = {}
+        # (card_type, amount) -> sorted [(date_ordinal, seq, source_id, merchant, transaction)]
+        self._amount_buckets: Dict[Tuple[str, Decimal], List[Tuple[int, int, str, str, Transaction]]] = {}
+        # source_id -> [(fingerprint, bucket_key, bucket_entry)]
+        self._sources: Dict[str, List[Tuple[str, Tuple[str, Decimal], Tuple]]] = {}
+        self._sequence = 0
+        self.index_path = index_path
+
+        if index_path and Path(index_path).exists():
+            self.load(index_path)
+
+    def add_statement(self, source_id: str, transactions: List[Transaction],
+                      card_type: Optional[str] = None) -> List[DuplicateMatch]:
+        """
+        Index a statement's transactions and report duplicates of earlier statements.
+
+        Re-adding a known source replaces its previous entries. Transactions
+        flagged as duplicates are not indexed, so the index only holds the
+        first occurrence of each row.
+
+        Args:
+            source_id: Stable identifier of the statement (usually its path)
+            transactions: Transactions extracted from the statement
+            card_type: Card type, inferred from the source name if omitted
+
+        Returns:
+            List of duplicate matches found for this statement
+        """
+        card_type = card_type or infer_card_type(source_id)
+        self.remove_statement(source_id)
+
+        matches = []
+        entries = []
+
+        for transaction in transactions:
+            fingerprint = transaction_fingerprint(card_type, transaction)
+            match = self._find_exact(fingerprint, source_id, transaction)
+            if match is None:
+                match = self._find_near(card_type, source_id, transaction)
+
+            if match is not None:
+                matches.append(match)
+                continue
+
+            entries.append(self._insert(card_type, source_id, fingerprint, transaction))
+
+        self._sources[source_id] = entries
+
+        if matches:
+            self.logger.info(f"Found {len(matches)} duplicate transactions in {source_id}")
+
+        return matches
+
+    def remove_statement(self, source_id: str) -> bool:
+        """
+        Remove a statement's transactions from the index.
+
+        Args:
+            source_id: Identifier used when the statement was added
+
+        Returns:
+            True if the statement was indexed, False otherwise
+        """
+        entries = self._sources.pop(source_id, None)
+        if entries is None:
+            return False
+
+        for fingerprint, bucket_key, bucket_entry in entries:
+            owners = self._fingerprints.get(fingerprint, [])
+            owners[:] = [o for o in owners if o[0] != source_id]
+            if not owners:
+                self._fingerprints.pop(fingerprint, None)
+
+            bucket = self._amount_buckets.get(bucket_key, [])
+            position = bisect.bisect_left(bucket, bucket_entry[:2])
+            if position < len(bucket) and bucket[position][:2] == bucket_entry[:2]:
+                del bucket[position]
+            if not bucket:
+                self._amount_buckets.pop(bucket_key, None)
+
+        return True
+
+    def _insert(self, card_type: str, source_id: str, fingerprint: str,
+                transaction: Transaction) -> Tuple[str, Tuple[str, Decimal], Tuple]:
+        """Insert a transaction into the fingerprint and amount indexes."""
+        self._fingerprints.setdefault(fingerprint, []).append((source_id, transaction))
+
+        bucket_key = (card_type, transaction.amount)
+        self._sequence += 1
+        bucket_entry = (
+            transaction.date.toordinal(),
+            self._sequence,
+            source_id,
+            normalize_description(transaction.description),
+            transaction
+        )
+        bisect.insort(self._amount_buckets.setdefault(bucket_key, []), bucket_entry)
+
+        return fingerprint, bucket_key, bucket_entry
+
+    def _find_exact(self, fingerprint: str, source_id: str,
+                    transaction: Transaction) -> Optional[DuplicateMatch]:
+        """Look up an exact duplicate from another statement."""
+        for owner_source, original in self._fingerprints.get(fingerprint, []):
+            if owner_source != source_id:
+                return DuplicateMatch(
+                    kind="exact",
+                    original_source=owner_source,
+                    original=original,
+                    duplicate_source=source_id,
+                    duplicate=transaction,
+                    similarity=1.0,
+                    days_apart=0
+                )
+        return None
+
+    def _find_near(self, card_type: str, source_id: str,
+                   transaction: Transaction) -> Optional[DuplicateMatch]:
+        """Scan the sorted date window of the (card, amount) bucket for a near duplicate."""
+        bucket = self._amount_buckets.get((card_type, transaction.amount))
+        if not bucket:
+            return None
+
+        ordinal = transaction.date.toordinal()
+        merchant = normalize_description(transaction.description)
+        start = bisect.bisect_left(bucket, (ordinal - self.date_window_days,))
+        end = bisect.bisect_right(bucket, (ordinal + self.date_window_days + 1,))
+
+        best = None
+        for candidate_ordinal, _, owner_source, candidate_merchant, original in bucket[start:end]:
+            if owner_source == source_id:
+                continue
+
+            similarity = SequenceMatcher(None, merchant, candidate_merchant).ratio()
+            if similarity >= self.similarity_threshold and (best is None or similarity > best.similarity):
+                best = DuplicateMatch(
+                    kind="near",
+                    original_source=owner_source,
+                    original=original,
+                    duplicate_source=source_id,
+                    duplicate=transaction,
+                    similarity=similarity,
+                    days_apart=abs(ordinal - candidate_ordinal)
+                )
+
+        return best
+
+    def save(self, file_path: Optional[str] = None) -> bool:
+        """
+        Persist the indexed transactions of every statement to JSON.
+
+        Args:
+            file_path: Target file, defaults to the configured index path
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        file_path = file_path or self.index_path
+        if not file_path:
+            return False
+
+        try:
+            data = {
+                "sources": {
+                    source_id: [
+                        {"card_type": bucket_key[0], "transaction": bucket_entry[4].to_dict()}
+                        for _, bucket_key, bucket_entry in entries
+                    ]
+                    for source_id, entries in self._sources.items()
+                }
+            }
+
+            path = Path(file_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+            self.logger.info(f"Saved duplicate index of {len(self._sources)} statements to {file_path}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error saving duplicate index to {file_path}: {str(e)}")
+            return False
+
+    def load(self, file_path: str) -> bool:
+        """
+        Load a persisted index, replacing the current one.
+
+        The stored transactions were first occurrences when they were
+        indexed, so they are re-inserted without checking for duplicates.
+
+        Args:
+            file_path: JSON file written by save()
+
+        Returns:
+            True if loaded successfully, False otherwise
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            self._fingerprints = {}
+            self._amount_buckets = {}
+            self._sources = {}
+            self._sequence = 0
+
+            for source_id, stored in data.get("sources", {}).items():
+                entries = []
+                for item in stored:
+                    transaction = Transaction.from_dict(item["transaction"])
+                    fingerprint = transaction_fingerprint(item["card_type"], transaction)
+                    entries.append(self._insert(item["card_type"], source_id, fingerprint, transaction))
+                self._sources[source_id] = entries
+
+            self.logger.info(f"Loaded duplicate index of {len(self._sources)} statements from {file_path}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error loading duplicate index from {file_path}: {str(e)}")
+            return False
+
+    def get_index_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the index.
+
+        Returns:
+            Dictionary containing index statistics
+        """
+        return {
+            "statements": len(self._sources),
+            "indexed_transactions": sum(len(entries) for entries in self._sources.values()),
+            "amount_buckets": len(self._amount_buckets),
+            "date_window_days": self.date_window_days,
+            "similarity_threshold": self.similarity_threshold
+        }
@@ -19,6 +19,17 @@ class Transaction:
     raw_text: str = ""
     confidence: float = 1.0
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
+        """Create a transaction from its dictionary format."""
+        return cls(
+            date=date.fromisoformat(data["date"]),
+            description=data["description"],
+            amount=Decimal(str(data["amount"])),
+            raw_text=data.get("raw_text", ""),
+            confidence=data.get("confidence", 1.0)
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert transaction to dictionary format."""
         return {
@@ -42,6 +53,42 @@ class Transaction:
         return f"{self.date} | {self.description} | ${self.amount:,.2f}"
 
 
+# Preprocessing steps an OCR profile can request; applied as grayscale, deskew, crop, binarize
+OCR_PREPROCESSING_STEPS = ("grayscale", "binarize", "deskew")
+
+
+@dataclass
+class OCRProfile:
+    """OCR settings for a statement layout: where transactions are and how to read them."""
+    
+    regions: List[List[float]] = field(default_factory=list)  # [x0, top, x1, bottom] as page fractions
+    dpi: Optional[int] = None  # Overrides ocr.dpi
+    preprocessing: List[str] = field(default_factory=list)  # Steps from OCR_PREPROCESSING_STEPS
+    binarize_threshold: int = 160  # Gray level (0-255) below which pixels become black
+    tesseract_config: Optional[str] = None  # Overrides ocr.tesseract_config, e.g. "--psm 6"
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'OCRProfile':
+        """Create an OCR profile from its dictionary format."""
+        return cls(
+            regions=[list(region) for region in data.get("regions", [])],
+            dpi=data.get("dpi"),
+            preprocessing=list(data.get("preprocessing", [])),
+            binarize_threshold=data.get("binarize_threshold", 160),
+            tesseract_config=data.get("tesseract_config")
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert OCR profile to dictionary format."""
+        return {
+            "regions": [list(region) for region in self.regions],
+            "dpi": self.dpi,
+            "preprocessing": list(self.preprocessing),
+            "binarize_threshold": self.binarize_threshold,
+            "tesseract_config": self.tesseract_config
+        }
+
+
 @dataclass
 class Pattern:
     """Represents a PDF pattern for transaction extraction."""
@@ -54,10 +101,17 @@ class Pattern:
     amount_format: str
     description_cleanup_rules: List[str] = field(default_factory=list)
     confidence_threshold: float = 0.8
+    table_columns: Dict[str, Any] = field(default_factory=dict)  # Role -> column index or header name
+    ocr_profile: Optional[OCRProfile] = None  # Regions, DPI and preprocessing for OCR'd pages
+    
+    @property
+    def uses_tables(self) -> bool:
+        """Check whether transactions are read from tables instead of regex matches."""
+        return bool(self.table_columns)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert pattern to dictionary format."""
-        return {
+        data = {
             "name": self.name,
             "issuer": self.issuer,
             "card_type": self.card_type,
@@ -67,6 +121,11 @@ class Pattern:
             "description_cleanup_rules": self.description_cleanup_rules,
             "confidence_threshold": self.confidence_threshold
         }
+        if self.table_columns:
+            data["table_columns"] = dict(self.table_columns)
+        if self.ocr_profile:
+            data["ocr_profile"] = self.ocr_profile.to_dict()
+        return data
 
 
 @dataclass
@@ -80,6 +139,10 @@ class ProcessingResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     success: bool = True
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+    page_timings: List[float] = field(default_factory=list)
+    peak_traced_mb: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
     
     @property
     def transaction_count(self) -> int:
@@ -91,6 +154,23 @@ class ProcessingResult:
         """Get the total amount of all transactions."""
         return sum(t.amount for t in self.transactions)
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ProcessingResult':
+        """Create a processing result from its dictionary format (derived fields are ignored)."""
+        return cls(
+            file_path=data["file_path"],
+            transactions=[Transaction.from_dict(t) for t in data.get("transactions", [])],
+            pattern_used=data.get("pattern_used"),
+            processing_time=data.get("processing_time", 0.0),
+            errors=list(data.get("errors", [])),
+            warnings=list(data.get("warnings", [])),
+            success=data.get("success", True),
+            stage_timings=dict(data.get("stage_timings", {})),
+            page_timings=list(data.get("page_timings", [])),
+            peak_traced_mb=data.get("peak_traced_mb"),
+            peak_rss_mb=data.get("peak_rss_mb")
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary format."""
         return {
@@ -102,7 +182,11 @@ class ProcessingResult:
             "total_amount": str(self.total_amount),
             "errors": self.errors,
             "warnings": self.warnings,
-            "success": self.success
+            "success": self.success,
+            "stage_timings": self.stage_timings,
+            "page_timings": self.page_timings,
+            "peak_traced_mb": self.peak_traced_mb,
+            "peak_rss_mb": self.peak_rss_mb
         }
 
 
@@ -135,6 +219,20 @@ class ValidationResult:
         """Check if validation passed."""
         return self.total_match and self.count_match and self.accuracy >= 0.95
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ValidationResult':
+        """Create a validation result from its dictionary format (derived fields are ignored)."""
+        return cls(
+            bill_name=data["bill_name"],
+            expected_total=Decimal(str(data["expected_total"])),
+            actual_total=Decimal(str(data["actual_total"])),
+            expected_count=int(data["expected_count"]),
+            actual_count=int(data["actual_count"]),
+            accuracy=data["accuracy"],
+            missing_transactions=[Transaction.from_dict(t) for t in data.get("missing_transactions", [])],
+            extra_transactions=[Transaction.from_dict(t) for t in data.get("extra_transactions", [])]
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert validation result to dictionary format."""
         return {
@@ -162,6 +260,7 @@ class BatchResult:
     failed_files: int
     total_transactions: int
     processing_time: float
+    aggregate_amount: Optional[Decimal] = None  # Running total when results are not retained
     
     @property
     def success_rate(self) -> float:
@@ -173,6 +272,8 @@ class BatchResult:
     @property
     def total_amount(self) -> Decimal:
         """Get total amount across all successful files."""
+        if self.aggregate_amount is not None:
+            return self.aggregate_amount
         return sum(r.total_amount for r in self.results if r.success)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -0,0 +1,311 @@
+"""
+Incrementally maintained transaction rollups for dashboard-style summaries.
+"""
+
+import json
+import logging
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+from .models import Transaction
+
+
+# Dimensions maintained by the rollup. "card_month" is the composite
+# (card type, month) key most summaries are sliced by.
+ROLLUP_DIMENSIONS = ("card_type", "month", "merchant", "card_month")
+
+
+def infer_card_type(file_path: str) -> str:
+    """
+    Infer the card type from a statement file name (e.g. "MC - FEB-2025.pdf").
+
+    Args:
+        file_path: Path or name of the statement file
+
+    Returns:
+        Card type code ("MC", "VS") or "UNKNOWN"
+    """
+    name = Path(file_path).name.upper()
+    for card_type in ("MC", "VS"):
+        if name.startswith(card_type):
+            return card_type
+    return "UNKNOWN"
+
+
+def normalize_merchant(description: str) -> str:
+    """
+    Normalize a transaction description into a merchant key.
+
+    Args:
+        description: Cleaned transaction description
+
+    Returns:
+        Upper-cased, whitespace-collapsed merchant key
+    """
+    return " ".join(description.upper().split())
+
+
+class TransactionRollup:
+    """
+    Materialized rollups keyed by card type, month and merchant.
+
+    Each ingested statement's contribution is remembered, so re-processing
+    a statement applies only the old/new delta instead of rebuilding the
+    aggregates. Summaries are O(rollup size), not O(all transactions).
+    """
+
+    def __init__(self, rollup_path: Optional[str] = None):
+        """
+        Initialize the rollup store.
+
+        Args:
+            rollup_path: Optional JSON file used to persist the rollups
+        """
+        self.logger = logging.getLogger(__name__)
+        self.rollup_path = rollup_path
+
+        # dimension -> key -> [transaction_count, amount]
+        self._buckets: Dict[str, Dict[str, List[Any]]] = {d: {} for d in ROLLUP_DIMENSIONS}
+        # source_id -> dimension -> key -> [transaction_count, amount]
+        self._sources: Dict[str, Dict[str, Dict[str, List[Any]]]] = {}
+        self._total_count = 0
+        self._total_amount = Decimal('0')
+
+        if rollup_path and Path(rollup_path).exists():
+            self.load(rollup_path)
+
+    def ingest(self, source_id: str, transactions: List[Transaction],
+               card_type: Optional[str] = None) -> None:
+        """
+        Ingest (or re-ingest) the transactions of one statement.
+
+        Args:
+            source_id: Stable identifier of the statement (usually its path)
+            transactions: Transactions extracted from the statement
+            card_type: Card type, inferred from the source name if omitted
+        """
+        card_type = card_type or infer_card_type(source_id)
+        new_contribution = self._build_contribution(transactions, card_type)
+        old_contribution = self._sources.get(source_id)
+
+        if old_contribution:
+            self._apply(old_contribution, -1)
+        self._apply(new_contribution, 1)
+        self._sources[source_id] = new_contribution
+
+        action = "Re-ingested" if old_contribution else "Ingested"
+        self.logger.debug(f"{action} {len(transactions)} transactions from {source_id}")
+
+    def remove(self, source_id: str) -> bool:
+        """
+        Remove a statement's contribution from the rollups.
+
+        Args:
+            source_id: Identifier used when the statement was ingested
+
+        Returns:
+            True if the statement was known, False otherwise
+        """
+        contribution = self._sources.pop(source_id, None)
+        if contribution is None:
+            return False
+
+        self._apply(contribution, -1)
+        return True
+
+    def _build_contribution(self, transactions: List[Transaction],
+                            card_type: str) -> Dict[str, Dict[str, List[Any]]]:
+        """Aggregate a statement's transactions per dimension key."""
+        contribution: Dict[str, Dict[str, List[Any]]] = {d: {} for d in ROLLUP_DIMENSIONS}
+
+        for transaction in transactions:
+            month = transaction.date.strftime("%Y-%m")
+            keys = {
+                "card_type": card_type,
+                "month": month,
+                "merchant": normalize_merchant(transaction.description),
+                "card_month": f"{card_type}|{month}"
+            }
+
+            for dimension, key in keys.items():
+                bucket = contribution[dimension].setdefault(key, [0, Decimal('0')])
+                bucket[0] += 1
+                bucket[1] += transaction.amount
+
+        return contribution
+
+    def _apply(self, contribution: Dict[str, Dict[str, List[Any]]], sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a contribution from the buckets."""
+        for dimension, entries in contribution.items():
+            buckets = self._buckets[dimension]
+
+            for key, (count, amount) in entries.items():
+                bucket = buckets.setdefault(key, [0, Decimal('0')])
+                bucket[0] += sign * count
+                bucket[1] += sign * amount
+
+                # Drop empty buckets so summaries stay proportional to live data
+                if bucket[0] == 0:
+                    del buckets[key]
+
+        # Every transaction lands in exactly one card_type bucket
+        for count, amount in contribution.get("card_type", {}).values():
+            self._total_count += sign * count
+            self._total_amount += sign * amount
+
+    @property
+    def total_amount(self) -> Decimal:
+        """Get the total amount across all ingested statements."""
+        return self._total_amount
+
+    @property
+    def transaction_count(self) -> int:
+        """Get the number of transactions across all ingested statements."""
+        return self._total_count
+
+    @property
+    def statement_count(self) -> int:
+        """Get the number of ingested statements."""
+        return len(self._sources)
+
+    def get_rollup(self, dimension: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the rollup for a single dimension.
+
+        Args:
+            dimension: One of ROLLUP_DIMENSIONS
+
+        Returns:
+            Dictionary mapping keys to transaction count and total amount
+        """
+        if dimension not in self._buckets:
+            raise ValueError(f"Unknown rollup dimension: {dimension}. Supported: {list(ROLLUP_DIMENSIONS)}")
+
+        return {
+            key: {"transaction_count": count, "total_amount": amount}
+            for key, (count, amount) in sorted(self._buckets[dimension].items())
+        }
+
+    def by_card_type(self) -> Dict[str, Dict[str, Any]]:
+        """Get totals per card type."""
+        return self.get_rollup("card_type")
+
+    def by_month(self) -> Dict[str, Dict[str, Any]]:
+        """Get totals per month (YYYY-MM)."""
+        return self.get_rollup("month")
+
+    def by_merchant(self, top: Optional[int] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get totals per merchant, largest amount first.
+
+        Args:
+            top: Optional limit on the number of merchants returned
+
+        Returns:
+            List of (merchant, totals) tuples
+        """
+        merchants = sorted(
+            self.get_rollup("merchant").items(),
+            key=lambda item: item[1]["total_amount"],
+            reverse=True
+        )
+        return merchants[:top] if top else merchants
+
+    def summary(self, top_merchants: int = 10) -> Dict[str, Any]:
+        """
+        Get a dashboard-style summary of the rollups.
+
+        Args:
+            top_merchants: Number of merchants to include
+
+        Returns:
+            Summary dictionary with string amounts (JSON friendly)
+        """
+        def _stringify(rollup: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+            return {
+                key: {"transaction_count": v["transaction_count"], "total_amount": str(v["total_amount"])}
+                for key, v in rollup.items()
+            }
+
+        return {
+            "statements": self.statement_count,
+            "transaction_count": self.transaction_count,
+            "total_amount": str(self.total_amount),
+            "by_card_type": _stringify(self.by_card_type()),
+            "by_month": _stringify(self.by_month()),
+            "top_merchants": _stringify(dict(self.by_merchant(top_merchants)))
+        }
+
+    def save(self, file_path: Optional[str] = None) -> bool:
+        """
+        Persist the rollups (including per-statement contributions) to JSON.
+
+        Args:
+            file_path: Target file, defaults to the configured rollup path
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        file_path = file_path or self.rollup_path
+        if not file_path:
+            return False
+
+        try:
+            data = {
+                "sources": {
+                    source_id: {
+                        dimension: {key: [count, str(amount)] for key, (count, amount) in entries.items()}
+                        for dimension, entries in contribution.items()
+                    }
+                    for source_id, contribution in self._sources.items()
+                }
+            }
+
+            path = Path(file_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+            self.logger.info(f"Saved rollups for {self.statement_count} statements to {file_path}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error saving rollups to {file_path}: {str(e)}")
+            return False
+
+    def load(self, file_path: str) -> bool:
+        """
+        Load persisted rollups, rebuilding the buckets from the stored contributions.
+
+        Args:
+            file_path: JSON file written by save()
+
+        Returns:
+            True if loaded successfully, False otherwise
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            self._buckets = {d: {} for d in ROLLUP_DIMENSIONS}
+            self._sources = {}
+            self._total_count = 0
+            self._total_amount = Decimal('0')
+
+            for source_id, stored in data.get("sources", {}).items():
+                contribution = {d: {} for d in ROLLUP_DIMENSIONS}
+                for dimension, entries in stored.items():
+                    if dimension in contribution:
+                        contribution[dimension] = {
+                            key: [int(count), Decimal(amount)] for key, (count, amount) in entries.items()
+                        }
+                self._apply(contribution, 1)
+                self._sources[source_id] = contribution
+
+            self.logger.info(f"Loaded rollups for {self.statement_count} statements from {file_path}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error loading rollups from {file_path}: {str(e)}")
+            return False
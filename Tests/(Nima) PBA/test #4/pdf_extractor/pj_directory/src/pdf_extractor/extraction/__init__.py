@@ -3,7 +3,12 @@ PDF text extraction modules.
 """
 
 from .pdfplumber_extractor import PDFPlumberExtractor
+from .registry import register_extractor, get_extractor, available_extractors, registered_extractors
 
 __all__ = [
-    "PDFPlumberExtractor"
+    "PDFPlumberExtractor",
+    "register_extractor",
+    "get_extractor",
+    "available_extractors",
+    "registered_extractors"
 ]
\ No newline at end of file
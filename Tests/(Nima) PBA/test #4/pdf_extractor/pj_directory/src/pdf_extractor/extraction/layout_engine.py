@@ -0,0 +1,157 @@
+"""
+Character-to-line grouping for layout extraction, vectorized with NumPy when available.
+"""
+
+from typing import List, Dict, Any
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+# Below this many characters the array setup costs more than it saves
+VECTORIZE_MIN_CHARS = 64
+
+
+def group_chars_into_lines(chars: List[Dict[str, Any]], y_tolerance: float = 3,
+                           use_numpy: bool = True) -> List[Dict[str, Any]]:
+    """
+    Group character data into lines based on y-coordinates.
+
+    Characters are ordered by descending top, then x0. A new line starts
+    whenever a character's top differs from the previous character's top by
+    more than y_tolerance, so lines chain through small drifts. Both
+    implementations produce identical output.
+
+    Args:
+        chars: List of character dictionaries from pdfplumber
+        y_tolerance: Maximum top difference between consecutive characters of a line
+        use_numpy: Use the vectorized implementation when NumPy is installed
+
+    Returns:
+        List of line dictionaries with text and position info
+    """
+    if not chars:
+        return []
+
+    if use_numpy and HAS_NUMPY and len(chars) >= VECTORIZE_MIN_CHARS:
+        return _group_chars_numpy(chars, y_tolerance)
+
+    return _group_chars_python(chars, y_tolerance)
+
+
+def _group_chars_python(chars: List[Dict[str, Any]], y_tolerance: float) -> List[Dict[str, Any]]:
+    """Group characters into lines one character at a time."""
+    # Sort characters by y-coordinate (top to bottom) then x-coordinate (left to right)
+    sorted_chars = sorted(chars, key=lambda c: (-c['top'], c['x0']))
+
+    lines = []
+    current_line = []
+    current_y = None
+
+    for char in sorted_chars:
+        char_y = char['top']
+
+        # Check if this character belongs to the current line
+        if current_y is None or abs(char_y - current_y) <= y_tolerance:
+            current_line.append(char)
+        else:
+            # Start a new line
+            lines.append(create_line_dict(current_line))
+            current_line = [char]
+        current_y = char_y
+
+    # Add the last line
+    if current_line:
+        lines.append(create_line_dict(current_line))
+
+    return lines
+
+
+def _group_chars_numpy(chars: List[Dict[str, Any]], y_tolerance: float) -> List[Dict[str, Any]]:
+    """Group characters into lines with array sorts, a diff/cumsum row split and grouped reductions."""
+    count = len(chars)
+    top = np.fromiter((c['top'] for c in chars), dtype=np.float64, count=count)
+    bottom = np.fromiter((c['bottom'] for c in chars), dtype=np.float64, count=count)
+    x0 = np.fromiter((c['x0'] for c in chars), dtype=np.float64, count=count)
+    x1 = np.fromiter((c['x1'] for c in chars), dtype=np.float64, count=count)
+
+    # Stable sort by (-top, x0), as sorted() does with the tuple key
+    order = np.lexsort((x0, -top))
+
+    # Tops are non-increasing after the sort, so consecutive gaps are >= 0
+    sorted_top = top[order]
+    breaks = (sorted_top[:-1] - sorted_top[1:]) > y_tolerance
+    line_ids = np.concatenate(([0], np.cumsum(breaks)))
+
+    # Within each line, stable sort by x0 (the per-line re-sort in create_line_dict)
+    order = order[np.lexsort((x0[order], line_ids))]
+
+    starts = np.flatnonzero(np.concatenate(([True], breaks)))
+    ends = np.append(starts[1:], count)
+
+    line_x0 = np.minimum.reduceat(x0[order], starts).tolist()
+    line_x1 = np.maximum.reduceat(x1[order], starts).tolist()
+    line_top = np.minimum.reduceat(top[order], starts).tolist()
+    line_bottom = np.maximum.reduceat(bottom[order], starts).tolist()
+
+    texts = [chars[i]['text'] for i in order.tolist()]
+
+    lines = []
+    for n, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        lines.append({
+            'text': ''.join(texts[start:end]).strip(),
+            'x0': line_x0[n],
+            'x1': line_x1[n],
+            'top': line_top[n],
+            'bottom': line_bottom[n],
+            'width': line_x1[n] - line_x0[n],
+            'height': line_bottom[n] - line_top[n],
+            'char_count': end - start
+        })
+
+    return lines
+
+
+def create_line_dict(chars: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Create a line dictionary from a list of characters.
+
+    Args:
+        chars: List of character dictionaries
+
+    Returns:
+        Dictionary containing line information
+    """
+    if not chars:
+        return {}
+
+    # Sort characters by x-coordinate (left to right)
+    sorted_chars = sorted(chars, key=lambda c: c['x0'])
+
+    # Extract text and bounding box in a single pass
+    x0 = x1 = top = bottom = None
+    texts = []
+    for char in sorted_chars:
+        texts.append(char['text'])
+        if x0 is None:
+            x0, x1, top, bottom = char['x0'], char['x1'], char['top'], char['bottom']
+        else:
+            x0 = min(x0, char['x0'])
+            x1 = max(x1, char['x1'])
+            top = min(top, char['top'])
+            bottom = max(bottom, char['bottom'])
+
+    return {
+        'text': ''.join(texts).strip(),
+        'x0': x0,
+        'x1': x1,
+        'top': top,
+        'bottom': bottom,
+        'width': x1 - x0,
+        'height': bottom - top,
+        'char_count': len(sorted_chars)
+    }
@@ -0,0 +1,485 @@
+"""
+Hybrid text-layer/OCR extraction for statements with scanned pages.
+"""
+
+import os
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Iterator, Tuple
+from pathlib import Path
+
+import pdfplumber
+import pytesseract
+from pdf2image import convert_from_path
+from PIL import Image, ImageOps, ImageStat
+
+from ..config.settings import OCRSettings
+from ..data.models import OCRProfile
+from ..utils.timing import StageTimer
+from ..utils.exceptions import PDFProcessingError
+from .pdfplumber_extractor import PDFPlumberExtractor
+
+
+# PDF user space units per inch, used to map OCR pixel boxes back to page coordinates
+POINTS_PER_INCH = 72
+
+# Skew angles tried by deskew(), in degrees either side of level
+DESKEW_MAX_ANGLE = 5.0
+DESKEW_STEP = 0.5
+
+# Width pages are reduced to while estimating skew
+DESKEW_SAMPLE_WIDTH = 400
+
+
+def estimate_skew(image) -> float:
+    """
+    Estimate the rotation that levels a page's text lines.
+
+    Uses the projection profile: text rows give the sharpest row-sum
+    profile (highest variance) when they are horizontal.
+
+    Args:
+        image: PIL image of the page
+
+    Returns:
+        Counter-clockwise correction angle in degrees
+    """
+    gray = image.convert('L')
+    if gray.width > DESKEW_SAMPLE_WIDTH:
+        height = max(1, round(gray.height * DESKEW_SAMPLE_WIDTH / gray.width))
+        gray = gray.resize((DESKEW_SAMPLE_WIDTH, height))
+
+    # Ink becomes bright so the black fill of rotated corners adds nothing
+    inverted = ImageOps.invert(gray)
+
+    best_angle, best_score = 0.0, None
+    steps = int(DESKEW_MAX_ANGLE / DESKEW_STEP)
+
+    for step in range(-steps, steps + 1):
+        angle = step * DESKEW_STEP
+        rotated = inverted.rotate(angle, resample=Image.BILINEAR, fillcolor=0)
+        row_profile = rotated.resize((1, rotated.height), resample=Image.BOX)
+        score = ImageStat.Stat(row_profile).var[0]
+        if best_score is None or score > best_score:
+            best_angle, best_score = angle, score
+
+    return best_angle
+
+
+def deskew(image):
+    """
+    Rotate a page so its text lines are level.
+
+    Args:
+        image: PIL image of the page
+
+    Returns:
+        Deskewed image (the same image if it is already level)
+    """
+    angle = estimate_skew(image)
+    if angle == 0:
+        return image
+    return image.rotate(angle, resample=Image.BICUBIC, fillcolor='white')
+
+
+def binarize(image, threshold: int):
+    """
+    Convert an image to pure black and white.
+
+    Args:
+        image: PIL image
+        threshold: Gray level (0-255) below which pixels become black
+
+    Returns:
+        Bilevel image
+    """
+    return image.convert('L').point(lambda value: 255 if value >= threshold else 0, mode='1')
+
+
+class PageOCR:
+    """Renders single PDF pages and reads them with Tesseract."""
+    
+    def __init__(self, ocr_settings: Optional[OCRSettings] = None):
+        """
+        Initialize the page OCR.
+        
+        Args:
+            ocr_settings: OCR settings, defaults to OCRSettings()
+        """
+        self.logger = logging.getLogger(__name__)
+        self.settings = ocr_settings or OCRSettings()
+        
+        if self.settings.tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = self.settings.tesseract_cmd
+    
+    def _dpi(self, profile: Optional[OCRProfile]) -> int:
+        """Get the rendering resolution, preferring the profile's."""
+        return profile.dpi if profile and profile.dpi else self.settings.dpi
+    
+    def _config(self, profile: Optional[OCRProfile]) -> str:
+        """Get the Tesseract options, preferring the profile's."""
+        if profile and profile.tesseract_config is not None:
+            return profile.tesseract_config
+        return self.settings.tesseract_config
+    
+    def render_page(self, pdf_path: str, page_number: int, profile: Optional[OCRProfile] = None):
+        """
+        Render one page to an image.
+        
+        The whole page is rendered even when the profile declares regions:
+        deskewing needs the full page, and prepare_regions() crops the
+        regions afterwards.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_number: Page to render (1-based)
+            profile: Optional OCR profile providing DPI and grayscale rendering
+        
+        Returns:
+            PIL image of the page
+        
+        Raises:
+            PDFProcessingError: If Poppler renders no image for the page
+        """
+        images = convert_from_path(
+            pdf_path,
+            dpi=self._dpi(profile),
+            first_page=page_number,
+            last_page=page_number,
+            grayscale=bool(profile) and "grayscale" in profile.preprocessing,
+            poppler_path=self.settings.poppler_path
+        )
+        if not images:
+            raise PDFProcessingError(f"Could not render page {page_number}", file_path=pdf_path,
+                                     page_number=page_number)
+        return images[0]
+    
+    def prepare_regions(self, image, profile: Optional[OCRProfile] = None) -> List[Tuple[Any, Tuple[int, int]]]:
+        """
+        Apply a profile's preprocessing and crop its regions from a rendered page.
+        
+        Deskewing runs on the whole page before cropping so regions line
+        up with the levelled layout; binarization runs on the crops.
+        
+        Args:
+            image: PIL image of the page
+            profile: Optional OCR profile
+        
+        Returns:
+            List of (region image, (x offset, y offset) in pixels); the whole
+            page if the profile declares no regions
+        """
+        if profile is None:
+            return [(image, (0, 0))]
+        
+        if "deskew" in profile.preprocessing:
+            image = deskew(image)
+        
+        regions = [(image, (0, 0))]
+        if profile.regions:
+            width, height = image.size
+            regions = []
+            for x0, top, x1, bottom in profile.regions:
+                box = (int(x0 * width), int(top * height), int(x1 * width), int(bottom * height))
+                regions.append((image.crop(box), (box[0], box[1])))
+        
+        if "binarize" in profile.preprocessing:
+            regions = [(binarize(region, profile.binarize_threshold), offset) for region, offset in regions]
+        
+        return regions
+    
+    def ocr_page(self, pdf_path: str, page_number: int, profile: Optional[OCRProfile] = None) -> str:
+        """
+        OCR one page to plain text.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_number: Page to OCR (1-based)
+            profile: Optional OCR profile restricting OCR to its regions
+        
+        Returns:
+            Recognized text, regions in profile order
+        """
+        image = self.render_page(pdf_path, page_number, profile)
+        try:
+            return '\n'.join(
+                pytesseract.image_to_string(region, lang=self.settings.language, config=self._config(profile))
+                for region, _ in self.prepare_regions(image, profile)
+            )
+        finally:
+            image.close()
+    
+    def ocr_page_lines(self, pdf_path: str, page_number: int,
+                       profile: Optional[OCRProfile] = None) -> List[Dict[str, Any]]:
+        """
+        OCR one page to line dictionaries in page coordinates.
+        
+        Lines have the same keys as the text-layer line dictionaries, with
+        Tesseract's word boxes scaled from pixels to PDF points.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_number: Page to OCR (1-based)
+            profile: Optional OCR profile restricting OCR to its regions
+        
+        Returns:
+            List of line dictionaries, top to bottom
+        """
+        scale = POINTS_PER_INCH / self._dpi(profile)
+        words: Dict[Tuple[int, int, int, int], List[Tuple[float, float, float, float, str]]] = {}
+        
+        image = self.render_page(pdf_path, page_number, profile)
+        try:
+            for region_num, (region, (x_offset, y_offset)) in enumerate(self.prepare_regions(image, profile)):
+                data = pytesseract.image_to_data(
+                    region, lang=self.settings.language, config=self._config(profile),
+                    output_type=pytesseract.Output.DICT
+                )
+                
+                for i, text in enumerate(data.get("text", [])):
+                    if not text or not text.strip():
+                        continue
+                    key = (region_num, data["block_num"][i], data["par_num"][i], data["line_num"][i])
+                    x0 = (x_offset + data["left"][i]) * scale
+                    top = (y_offset + data["top"][i]) * scale
+                    words.setdefault(key, []).append(
+                        (x0, x0 + data["width"][i] * scale, top, top + data["height"][i] * scale, text.strip())
+                    )
+        finally:
+            image.close()
+        
+        lines = []
+        for line_words in words.values():
+            line_words.sort()
+            x0 = min(w[0] for w in line_words)
+            x1 = max(w[1] for w in line_words)
+            top = min(w[2] for w in line_words)
+            bottom = max(w[3] for w in line_words)
+            text = ' '.join(w[4] for w in line_words)
+            lines.append({
+                'text': text,
+                'x0': x0,
+                'x1': x1,
+                'top': top,
+                'bottom': bottom,
+                'width': x1 - x0,
+                'height': bottom - top,
+                'char_count': len(text)
+            })
+        
+        lines.sort(key=lambda line: (line['top'], line['x0']))
+        return lines
+
+
+class HybridExtractor(PDFPlumberExtractor):
+    """
+    Reads the text layer where there is one and OCRs only the pages without.
+    
+    Each page's text-layer character count decides its route, so a mixed
+    statement with a scanned cover page pays OCR cost for that page alone.
+    OCR pages run concurrently (Tesseract runs as a separate process per
+    page) and are merged back into page order.
+    """
+    
+    supports_ocr_profile = True
+    
+    def __init__(self, extraction_settings: Optional[Dict[str, Any]] = None,
+                 bounded_memory: bool = False, ocr_settings: Optional[OCRSettings] = None):
+        """
+        Initialize the hybrid extractor.
+        
+        Args:
+            extraction_settings: Custom pdfplumber extraction settings
+            bounded_memory: Release each page's cached objects as soon as it is consumed
+            ocr_settings: OCR settings, defaults to OCRSettings()
+        """
+        super().__init__(extraction_settings=extraction_settings, bounded_memory=bounded_memory)
+        self.ocr_settings = ocr_settings or OCRSettings()
+        self.page_ocr = PageOCR(self.ocr_settings)
+        self.max_workers = max(1, self.ocr_settings.max_workers or os.cpu_count() or 1)
+    
+    def has_text_layer(self, page) -> bool:
+        """
+        Check whether a page has a usable text layer.
+        
+        Args:
+            page: pdfplumber page
+        
+        Returns:
+            True if the page has at least min_text_chars non-space characters
+        """
+        text_chars = sum(1 for char in page.chars if not char["text"].isspace())
+        return text_chars >= self.ocr_settings.min_text_chars
+    
+    def _timed_ocr(self, pdf_path: str, page_number: int,
+                   profile: Optional[OCRProfile]) -> Tuple[str, float]:
+        """OCR a page and return its text with the OCR duration."""
+        start_time = time.perf_counter()
+        text = self.page_ocr.ocr_page(pdf_path, page_number, profile)
+        return text, time.perf_counter() - start_time
+    
+    def extract_page_text(self, pdf_path: str, page_number: int = 1,
+                          ocr_profile: Optional[OCRProfile] = None) -> str:
+        """
+        Extract the text of a single page, OCRing it if it has no text layer.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_number: Page to extract (1-based)
+            ocr_profile: Optional pattern OCR profile, used if the page is OCR'd
+        
+        Returns:
+            Page text ("" if the page does not exist or has no text)
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            if not 1 <= page_number <= len(pdf.pages):
+                return ""
+            page = pdf.pages[page_number - 1]
+            if self.has_text_layer(page):
+                page_text = page.extract_text(**self.extraction_settings) or ""
+                self._release_page(page)
+                return page_text
+        
+        return self.page_ocr.ocr_page(pdf_path, page_number, ocr_profile)
+    
+    def extract_text(self, pdf_path: str, timer: Optional[StageTimer] = None,
+                     ocr_profile: Optional[OCRProfile] = None) -> str:
+        """
+        Extract text from PDF, OCRing pages without a text layer.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            timer: Optional StageTimer receiving "open" and per-page extract spans
+            ocr_profile: Optional pattern OCR profile for the OCR'd pages
+        
+        Returns:
+            Extracted text as a single string, in page order
+        
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            PDFProcessingError: If extraction fails
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        try:
+            open_start = time.perf_counter()
+            with pdfplumber.open(pdf_path) as pdf, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pages = pdf.pages
+                if timer:
+                    timer.add("open", time.perf_counter() - open_start)
+                
+                page_texts: Dict[int, Optional[str]] = {}
+                page_durations: Dict[int, float] = {}
+                ocr_futures = {}
+                
+                for page_num, page in enumerate(pages, 1):
+                    if self.has_text_layer(page):
+                        self.logger.debug(f"Extracting text from page {page_num}")
+                        
+                        page_start = time.perf_counter()
+                        page_texts[page_num] = page.extract_text(**self.extraction_settings)
+                        page_durations[page_num] = time.perf_counter() - page_start
+                    else:
+                        self.logger.debug(f"Page {page_num} has no text layer, queueing OCR")
+                        ocr_futures[page_num] = executor.submit(self._timed_ocr, pdf_path, page_num, ocr_profile)
+                    
+                    self._release_page(page)
+                
+                # Merge OCR results back into page order
+                for page_num, future in ocr_futures.items():
+                    page_texts[page_num], page_durations[page_num] = future.result()
+                
+                if timer:
+                    for page_num in sorted(page_durations):
+                        timer.add_page(page_durations[page_num])
+                
+                text_content = []
+                for page_num in sorted(page_texts):
+                    page_text = page_texts[page_num]
+                    if page_text and page_text.strip():
+                        text_content.append(page_text)
+                    else:
+                        self.logger.warning(f"No text extracted from page {page_num}")
+                
+                full_text = '\n'.join(text_content)
+                self.logger.info(
+                    f"Successfully extracted {len(full_text)} characters from {len(pages)} pages "
+                    f"({len(ocr_futures)} by OCR)"
+                )
+                
+                return full_text
+        
+        except Exception as e:
+            self.logger.error(f"Failed to extract text from {pdf_path}: {str(e)}")
+            raise PDFProcessingError(f"PDF extraction failed: {str(e)}", file_path=pdf_path)
+    
+    def iter_pages_with_layout(self, pdf_path: str,
+                               ocr_profile: Optional[OCRProfile] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Extract text preserving layout information, one page at a time.
+        
+        Pages without a text layer are OCR'd with word boxes; their page
+        data carries 'ocr': True.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            ocr_profile: Optional pattern OCR profile for the OCR'd pages
+        
+        Yields:
+            One dictionary per page containing text and layout information
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_num, page in enumerate(pdf.pages, 1):
+                if self.has_text_layer(page):
+                    self.logger.debug(f"Extracting layout from page {page_num}")
+                    lines = self._group_chars_into_lines(page.chars)
+                    raw_text = page.extract_text(**self.extraction_settings)
+                    ocr = False
+                else:
+                    self.logger.debug(f"OCRing layout of page {page_num}")
+                    lines = self.page_ocr.ocr_page_lines(pdf_path, page_num, ocr_profile)
+                    raw_text = '\n'.join(line['text'] for line in lines)
+                    ocr = True
+                
+                page_data = {
+                    'page_number': page_num,
+                    'page_width': page.width,
+                    'page_height': page.height,
+                    'lines': lines,
+                    'raw_text': raw_text,
+                    'ocr': ocr
+                }
+                
+                self._release_page(page)
+                
+                yield page_data
+    
+    def get_pdf_info(self, pdf_path: str) -> Dict[str, Any]:
+        """
+        Get basic information about the PDF file, including the OCR route of each page.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Dictionary containing PDF metadata
+        """
+        info = super().get_pdf_info(pdf_path)
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_info, page in zip(info['pages_info'], pdf.pages):
+                page_info['needs_ocr'] = not self.has_text_layer(page)
+        info['ocr_pages'] = sum(1 for page_info in info['pages_info'] if page_info['needs_ocr'])
+        
+        return info
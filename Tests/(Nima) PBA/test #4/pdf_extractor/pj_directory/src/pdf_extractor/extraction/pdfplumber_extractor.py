@@ -4,21 +4,31 @@ PDFPlumber-based text extraction for PDF files.
 
 import pdfplumber
 import logging
-from typing import List, Dict, Optional, Any
+import time
+from typing import List, Dict, Optional, Any, Iterator
 from pathlib import Path
 
+from ..utils.timing import StageTimer
+from .layout_engine import group_chars_into_lines, create_line_dict
+
 
 class PDFPlumberExtractor:
     """Handles PDF text extraction using pdfplumber library."""
     
-    def __init__(self, extraction_settings: Optional[Dict[str, Any]] = None):
+    # Whether extract_text and iter_pages_with_layout take an ocr_profile
+    supports_ocr_profile = False
+    
+    def __init__(self, extraction_settings: Optional[Dict[str, Any]] = None,
+                 bounded_memory: bool = False):
         """
         Initialize the PDFPlumber extractor.
         
         Args:
             extraction_settings: Custom extraction settings
+            bounded_memory: Release each page's cached objects as soon as it is consumed
         """
         self.logger = logging.getLogger(__name__)
+        self.bounded_memory = bounded_memory
         
         # Default extraction settings optimized for credit card PDFs
         self.extraction_settings = {
@@ -35,12 +45,13 @@ class PDFPlumberExtractor:
         if extraction_settings:
             self.extraction_settings.update(extraction_settings)
     
-    def extract_text(self, pdf_path: str) -> str:
+    def extract_text(self, pdf_path: str, timer: Optional[StageTimer] = None) -> str:
         """
         Extract text from PDF using pdfplumber.
         
         Args:
             pdf_path: Path to the PDF file
+            timer: Optional StageTimer receiving "open" and per-page extract spans
             
         Returns:
             Extracted text as a single string
@@ -54,19 +65,29 @@ class PDFPlumberExtractor:
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
         try:
+            open_start = time.perf_counter()
             with pdfplumber.open(pdf_path) as pdf:
+                pages = pdf.pages
+                if timer:
+                    timer.add("open", time.perf_counter() - open_start)
+                
                 text_content = []
                 
-                for page_num, page in enumerate(pdf.pages, 1):
+                for page_num, page in enumerate(pages, 1):
                     self.logger.debug(f"Extracting text from page {page_num}")
                     
                     # Extract text with settings
+                    page_start = time.perf_counter()
                     page_text = page.extract_text(**self.extraction_settings)
+                    if timer:
+                        timer.add_page(time.perf_counter() - page_start)
                     
                     if page_text:
                         text_content.append(page_text)
                     else:
                         self.logger.warning(f"No text extracted from page {page_num}")
+                    
+                    self._release_page(page)
                 
                 full_text = '\n'.join(text_content)
                 self.logger.info(f"Successfully extracted {len(full_text)} characters from {len(pdf.pages)} pages")
@@ -77,50 +98,112 @@ class PDFPlumberExtractor:
             self.logger.error(f"Failed to extract text from {pdf_path}: {str(e)}")
             raise Exception(f"PDF extraction failed: {str(e)}")
     
-    def extract_with_layout(self, pdf_path: str) -> List[Dict[str, Any]]:
+    def extract_page_text(self, pdf_path: str, page_number: int = 1) -> str:
         """
-        Extract text preserving layout information.
+        Extract the text of a single page, e.g. to detect a statement's pattern cheaply.
         
         Args:
             pdf_path: Path to the PDF file
+            page_number: Page to extract (1-based)
             
         Returns:
-            List of dictionaries containing text and layout information
+            Page text ("" if the page does not exist or has no text)
         """
         pdf_file = Path(pdf_path)
         if not pdf_file.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
-        try:
-            layout_data = []
-            
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    self.logger.debug(f"Extracting layout from page {page_num}")
-                    
-                    # Extract characters with positions
-                    chars = page.chars
-                    
-                    # Group characters into lines
-                    lines = self._group_chars_into_lines(chars)
-                    
-                    page_data = {
-                        'page_number': page_num,
-                        'page_width': page.width,
-                        'page_height': page.height,
-                        'lines': lines,
-                        'raw_text': page.extract_text(**self.extraction_settings)
-                    }
-                    
-                    layout_data.append(page_data)
+        with pdfplumber.open(pdf_path) as pdf:
+            if not 1 <= page_number <= len(pdf.pages):
+                return ""
+            page = pdf.pages[page_number - 1]
+            page_text = page.extract_text(**self.extraction_settings) or ""
+            self._release_page(page)
+            return page_text
+    
+    def extract_with_layout(self, pdf_path: str) -> List[Dict[str, Any]]:
+        """
+        Extract text with layout information for better pattern matching.
+        
+        Holds every page's line data at once; use iter_pages_with_layout()
+        to process large statements page by page.
+        
+        Args:
+            pdf_path: Path to the PDF file
             
+        Returns:
+            List of dictionaries containing text and layout information
+        """
+        try:
+            layout_data = list(self.iter_pages_with_layout(pdf_path))
             self.logger.info(f"Successfully extracted layout data from {len(layout_data)} pages")
             return layout_data
             
+        except FileNotFoundError:
+            raise
         except Exception as e:
             self.logger.error(f"Failed to extract layout from {pdf_path}: {str(e)}")
             raise Exception(f"Layout extraction failed: {str(e)}")
     
+    def iter_pages_with_layout(self, pdf_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Extract text preserving layout information, one page at a time.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Yields:
+            One dictionary per page containing text and layout information
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_num, page in enumerate(pdf.pages, 1):
+                self.logger.debug(f"Extracting layout from page {page_num}")
+                
+                # Extract characters with positions
+                chars = page.chars
+                
+                # Group characters into lines
+                lines = self._group_chars_into_lines(chars)
+                
+                page_data = {
+                    'page_number': page_num,
+                    'page_width': page.width,
+                    'page_height': page.height,
+                    'lines': lines,
+                    'raw_text': page.extract_text(**self.extraction_settings)
+                }
+                
+                # Drop our reference to the char dicts before releasing the page
+                del chars
+                self._release_page(page)
+                
+                yield page_data
+    
+    def _release_page(self, page) -> None:
+        """
+        Release a page's cached objects (chars, layout) in bounded-memory mode.
+        
+        pdfplumber caches parsed objects on each page for the lifetime of
+        the document; dropping them after use keeps memory proportional to
+        one page instead of the whole statement.
+        
+        Args:
+            page: pdfplumber page that has been fully consumed
+        """
+        if not self.bounded_memory:
+            return
+        
+        release = getattr(page, "close", None) or getattr(page, "flush_cache", None)
+        if release:
+            try:
+                release()
+            except Exception as e:
+                self.logger.debug(f"Could not release page {getattr(page, 'page_number', '?')}: {str(e)}")
+    
     def extract_tables(self, pdf_path: str) -> List[List[List[str]]]:
         """
         Extract table data if transactions are in table format.
@@ -164,42 +247,15 @@ class PDFPlumberExtractor:
         """
         Group character data into lines based on y-coordinates.
         
+        Uses the vectorized layout engine when NumPy is installed.
+        
         Args:
             chars: List of character dictionaries from pdfplumber
             
         Returns:
             List of line dictionaries with text and position info
         """
-        if not chars:
-            return []
-        
-        # Sort characters by y-coordinate (top to bottom) then x-coordinate (left to right)
-        sorted_chars = sorted(chars, key=lambda c: (-c['top'], c['x0']))
-        
-        lines = []
-        current_line = []
-        current_y = None
-        y_tolerance = self.extraction_settings.get('y_tolerance', 3)
-        
-        for char in sorted_chars:
-            char_y = char['top']
-            
-            # Check if this character belongs to the current line
-            if current_y is None or abs(char_y - current_y) <= y_tolerance:
-                current_line.append(char)
-                current_y = char_y
-            else:
-                # Start a new line
-                if current_line:
-                    lines.append(self._create_line_dict(current_line))
-                current_line = [char]
-                current_y = char_y
-        
-        # Add the last line
-        if current_line:
-            lines.append(self._create_line_dict(current_line))
-        
-        return lines
+        return group_chars_into_lines(chars, self.extraction_settings.get('y_tolerance', 3))
     
     def _create_line_dict(self, chars: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -211,31 +267,7 @@ class PDFPlumberExtractor:
         Returns:
             Dictionary containing line information
         """
-        if not chars:
-            return {}
-        
-        # Sort characters by x-coordinate (left to right)
-        sorted_chars = sorted(chars, key=lambda c: c['x0'])
-        
-        # Extract text
-        text = ''.join(char['text'] for char in sorted_chars)
-        
-        # Calculate bounding box
-        x0 = min(char['x0'] for char in sorted_chars)
-        x1 = max(char['x1'] for char in sorted_chars)
-        top = min(char['top'] for char in sorted_chars)
-        bottom = max(char['bottom'] for char in sorted_chars)
-        
-        return {
-            'text': text.strip(),
-            'x0': x0,
-            'x1': x1,
-            'top': top,
-            'bottom': bottom,
-            'width': x1 - x0,
-            'height': bottom - top,
-            'char_count': len(sorted_chars)
-        }
+        return create_line_dict(chars)
     
     def get_pdf_info(self, pdf_path: str) -> Dict[str, Any]:
         """
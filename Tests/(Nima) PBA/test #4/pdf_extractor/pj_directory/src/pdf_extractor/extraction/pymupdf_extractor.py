@@ -0,0 +1,325 @@
+"""
+PyMuPDF-based text extraction for PDF files.
+"""
+
+import fitz
+import logging
+import time
+from typing import List, Dict, Optional, Any, Iterator
+from pathlib import Path
+
+from ..utils.timing import StageTimer
+
+
+class PyMuPDFExtractor:
+    """Handles PDF text extraction using the PyMuPDF (fitz) library."""
+    
+    # Whether extract_text and iter_pages_with_layout take an ocr_profile
+    supports_ocr_profile = False
+    
+    def __init__(self, extraction_settings: Optional[Dict[str, Any]] = None,
+                 bounded_memory: bool = False):
+        """
+        Initialize the PyMuPDF extractor.
+        
+        Args:
+            extraction_settings: Custom extraction settings
+            bounded_memory: Shrink MuPDF's object store after each page is consumed
+        """
+        self.logger = logging.getLogger(__name__)
+        self.bounded_memory = bounded_memory
+        
+        # Reading-order text is closest to pdfplumber's layout output
+        self.extraction_settings = {
+            'sort': True,
+            'y_tolerance': 3
+        }
+        
+        # Update with custom settings if provided
+        if extraction_settings:
+            self.extraction_settings.update(extraction_settings)
+    
+    def extract_text(self, pdf_path: str, timer: Optional[StageTimer] = None) -> str:
+        """
+        Extract text from PDF using PyMuPDF.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            timer: Optional StageTimer receiving "open" and per-page extract spans
+        
+        Returns:
+            Extracted text as a single string
+        
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            Exception: If extraction fails
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        try:
+            open_start = time.perf_counter()
+            with fitz.open(pdf_path) as doc:
+                if timer:
+                    timer.add("open", time.perf_counter() - open_start)
+                
+                text_content = []
+                
+                for page_num, page in enumerate(doc, 1):
+                    self.logger.debug(f"Extracting text from page {page_num}")
+                    
+                    page_start = time.perf_counter()
+                    page_text = page.get_text("text", sort=self.extraction_settings.get('sort', True))
+                    if timer:
+                        timer.add_page(time.perf_counter() - page_start)
+                    
+                    if page_text and page_text.strip():
+                        text_content.append(page_text.rstrip('\n'))
+                    else:
+                        self.logger.warning(f"No text extracted from page {page_num}")
+                    
+                    self._release_page()
+                
+                full_text = '\n'.join(text_content)
+                self.logger.info(f"Successfully extracted {len(full_text)} characters from {doc.page_count} pages")
+                
+                return full_text
+        
+        except Exception as e:
+            self.logger.error(f"Failed to extract text from {pdf_path}: {str(e)}")
+            raise Exception(f"PDF extraction failed: {str(e)}")
+    
+    def extract_page_text(self, pdf_path: str, page_number: int = 1) -> str:
+        """
+        Extract the text of a single page, e.g. to detect a statement's pattern cheaply.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_number: Page to extract (1-based)
+        
+        Returns:
+            Page text ("" if the page does not exist or has no text)
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        with fitz.open(pdf_path) as doc:
+            if not 1 <= page_number <= doc.page_count:
+                return ""
+            page_text = doc[page_number - 1].get_text("text", sort=self.extraction_settings.get('sort', True))
+            self._release_page()
+            return page_text
+    
+    def extract_with_layout(self, pdf_path: str) -> List[Dict[str, Any]]:
+        """
+        Extract text with layout information for better pattern matching.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            List of dictionaries containing text and layout information
+        """
+        try:
+            layout_data = list(self.iter_pages_with_layout(pdf_path))
+            self.logger.info(f"Successfully extracted layout data from {len(layout_data)} pages")
+            return layout_data
+        
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to extract layout from {pdf_path}: {str(e)}")
+            raise Exception(f"Layout extraction failed: {str(e)}")
+    
+    def iter_pages_with_layout(self, pdf_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Extract text preserving layout information, one page at a time.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Yields:
+            One dictionary per page containing text and layout information
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        with fitz.open(pdf_path) as doc:
+            for page_num, page in enumerate(doc, 1):
+                self.logger.debug(f"Extracting layout from page {page_num}")
+                
+                page_data = {
+                    'page_number': page_num,
+                    'page_width': page.rect.width,
+                    'page_height': page.rect.height,
+                    'lines': self._lines_from_dict(page.get_text("dict")),
+                    'raw_text': page.get_text("text", sort=self.extraction_settings.get('sort', True))
+                }
+                
+                self._release_page()
+                
+                yield page_data
+    
+    def _lines_from_dict(self, text_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build line dictionaries from PyMuPDF's text dict.
+        
+        PyMuPDF splits a visual row into several lines when columns are far
+        apart, so lines whose tops are within y_tolerance are merged to match
+        the row-per-line output of the pdfplumber extractor.
+        
+        Args:
+            text_dict: Result of page.get_text("dict")
+        
+        Returns:
+            List of line dictionaries with text and position info, top to bottom
+        """
+        fragments = []
+        for block in text_dict.get("blocks", []):
+            for line in block.get("lines", []):
+                text = ''.join(span.get("text", "") for span in line.get("spans", []))
+                if text.strip():
+                    x0, top, x1, bottom = line["bbox"]
+                    fragments.append((top, x0, x1, bottom, text))
+        
+        fragments.sort()
+        
+        lines = []
+        row = []
+        y_tolerance = self.extraction_settings.get('y_tolerance', 3)
+        
+        for fragment in fragments:
+            if row and abs(fragment[0] - row[-1][0]) > y_tolerance:
+                lines.append(self._create_line_dict(row))
+                row = []
+            row.append(fragment)
+        
+        if row:
+            lines.append(self._create_line_dict(row))
+        
+        return lines
+    
+    def _create_line_dict(self, fragments: List[tuple]) -> Dict[str, Any]:
+        """
+        Create a line dictionary from (top, x0, x1, bottom, text) fragments of one row.
+        
+        Args:
+            fragments: Fragments belonging to the same row
+        
+        Returns:
+            Dictionary containing line information
+        """
+        fragments = sorted(fragments, key=lambda f: f[1])
+        text = ' '.join(f[4].strip() for f in fragments)
+        
+        x0 = min(f[1] for f in fragments)
+        x1 = max(f[2] for f in fragments)
+        top = min(f[0] for f in fragments)
+        bottom = max(f[3] for f in fragments)
+        
+        return {
+            'text': text.strip(),
+            'x0': x0,
+            'x1': x1,
+            'top': top,
+            'bottom': bottom,
+            'width': x1 - x0,
+            'height': bottom - top,
+            'char_count': sum(len(f[4]) for f in fragments)
+        }
+    
+    def _release_page(self) -> None:
+        """Shrink MuPDF's global object store in bounded-memory mode."""
+        if not self.bounded_memory:
+            return
+        
+        try:
+            fitz.TOOLS.store_shrink(100)
+        except Exception as e:
+            self.logger.debug(f"Could not shrink MuPDF store: {str(e)}")
+    
+    def extract_tables(self, pdf_path: str) -> List[List[List[str]]]:
+        """
+        Extract table data if transactions are in table format.
+        
+        Requires PyMuPDF 1.23 or newer (Page.find_tables); older versions
+        return no tables.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            List of tables, where each table is a list of rows,
+            and each row is a list of cell values
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        try:
+            all_tables = []
+            
+            with fitz.open(pdf_path) as doc:
+                for page_num, page in enumerate(doc, 1):
+                    if not hasattr(page, "find_tables"):
+                        self.logger.warning("Installed PyMuPDF does not support table extraction")
+                        break
+                    
+                    self.logger.debug(f"Extracting tables from page {page_num}")
+                    
+                    for table_num, table in enumerate(page.find_tables().tables):
+                        rows = table.extract()
+                        self.logger.debug(f"Found table {table_num + 1} on page {page_num} with {len(rows)} rows")
+                        all_tables.append(rows)
+            
+            self.logger.info(f"Successfully extracted {len(all_tables)} tables")
+            return all_tables
+        
+        except Exception as e:
+            self.logger.error(f"Failed to extract tables from {pdf_path}: {str(e)}")
+            raise Exception(f"Table extraction failed: {str(e)}")
+    
+    def get_pdf_info(self, pdf_path: str) -> Dict[str, Any]:
+        """
+        Get basic information about the PDF file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Dictionary containing PDF metadata
+        """
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        try:
+            with fitz.open(pdf_path) as doc:
+                info = {
+                    'file_path': str(pdf_file.absolute()),
+                    'file_size': pdf_file.stat().st_size,
+                    'page_count': doc.page_count,
+                    'metadata': doc.metadata or {},
+                    'pages_info': []
+                }
+                
+                # Get information for each page
+                for page_num, page in enumerate(doc, 1):
+                    page_text = page.get_text("text")
+                    info['pages_info'].append({
+                        'page_number': page_num,
+                        'width': page.rect.width,
+                        'height': page.rect.height,
+                        'rotation': page.rotation,
+                        'char_count': sum(1 for c in page_text if not c.isspace()),
+                        'has_text': bool(page_text.strip())
+                    })
+                
+                return info
+        
+        except Exception as e:
+            self.logger.error(f"Failed to get PDF info for {pdf_path}: {str(e)}")
+            raise Exception(f"PDF info extraction failed: {str(e)}")
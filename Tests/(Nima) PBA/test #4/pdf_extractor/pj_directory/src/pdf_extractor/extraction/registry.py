@@ -0,0 +1,96 @@
+"""
+Registry of text extractor backends, selectable by name.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Union
+
+
+DEFAULT_EXTRACTOR = "pdfplumber"
+
+# Extractors whose constructor takes ocr_settings
+OCR_EXTRACTORS = {"hybrid"}
+
+# Extractors are registered as "module:Class" references (relative to this
+# package) so a backend's PDF library is only imported when it is selected.
+_REGISTRY: Dict[str, Union[str, Callable[..., Any]]] = {
+    "pdfplumber": ".pdfplumber_extractor:PDFPlumberExtractor",
+    "pymupdf": ".pymupdf_extractor:PyMuPDFExtractor",
+    "hybrid": ".ocr:HybridExtractor",
+}
+
+
+def register_extractor(name: str, factory: Union[str, Callable[..., Any]]) -> None:
+    """
+    Register an extractor backend.
+
+    Extractors implement extract_text(pdf_path, timer=None),
+    extract_page_text(pdf_path, page_number=1), extract_with_layout,
+    iter_pages_with_layout, extract_tables and get_pdf_info, and accept
+    extraction_settings and bounded_memory keyword arguments. Extractors
+    that OCR pages also accept ocr_settings, and set supports_ocr_profile
+    if their extract_text, extract_page_text and iter_pages_with_layout
+    take an ocr_profile.
+
+    Args:
+        name: Name used to select the backend in settings
+        factory: Extractor class or callable, or a "module:attribute" reference
+    """
+    _REGISTRY[name.lower()] = factory
+
+
+def _resolve(name: str) -> Callable[..., Any]:
+    """Resolve a registered name to its extractor class, importing it if needed."""
+    key = name.lower()
+    if key not in _REGISTRY:
+        raise ValueError(f"Unknown extractor: {name}. Supported: {registered_extractors()}")
+
+    factory = _REGISTRY[key]
+    if isinstance(factory, str):
+        module_name, attribute = factory.split(":")
+        module = importlib.import_module(module_name, package=__package__)
+        factory = getattr(module, attribute)
+        _REGISTRY[key] = factory
+
+    return factory
+
+
+def get_extractor(name: str = DEFAULT_EXTRACTOR, **kwargs) -> Any:
+    """
+    Create an extractor by name.
+
+    Args:
+        name: Registered extractor name
+        **kwargs: Constructor arguments (extraction_settings, bounded_memory,
+            and ocr_settings for OCR extractors)
+
+    Returns:
+        Extractor instance
+
+    Raises:
+        ValueError: If the name is not registered
+        ImportError: If the backend's PDF library is not installed
+    """
+    try:
+        factory = _resolve(name)
+    except ImportError as e:
+        raise ImportError(f"Extractor '{name}' is not available: {str(e)}") from e
+
+    return factory(**kwargs)
+
+
+def registered_extractors() -> List[str]:
+    """Get the names of all registered extractors."""
+    return sorted(_REGISTRY)
+
+
+def available_extractors() -> List[str]:
+    """Get the names of registered extractors whose PDF library can be imported."""
+    available = []
+    for name in registered_extractors():
+        try:
+            _resolve(name)
+            available.append(name)
+        except ImportError:
+            continue
+    return available
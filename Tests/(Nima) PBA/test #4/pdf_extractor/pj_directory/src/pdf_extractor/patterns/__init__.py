@@ -5,9 +5,11 @@ Pattern recognition modules for different credit card issuers.
 from .pattern_matcher import PatternMatcher
 from .avianca_patterns import AviancaPatterns
 from .pattern_repository import PatternRepository
+from .table_extractor import TableTransactionExtractor
 
 __all__ = [
     "PatternMatcher",
     "AviancaPatterns", 
-    "PatternRepository"
+    "PatternRepository",
+    "TableTransactionExtractor"
 ]
\ No newline at end of file
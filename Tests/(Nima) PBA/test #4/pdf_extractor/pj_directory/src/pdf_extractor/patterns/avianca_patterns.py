@@ -3,12 +3,14 @@ Avianca credit card specific patterns for transaction extraction.
 """
 
 import re
+import time
 from typing import List, Optional, Dict, Any
 from datetime import date
 from decimal import Decimal
 
 from ..data.models import Pattern, Transaction
 from ..data.parsers import DateParser, AmountParser, DescriptionCleaner
+from ..utils.timing import StageTimer
 
 
 class AviancaPatterns:
@@ -87,13 +89,15 @@ class AviancaPatterns:
         
         return None
     
-    def extract_transactions(self, text: str, pattern_name: str = None) -> List[Transaction]:
+    def extract_transactions(self, text: str, pattern_name: str = None,
+                             timer: Optional[StageTimer] = None) -> List[Transaction]:
         """
         Extract transactions from Avianca PDF text.
         
         Args:
             text: PDF text content
             pattern_name: Specific pattern to use, or None for auto-detection
+            timer: Optional StageTimer receiving "match" and "parse" spans
             
         Returns:
             List of extracted transactions
@@ -108,13 +112,19 @@ class AviancaPatterns:
         transactions = []
         
         # Find all transaction matches
-        matches = re.finditer(pattern.transaction_regex, text, re.MULTILINE)
+        match_start = time.perf_counter()
+        matches = list(re.finditer(pattern.transaction_regex, text, re.MULTILINE))
+        parse_start = time.perf_counter()
         
         for match in matches:
             transaction = self._parse_transaction_match(match, pattern)
             if transaction and transaction.validate():
                 transactions.append(transaction)
         
+        if timer:
+            timer.add("match", parse_start - match_start)
+            timer.add("parse", time.perf_counter() - parse_start)
+        
         return transactions
     
     def _parse_transaction_match(self, match: re.Match, pattern: Pattern) -> Optional[Transaction]:
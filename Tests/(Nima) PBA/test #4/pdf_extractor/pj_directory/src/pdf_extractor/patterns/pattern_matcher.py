@@ -4,12 +4,14 @@ Core pattern matching engine for transaction extraction.
 
 import re
 import logging
+import time
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
 from decimal import Decimal
 
 from ..data.models import Pattern, Transaction
 from ..data.parsers import DateParser, AmountParser, DescriptionCleaner
+from ..utils.timing import StageTimer
 
 
 class PatternMatcher:
@@ -24,13 +26,15 @@ class PatternMatcher:
         # Compiled regex cache for performance
         self._regex_cache = {}
     
-    def match_transactions(self, text: str, pattern: Pattern) -> List[Transaction]:
+    def match_transactions(self, text: str, pattern: Pattern,
+                           timer: Optional[StageTimer] = None) -> List[Transaction]:
         """
         Match transactions using regex patterns.
         
         Args:
             text: PDF text content
             pattern: Pattern object containing regex and parsing rules
+            timer: Optional StageTimer receiving "match" and "parse" spans
             
         Returns:
             List of extracted transactions
@@ -43,7 +47,9 @@ class PatternMatcher:
             regex = self._get_compiled_regex(pattern.transaction_regex)
             
             # Find all matches
+            match_start = time.perf_counter()
             matches = list(regex.finditer(text))
+            parse_start = time.perf_counter()
             self.logger.debug(f"Found {len(matches)} potential matches with pattern {pattern.name}")
             
             transactions = []
@@ -54,6 +60,10 @@ class PatternMatcher:
                 else:
                     self.logger.debug(f"Invalid transaction from match: {match.group(0)[:50]}...")
             
+            if timer:
+                timer.add("match", parse_start - match_start)
+                timer.add("parse", time.perf_counter() - parse_start)
+            
             self.logger.info(f"Successfully extracted {len(transactions)} valid transactions")
             return transactions
             
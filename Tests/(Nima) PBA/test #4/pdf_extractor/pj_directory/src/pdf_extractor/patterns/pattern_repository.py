@@ -8,7 +8,7 @@ import logging
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
-from ..data.models import Pattern
+from ..data.models import Pattern, OCRProfile, OCR_PREPROCESSING_STEPS
 from .avianca_patterns import AviancaPatterns
 
 
@@ -80,15 +80,22 @@ class PatternRepository:
             
             for pattern_name, pattern_config in patterns_data.items():
                 try:
+                    table_columns = pattern_config.get('table_columns', {})
+                    ocr_profile = pattern_config.get('ocr_profile')
+                    
                     pattern = Pattern(
                         name=pattern_config.get('name', pattern_name),
                         issuer=pattern_config['issuer'],
                         card_type=pattern_config.get('card_type', 'unknown'),
-                        transaction_regex=pattern_config['transaction_regex'],
+                        # Table-driven patterns do not need a transaction regex
+                        transaction_regex=(pattern_config.get('transaction_regex', '') if table_columns
+                                           else pattern_config['transaction_regex']),
                         date_format=pattern_config.get('date_format', '%Y-%m-%d'),
                         amount_format=pattern_config.get('amount_format', '$X,XXX.XX'),
                         description_cleanup_rules=pattern_config.get('description_cleanup_rules', []),
-                        confidence_threshold=pattern_config.get('confidence_threshold', 0.8)
+                        confidence_threshold=pattern_config.get('confidence_threshold', 0.8),
+                        table_columns=table_columns,
+                        ocr_profile=OCRProfile.from_dict(ocr_profile) if ocr_profile else None
                     )
                     
                     self.patterns[pattern_name] = pattern
@@ -238,6 +245,10 @@ class PatternRepository:
         suggestions = []
         
         for pattern_name, pattern in self.patterns.items():
+            if not pattern.transaction_regex:
+                # Table-driven pattern without a detection regex
+                continue
+            
             try:
                 # Test pattern against text
                 import re
@@ -290,9 +301,20 @@ class PatternRepository:
             if not pattern.issuer:
                 validation["errors"].append("Pattern issuer is required")
             
-            if not pattern.transaction_regex:
+            if not pattern.transaction_regex and not pattern.uses_tables:
                 validation["errors"].append("Transaction regex is required")
             
+            # Check table column roles
+            if pattern.uses_tables:
+                from .table_extractor import COLUMN_ROLES
+                missing_roles = [role for role in COLUMN_ROLES if role not in pattern.table_columns]
+                if missing_roles:
+                    validation["errors"].append(f"Table columns missing roles: {', '.join(missing_roles)}")
+            
+            # Check OCR profile
+            if pattern.ocr_profile:
+                validation["errors"].extend(self._validate_ocr_profile(pattern.ocr_profile))
+            
             # Validate regex
             try:
                 re.compile(pattern.transaction_regex)
@@ -318,6 +340,36 @@ class PatternRepository:
         
         return validation
     
+    @staticmethod
+    def _validate_ocr_profile(profile: OCRProfile) -> List[str]:
+        """
+        Check an OCR profile's regions, DPI and preprocessing steps.
+        
+        Args:
+            profile: OCR profile to check
+            
+        Returns:
+            List of error messages, empty if the profile is valid
+        """
+        errors = []
+        
+        for region in profile.regions:
+            if (len(region) != 4 or not all(0.0 <= value <= 1.0 for value in region)
+                    or region[0] >= region[2] or region[1] >= region[3]):
+                errors.append(f"OCR region {region} must be [x0, top, x1, bottom] page fractions between 0 and 1")
+        
+        if profile.dpi is not None and profile.dpi <= 0:
+            errors.append("OCR DPI must be positive")
+        
+        unknown_steps = [step for step in profile.preprocessing if step not in OCR_PREPROCESSING_STEPS]
+        if unknown_steps:
+            errors.append(f"Unknown OCR preprocessing steps: {', '.join(unknown_steps)}")
+        
+        if not (0 <= profile.binarize_threshold <= 255):
+            errors.append("OCR binarize threshold must be between 0 and 255")
+        
+        return errors
+    
     def get_repository_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the pattern repository.
@@ -0,0 +1,209 @@
+"""
+Table-driven transaction extraction for statements with ruled transaction tables.
+"""
+
+import logging
+import time
+from datetime import datetime, date
+from typing import List, Dict, Optional, Any, Callable
+
+from ..data.models import Transaction, Pattern
+from ..data.parsers import DateParser, AmountParser, DescriptionCleaner
+from ..utils.timing import StageTimer
+
+
+# Column roles a pattern can declare in table_columns
+COLUMN_ROLES = ("date", "description", "amount")
+
+# Rows searched for header names when columns are declared by name
+HEADER_SEARCH_ROWS = 3
+
+
+class TableTransactionExtractor:
+    """
+    Maps table rows straight to transactions using a pattern's column roles.
+    
+    Pattern.table_columns maps each role in COLUMN_ROLES to either a column
+    index (0-based, negative indices count from the right) or a header name
+    that is matched case-insensitively against the first rows of each
+    table. Rows without a date or amount but with description text are
+    treated as wrapped description lines of the previous transaction.
+    """
+    
+    def __init__(self, validate_transaction: Optional[Callable[[Transaction], bool]] = None):
+        """
+        Initialize the table extractor.
+        
+        Args:
+            validate_transaction: Business-rule validator applied to each row's
+                transaction, defaults to Transaction.validate
+        """
+        self.logger = logging.getLogger(__name__)
+        self.date_parser = DateParser()
+        self.amount_parser = AmountParser()
+        self.description_cleaner = DescriptionCleaner()
+        self.validate_transaction = validate_transaction or (lambda t: t.validate())
+    
+    def extract_transactions(self, tables: List[List[List[Optional[str]]]], pattern: Pattern,
+                             timer: Optional[StageTimer] = None) -> List[Transaction]:
+        """
+        Extract transactions from tables.
+        
+        Args:
+            tables: Tables as returned by an extractor's extract_tables()
+            pattern: Pattern declaring table_columns
+            timer: Optional StageTimer receiving the "parse" span
+        
+        Returns:
+            List of extracted transactions
+        """
+        if not tables or not pattern or not pattern.table_columns:
+            return []
+        
+        parse_start = time.perf_counter()
+        transactions = []
+        
+        for table_num, table in enumerate(tables, 1):
+            columns = self._resolve_columns(table, pattern.table_columns)
+            if columns is None:
+                self.logger.debug(f"Table {table_num} does not have the columns of pattern {pattern.name}")
+                continue
+            
+            header_rows = columns.pop("_header_rows", 0)
+            pending = None
+            
+            for row in table[header_rows:]:
+                if not row:
+                    continue
+                
+                transaction = self._row_to_transaction(row, columns, pattern)
+                
+                if transaction is None:
+                    continuation = self._cell(row, columns["description"])
+                    if pending and continuation and not self._cell(row, columns["amount"]):
+                        pending.description = f"{pending.description} {continuation}".strip()
+                        pending.raw_text = f"{pending.raw_text}\n{self._row_text(row)}"
+                    continue
+                
+                if pending:
+                    self._finish(pending, pattern, transactions)
+                pending = transaction
+            
+            if pending:
+                self._finish(pending, pattern, transactions)
+        
+        if timer:
+            timer.add("parse", time.perf_counter() - parse_start)
+        
+        self.logger.info(f"Extracted {len(transactions)} transactions from {len(tables)} tables")
+        return transactions
+    
+    def _finish(self, transaction: Transaction, pattern: Pattern, transactions: List[Transaction]):
+        """Clean a completed transaction's description and keep it if it validates."""
+        transaction.description = self.description_cleaner.clean_description(transaction.description)
+        if self.validate_transaction(transaction):
+            transactions.append(transaction)
+        else:
+            self.logger.debug(f"Invalid transaction from table row: {transaction.raw_text[:50]}...")
+    
+    def _resolve_columns(self, table: List[List[Optional[str]]],
+                         table_columns: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """
+        Resolve the pattern's column roles to column indices for one table.
+        
+        Args:
+            table: Table rows
+            table_columns: Role to column index or header name mapping
+        
+        Returns:
+            Role to index mapping (plus "_header_rows", the number of rows to
+            skip), or None if a named column is not found in this table
+        """
+        columns = {}
+        header_rows = 0
+        
+        for role in COLUMN_ROLES:
+            spec = table_columns.get(role)
+            if spec is None:
+                return None
+            
+            if isinstance(spec, int):
+                columns[role] = spec
+                continue
+            
+            found = False
+            for row_index, row in enumerate(table[:HEADER_SEARCH_ROWS]):
+                for col_index, cell in enumerate(row or []):
+                    if cell and str(spec).lower() in str(cell).lower():
+                        columns[role] = col_index
+                        header_rows = max(header_rows, row_index + 1)
+                        found = True
+                        break
+                if found:
+                    break
+            
+            if not found:
+                return None
+        
+        columns["_header_rows"] = header_rows
+        return columns
+    
+    def _row_to_transaction(self, row: List[Optional[str]], columns: Dict[str, int],
+                            pattern: Pattern) -> Optional[Transaction]:
+        """
+        Convert one table row to a transaction.
+        
+        Args:
+            row: Table row cells
+            columns: Role to column index mapping
+            pattern: Pattern providing date format and confidence
+        
+        Returns:
+            Transaction (description not yet cleaned) or None if the row has
+            no parseable date and amount
+        """
+        date_text = self._cell(row, columns["date"])
+        amount_text = self._cell(row, columns["amount"])
+        if not date_text or not amount_text:
+            return None
+        
+        date_obj = self._parse_date(date_text, pattern.date_format)
+        amount = self.amount_parser.parse_amount(amount_text)
+        if date_obj is None or amount is None:
+            return None
+        
+        return Transaction(
+            date=date_obj,
+            description=self._cell(row, columns["description"]),
+            amount=amount,
+            raw_text=self._row_text(row),
+            confidence=pattern.confidence_threshold
+        )
+    
+    def _parse_date(self, date_text: str, date_format: str) -> Optional[date]:
+        """Parse a date cell with the pattern's format, falling back to the generic parser."""
+        if date_format:
+            try:
+                return datetime.strptime(date_text, date_format).date()
+            except ValueError:
+                pass
+        
+        # Header and label cells must not be fuzzily parsed into dates
+        if not any(ch.isdigit() for ch in date_text):
+            return None
+        
+        return self.date_parser.parse_date(date_text)
+    
+    @staticmethod
+    def _cell(row: List[Optional[str]], index: int) -> str:
+        """Get a cell's text with whitespace and line breaks collapsed, or "" if missing."""
+        try:
+            value = row[index]
+        except IndexError:
+            return ""
+        return " ".join(str(value).split()) if value is not None else ""
+    
+    @staticmethod
+    def _row_text(row: List[Optional[str]]) -> str:
+        """Join a row's non-empty cells as the transaction's raw text."""
+        return " | ".join(" ".join(str(cell).split()) for cell in row if cell)
@@ -5,6 +5,8 @@ Utility modules for PDF Credit Card Expense Extractor.
 from .exceptions import *
 from .error_handler import ErrorHandler, handle_errors
 from .validators import *
+from .timing import StageTimer, StageTimingAggregator, summarize_stage_timings
+from .memory import MemoryTracker
 
 __all__ = [
     # Exceptions
@@ -19,6 +21,14 @@ __all__ = [
     "ErrorHandler",
     "handle_errors",
     
+    # Timing
+    "StageTimer",
+    "StageTimingAggregator",
+    "summarize_stage_timings",
+    
+    # Memory
+    "MemoryTracker",
+    
     # Validators
     "validate_file_path",
     "validate_pdf_file",
@@ -0,0 +1,42 @@
+"""
+Content hashing of input files and configuration.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+
+# Bytes read per chunk while hashing, so large PDFs are never loaded whole
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """
+    Get the SHA-256 digest of a file's content.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def json_sha256(data: Any) -> str:
+    """
+    Get the SHA-256 digest of JSON-compatible data, independent of key order.
+
+    Args:
+        data: JSON-compatible data (values that are not are hashed as str())
+
+    Returns:
+        Hex digest of the canonical JSON encoding
+    """
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
@@ -0,0 +1,193 @@
+"""
+Per-file memory accounting (tracemalloc and RSS) and memory ceiling checks.
+"""
+
+import gc
+import logging
+import os
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional, Any
+
+
+MB = 1024 * 1024
+
+# Seconds between RSS samples while a block is tracked
+DEFAULT_RSS_INTERVAL = 0.05
+
+
+def current_rss_bytes() -> Optional[int]:
+    """
+    Get the current resident set size of this process.
+
+    Returns:
+        RSS in bytes, or None if it cannot be determined on this platform
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def release_memory() -> None:
+    """Run a full garbage collection and return freed heap pages to the OS where supported."""
+    gc.collect()
+
+    if sys.platform.startswith("linux"):
+        try:
+            import ctypes
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+        except (OSError, AttributeError):
+            pass
+
+
+class RSSSampler:
+    """
+    Samples RSS on a background thread and keeps the maximum.
+
+    The process high-water mark (ru_maxrss) never goes down, so after the
+    first large file it says nothing about the files that follow; sampling
+    while a block runs gives the peak of that block alone.
+    """
+
+    def __init__(self, interval: float = DEFAULT_RSS_INTERVAL):
+        """
+        Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.peak: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        """Record the current RSS if it is the highest seen."""
+        rss = current_rss_bytes()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "RSSSampler":
+        self._sample()
+        if self.peak is not None:
+            self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+
+@dataclass
+class MemorySample:
+    """Memory figures recorded for one tracked block (one file)."""
+
+    peak_traced_mb: Optional[float] = None
+    rss_mb: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert memory sample to dictionary format."""
+        return {
+            "peak_traced_mb": self.peak_traced_mb,
+            "rss_mb": self.rss_mb,
+            "peak_rss_mb": self.peak_rss_mb
+        }
+
+
+class MemoryTracker:
+    """
+    Tracks peak Python allocations and RSS per processed file.
+
+    tracemalloc is only started when trace_allocations is enabled, since it
+    slows allocation-heavy code down noticeably; RSS figures are always
+    collected, the peak by sampling while the file is processed. A ceiling (in MB) can be checked after each file to decide
+    whether the worker should recycle itself.
+    """
+
+    def __init__(self, trace_allocations: bool = False, ceiling_mb: Optional[float] = None,
+                 rss_interval: float = DEFAULT_RSS_INTERVAL):
+        """
+        Initialize the memory tracker.
+
+        Args:
+            trace_allocations: Record the tracemalloc peak per tracked block
+            ceiling_mb: RSS ceiling in MB, or None for no ceiling
+            rss_interval: Seconds between RSS samples within a tracked block
+        """
+        self.logger = logging.getLogger(__name__)
+        self.trace_allocations = trace_allocations
+        self.ceiling_mb = ceiling_mb
+        self.rss_interval = rss_interval
+
+    @contextmanager
+    def track(self):
+        """
+        Track memory for the enclosed block.
+
+        Yields:
+            MemorySample that is filled in when the block exits
+        """
+        sample = MemorySample()
+        started_tracing = False
+
+        if self.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+
+        sampler = RSSSampler(self.rss_interval)
+        try:
+            with sampler:
+                yield sample
+        finally:
+            if self.trace_allocations and tracemalloc.is_tracing():
+                _, peak = tracemalloc.get_traced_memory()
+                sample.peak_traced_mb = round(peak / MB, 2)
+                if started_tracing:
+                    tracemalloc.stop()
+
+            rss = current_rss_bytes()
+            sample.rss_mb = round(rss / MB, 2) if rss is not None else None
+            sample.peak_rss_mb = round(sampler.peak / MB, 2) if sampler.peak is not None else None
+
+    def over_ceiling(self) -> bool:
+        """
+        Check whether the current RSS exceeds the configured ceiling.
+
+        Returns:
+            True if a ceiling is set and current RSS is above it
+        """
+        if not self.ceiling_mb:
+            return False
+
+        rss = current_rss_bytes()
+        if rss is None:
+            return False
+
+        exceeded = rss / MB > self.ceiling_mb
+        if exceeded:
+            self.logger.debug(f"RSS {rss / MB:.1f} MB exceeds memory ceiling of {self.ceiling_mb} MB")
+        return exceeded
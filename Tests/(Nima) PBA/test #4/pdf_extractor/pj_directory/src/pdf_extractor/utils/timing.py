@@ -0,0 +1,272 @@
+"""
+Stage-level timing spans and latency histograms.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Any, Callable, Iterable
+
+
+# Pipeline stages in execution order: "filter" drops incomplete transactions,
+# "validate" compares the result with ground truth
+STAGES = ("probe", "open", "extract", "detect", "match", "parse", "filter", "validate", "format")
+
+PERCENTILES = (50, 95, 99)
+
+# Latency values kept per series for percentiles; count, mean and max stay exact
+MAX_LATENCY_SAMPLES = 10000
+
+
+class StageTimer:
+    """
+    Records wall-clock spans per pipeline stage.
+
+    Repeated spans of the same stage accumulate, so e.g. "match" is the
+    total regex time across all patterns tried for a file. Per-page text
+    extraction is additionally kept as a list of page durations.
+    """
+
+    def __init__(self):
+        """Initialize an empty timer."""
+        self.stages: Dict[str, float] = {}
+        self.page_timings: List[float] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time the enclosed block as a span of the given stage.
+
+        Args:
+            name: Stage name (see STAGES)
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start_time)
+
+    def add(self, name: str, duration: float) -> None:
+        """
+        Add a duration to a stage.
+
+        Args:
+            name: Stage name
+            duration: Duration in seconds
+        """
+        self.stages[name] = self.stages.get(name, 0.0) + duration
+
+    def add_page(self, duration: float) -> None:
+        """
+        Record the extraction time of one page (also counted in "extract").
+
+        Args:
+            duration: Duration in seconds
+        """
+        self.page_timings.append(duration)
+        self.add("extract", duration)
+
+    @property
+    def total(self) -> float:
+        """Get the sum of all recorded stage spans."""
+        return sum(self.stages.values())
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Compute a percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Percentile value, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class LatencySample:
+    """
+    Running latency series with a bounded sample for percentiles.
+
+    Count, mean and max are exact. Percentiles come from a uniform
+    reservoir of at most max_samples values, so they are exact until the
+    series grows past that and memory stays constant afterwards.
+    """
+
+    def __init__(self, max_samples: int = MAX_LATENCY_SAMPLES):
+        """
+        Initialize an empty series.
+
+        Args:
+            max_samples: Reservoir size for percentile estimates
+        """
+        self.max_samples = max_samples
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: List[float] = []
+        self._random = random.Random(0)
+
+    def add(self, value: float) -> None:
+        """
+        Add one duration.
+
+        Args:
+            value: Duration in seconds
+        """
+        self.count += 1
+        self.total += value
+        self.max = value if self.count == 1 else max(self.max, value)
+
+        if len(self.samples) < self.max_samples:
+            self.samples.append(value)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self.max_samples:
+                self.samples[slot] = value
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add several durations."""
+        for value in values:
+            self.add(value)
+
+    def histogram(self) -> Dict[str, float]:
+        """
+        Summarize the series as count, mean, p50/p95/p99 and max.
+
+        Returns:
+            Dictionary of summary statistics (seconds)
+        """
+        summary = {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max
+        }
+        for pct in PERCENTILES:
+            summary[f"p{pct}"] = percentile(self.samples, pct)
+        return summary
+
+
+class StageTimingAggregator:
+    """
+    Folds per-result stage timings into latency histograms one result at a time.
+    """
+
+    def __init__(self, group_key: Optional[Callable[[Any], str]] = None,
+                 max_samples: int = MAX_LATENCY_SAMPLES):
+        """
+        Initialize the aggregator.
+
+        Args:
+            group_key: Optional function mapping a result to a group name
+                (e.g. its issuer) for per-group histograms
+            max_samples: Reservoir size of each latency series
+        """
+        self.group_key = group_key
+        self.max_samples = max_samples
+        self.samples: Dict[str, LatencySample] = {}
+        self.grouped: Dict[str, Dict[str, LatencySample]] = {}
+        self.pages = LatencySample(max_samples)
+        self.totals = LatencySample(max_samples)
+
+    def add(self, result: Any) -> None:
+        """
+        Add one result's stage and page timings.
+
+        Args:
+            result: Object with stage_timings and page_timings attributes
+                (ProcessingResult)
+        """
+        stage_timings = getattr(result, "stage_timings", None) or {}
+        if not stage_timings:
+            return
+
+        group = self.grouped.setdefault(self.group_key(result), {}) if self.group_key else None
+
+        for stage_name, duration in stage_timings.items():
+            self._series(self.samples, stage_name).add(duration)
+            if group is not None:
+                self._series(group, stage_name).add(duration)
+
+        self.pages.extend(getattr(result, "page_timings", None) or [])
+        self.totals.add(sum(stage_timings.values()))
+
+    def _series(self, series: Dict[str, LatencySample], name: str) -> LatencySample:
+        """Get a named series, creating it on first use."""
+        if name not in series:
+            series[name] = LatencySample(self.max_samples)
+        return series[name]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the histograms, in the format of summarize_stage_timings().
+
+        Returns:
+            Dictionary with "stages", "pages", "total" histograms and, when
+            group_key is given, the same stage histograms per group
+        """
+        def _ordered(stage_samples: Dict[str, LatencySample]) -> Dict[str, Dict[str, float]]:
+            names = [s for s in STAGES if s in stage_samples]
+            names += sorted(s for s in stage_samples if s not in STAGES)
+            return {name: stage_samples[name].histogram() for name in names}
+
+        summary = {
+            "stages": _ordered(self.samples),
+            "pages": self.pages.histogram(),
+            "total": self.totals.histogram()
+        }
+
+        if self.group_key:
+            summary["by_group"] = {name: _ordered(group) for name, group in sorted(self.grouped.items())}
+
+        return summary
+
+
+def summarize_stage_timings(results: Iterable[Any],
+                            group_key: Optional[Callable[[Any], str]] = None) -> Dict[str, Any]:
+    """
+    Aggregate per-result stage timings into latency histograms.
+
+    Args:
+        results: Objects with stage_timings and page_timings attributes
+            (ProcessingResult)
+        group_key: Optional function mapping a result to a group name
+            (e.g. its issuer) for per-group histograms
+
+    Returns:
+        Dictionary with "stages", "pages", "total" histograms and, when
+        group_key is given, the same stage histograms per group
+    """
+    aggregator = StageTimingAggregator(group_key)
+    for result in results:
+        aggregator.add(result)
+    return aggregator.summary()
+
+
+def format_stage_histograms(stage_summary: Dict[str, Dict[str, float]], indent: str = "  ") -> List[str]:
+    """
+    Format stage histograms as report lines (milliseconds).
+
+    Args:
+        stage_summary: Mapping of stage name to LatencySample.histogram()
+        indent: Prefix for each line
+
+    Returns:
+        List of formatted lines
+    """
+    lines = [f"{indent}{'stage':<10} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+    for name, stats in stage_summary.items():
+        lines.append(
+            f"{indent}{name:<10} {stats['count']:>5} {stats['p50'] * 1000:>9.1f} "
+            f"{stats['p95'] * 1000:>9.1f} {stats['p99'] * 1000:>9.1f} {stats['max'] * 1000:>9.1f}"
+        )
+    return lines
@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the PDF extractor tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
+
+from pdf_extractor.benchmarks.synthetic import CorpusSpec, generate_corpus
+
+
+@pytest.fixture(scope="session")
+def corpus_dir(tmp_path_factory):
+    """Directory of four synthetic statement PDFs with ground_truth.json."""
+    corpus = tmp_path_factory.mktemp("corpus")
+    generate_corpus(str(corpus), CorpusSpec(files=4, write_text=False))
+    return corpus
@@ -0,0 +1,89 @@
+"""
+Tests for streaming batch output from the CLI.
+"""
+
+import csv
+import gzip
+import json
+
+import pytest
+
+from pdf_extractor.cli.handlers import CommandHandler
+
+
+@pytest.mark.parametrize("output_format", ["jsonl", "csv"])
+def test_stream_batch_renames_part_file(corpus_dir, tmp_path, output_format):
+    """Streamed output is written to <output>.part and renamed into place when the batch ends."""
+    output_file = tmp_path / f"results.{output_format}"
+    part_file = tmp_path / f"results.{output_format}.part"
+    seen = []
+
+    handler = CommandHandler()
+    write_file = handler._write_file
+
+    def checking_write_file(writer, file_name, file_result, aggregator):
+        seen.append((part_file.exists(), output_file.exists()))
+        write_file(writer, file_name, file_result, aggregator)
+
+    handler._write_file = checking_write_file
+    exit_code = handler.handle_batch(str(corpus_dir), output_format=output_format,
+                                     output_file=str(output_file))
+
+    assert exit_code == 0
+    assert seen == [(True, False)] * 4
+    assert output_file.exists()
+    assert not part_file.exists()
+
+
+def test_stream_batch_jsonl_records(corpus_dir, tmp_path):
+    """JSON Lines output has one record per transaction and a closing summary."""
+    output_file = tmp_path / "results.jsonl"
+
+    assert CommandHandler().handle_batch(str(corpus_dir), output_format="jsonl",
+                                         output_file=str(output_file)) == 0
+
+    records = [json.loads(line) for line in output_file.read_text(encoding="utf-8").splitlines()]
+    summary = records[-1]
+    assert summary["type"] == "summary"
+    assert summary["total_files"] == 4
+    assert len(records) - 1 == summary["total_transactions"]
+    assert {record["type"] for record in records[:-1]} == {"transaction"}
+
+
+def test_stream_batch_gzip_csv(corpus_dir, tmp_path):
+    """A .gz output path is gzipped and keeps one CSV row per transaction."""
+    output_file = tmp_path / "results.csv.gz"
+
+    assert CommandHandler().handle_batch(str(corpus_dir), output_format="csv",
+                                         output_file=str(output_file)) == 0
+
+    with gzip.open(output_file, "rt", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:4] == ["File", "Date", "Description", "Amount"]
+    assert len({row[0] for row in rows[1:]}) == 4
+    assert not (tmp_path / "results.csv.gz.part").exists()
+
+
+def test_json_batch_renames_part_file(corpus_dir, tmp_path):
+    """JSON output is a single document published through the same .part file."""
+    output_file = tmp_path / "results.json"
+
+    assert CommandHandler().handle_batch(str(corpus_dir), output_format="json",
+                                         output_file=str(output_file)) == 0
+
+    results = json.loads(output_file.read_text(encoding="utf-8"))
+    assert results["summary"]["total_files"] == 4
+    assert not (tmp_path / "results.json.part").exists()
+
+
+def test_existing_part_file_is_not_overwritten(corpus_dir, tmp_path):
+    """A batch refuses to write while another run's .part file exists."""
+    output_file = tmp_path / "results.jsonl"
+    part_file = tmp_path / "results.jsonl.part"
+    part_file.write_text("in progress", encoding="utf-8")
+
+    assert CommandHandler().handle_batch(str(corpus_dir), output_format="jsonl",
+                                         output_file=str(output_file)) == 1
+
+    assert part_file.read_text(encoding="utf-8") == "in progress"
+    assert not output_file.exists()
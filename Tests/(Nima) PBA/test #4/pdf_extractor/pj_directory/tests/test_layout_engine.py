@@ -0,0 +1,60 @@
+"""
+Tests for character-to-line grouping in the layout engine.
+"""
+
+import random
+
+import pytest
+
+from pdf_extractor.extraction.layout_engine import (
+    HAS_NUMPY, VECTORIZE_MIN_CHARS, group_chars_into_lines, _group_chars_numpy, _group_chars_python
+)
+
+pytestmark = pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed")
+
+
+def random_chars(rng, count):
+    """Characters on a handful of drifting rows, with repeated tops and x0s to exercise tie ordering."""
+    chars = []
+    for _ in range(count):
+        row = rng.randrange(12)
+        top = round(700 - row * 14 + rng.choice([0, 0, 0.5, 1.5, 2.9, 3.1, 4.0]), 1)
+        x0 = round(rng.uniform(20, 560), rng.choice([0, 1]))
+        chars.append({
+            'text': rng.choice("ABCDEF0123456789 $.,-"),
+            'top': top,
+            'bottom': top + rng.choice([8.0, 9.5, 10.0]),
+            'x0': x0,
+            'x1': x0 + rng.choice([4.0, 5.5, 6.0])
+        })
+    return chars
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("y_tolerance", [0, 1, 3, 5])
+def test_numpy_grouping_matches_python(seed, y_tolerance):
+    """The vectorized grouping returns exactly what the pure-Python grouping returns."""
+    rng = random.Random(seed)
+    chars = random_chars(rng, rng.randrange(1, 400))
+
+    assert _group_chars_numpy(chars, y_tolerance) == _group_chars_python(chars, y_tolerance)
+
+
+def test_group_chars_into_lines_paths_agree():
+    """Both paths of the public function agree above the vectorization threshold."""
+    chars = random_chars(random.Random(7), VECTORIZE_MIN_CHARS * 4)
+
+    assert group_chars_into_lines(chars, 3) == group_chars_into_lines(chars, 3, use_numpy=False)
+
+
+def test_lines_chain_through_small_drifts():
+    """A line continues while each character is within tolerance of the previous one."""
+    chars = [
+        {'text': c, 'top': top, 'bottom': top + 10, 'x0': x0, 'x1': x0 + 5}
+        for c, top, x0 in [("A", 100, 10), ("B", 98, 20), ("C", 96, 30), ("D", 80, 10)]
+    ]
+
+    for lines in (_group_chars_numpy(chars, 2), _group_chars_python(chars, 2)):
+        assert [line['text'] for line in lines] == ["ABC", "D"]
+        assert lines[0]['top'] == 96
+        assert lines[0]['char_count'] == 3
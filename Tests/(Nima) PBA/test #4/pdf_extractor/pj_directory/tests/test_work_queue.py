@@ -0,0 +1,126 @@
+"""
+Tests for the shared-filesystem work queue.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from pdf_extractor.core.processor import PDFProcessor
+from pdf_extractor.core.work_queue import WorkQueue, QueueWorker
+
+MAIN = Path(__file__).resolve().parent.parent / "main.py"
+
+
+def pdf_files(directory):
+    """Sorted PDF paths of a directory."""
+    return sorted(str(path) for path in Path(directory).glob("*.pdf"))
+
+
+def test_enqueue_skips_known_files(corpus_dir, tmp_path):
+    """Enqueueing the same files again adds only the new ones."""
+    queue = WorkQueue(str(tmp_path / "queue"))
+    files = pdf_files(corpus_dir)
+
+    assert queue.enqueue(files[:3]) == 3
+    assert queue.enqueue(files) == 1
+    assert queue.status() == {"pending": 4, "leased": 0, "done": 0, "failed": 0}
+
+
+def test_two_worker_processes_drain_queue(corpus_dir, tmp_path):
+    """Two worker processes share the queue and every file is processed exactly once."""
+    queue_dir = tmp_path / "queue"
+    queue = WorkQueue(str(queue_dir))
+    queue.enqueue(pdf_files(corpus_dir))
+
+    workers = [
+        subprocess.Popen([sys.executable, str(MAIN), "worker", "--queue", str(queue_dir),
+                          "--worker-id", f"worker-{i}"],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for i in range(2)
+    ]
+    assert [worker.wait(timeout=120) for worker in workers] == [0, 0]
+
+    assert queue.status() == {"pending": 0, "leased": 0, "done": 4, "failed": 0}
+    recorded = sum(1 for shard in (queue_dir / "results").glob("*.jsonl")
+                   for _ in shard.open(encoding="utf-8"))
+    assert recorded == 4
+
+    results = dict(queue.iter_results())
+    assert sorted(results) == [Path(path).name for path in pdf_files(corpus_dir)]
+    assert all(result["overall_success"] for result in results.values())
+
+
+def test_expired_lease_is_reclaimed(corpus_dir, tmp_path):
+    """A lease whose worker stopped heartbeating goes back to pending and is processed by another worker."""
+    queue = WorkQueue(str(tmp_path / "queue"), lease_timeout=1.0)
+    queue.enqueue(pdf_files(corpus_dir)[:1])
+
+    lease = queue.claim("crashed-worker")
+    assert lease is not None
+    assert queue.reclaim_expired() == 0
+
+    stale = time.time() - 10
+    os.utime(lease.lease_path, (stale, stale))
+    assert queue.reclaim_expired() == 1
+    assert queue.status() == {"pending": 1, "leased": 0, "done": 0, "failed": 0}
+    assert not queue.heartbeat(lease)
+
+    retry = queue.claim("other-worker")
+    assert retry.attempt == 1
+    queue.release(retry)
+
+    assert QueueWorker(queue, PDFProcessor(), "other-worker").run() == 1
+    assert queue.status()["done"] == 1
+    assert [result["overall_success"] for _, result in queue.iter_results()] == [True]
+
+
+def test_expired_lease_fails_after_max_attempts(corpus_dir, tmp_path):
+    """A task whose lease keeps expiring is set aside as failed."""
+    queue = WorkQueue(str(tmp_path / "queue"), lease_timeout=1.0, max_attempts=2)
+    queue.enqueue(pdf_files(corpus_dir)[:1])
+
+    stale = time.time() - 10
+    for _ in range(2):
+        lease = queue.claim("crashed-worker")
+        os.utime(lease.lease_path, (stale, stale))
+        assert queue.reclaim_expired() == 1
+
+    assert queue.status() == {"pending": 0, "leased": 0, "done": 0, "failed": 1}
+
+
+def test_failed_task_is_requeued_then_merged_with_its_success(corpus_dir, tmp_path):
+    """A failed attempt requeues the task, and the merge prefers its later successful result."""
+    statement = tmp_path / "statement.pdf"
+    statement.write_bytes(b"not a pdf")
+    queue = WorkQueue(str(tmp_path / "queue"))
+    queue.enqueue([str(statement)])
+    worker = QueueWorker(queue, PDFProcessor(), "worker")
+
+    assert worker.run(max_tasks=1) == 1
+    assert queue.status() == {"pending": 1, "leased": 0, "done": 0, "failed": 0}
+    [(_, result)] = queue.iter_results()
+    assert not result["overall_success"]
+
+    shutil.copyfile(pdf_files(corpus_dir)[0], statement)
+    assert worker.run() == 1
+    assert queue.status() == {"pending": 0, "leased": 0, "done": 1, "failed": 0}
+    [(file_name, result)] = queue.iter_results()
+    assert file_name == "statement.pdf"
+    assert result["overall_success"]
+
+
+def test_failing_task_is_set_aside_after_max_attempts(tmp_path):
+    """A file that fails every attempt ends in failed/ with its last failure merged."""
+    statement = tmp_path / "statement.pdf"
+    statement.write_bytes(b"not a pdf")
+    queue = WorkQueue(str(tmp_path / "queue"), max_attempts=2)
+    queue.enqueue([str(statement)])
+
+    assert QueueWorker(queue, PDFProcessor(), "worker").run() == 2
+    assert queue.status() == {"pending": 0, "leased": 0, "done": 0, "failed": 1}
+    [(_, result)] = queue.iter_results()
+    assert not result["overall_success"]